@@ -0,0 +1,56 @@
+"""
+Import time of pyddd packages, measured in a fresh interpreter for every run.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import.py [--repeat 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "pyddd.domain.abstractions",
+    "pyddd.domain",
+    "pyddd.domain.message",
+    "pyddd.application",
+    "pyddd.infrastructure.persistence.event_store",
+    "pyddd.infrastructure.transport.sync",
+    "pyddd.infrastructure.transport.asyncio",
+)
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(module: str, repeat: int) -> list[float]:
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", SCRIPT.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(float(output))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'module':<50}{'median ms':>12}{'min ms':>10}")
+    for module in MODULES:
+        results = measure(module, args.repeat)
+        print(f"{module:<50}{statistics.median(results) * 1000:>12.1f}{min(results) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Per-object memory and construction time of hot transport and message objects.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_objects.py [--count 100000]
+"""
+
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+from pyddd.domain.abstractions import MessageType
+from pyddd.domain.event_sourcing import Snapshot
+from pyddd.domain.message import Message
+from pyddd.infrastructure.transport.asyncio.domain.notification import (
+    PublishedMessage as AsyncPublishedMessage,
+)
+from pyddd.infrastructure.transport.core.event_factory import UniversalPublishingMessage
+from pyddd.infrastructure.transport.core.tracker import Tracker
+from pyddd.infrastructure.transport.sync.domain.notification import (
+    PublishedMessage as SyncPublishedMessage,
+)
+
+PAYLOAD = {"reference": "123", "amount": 10}
+
+FACTORIES: dict[str, t.Callable[[], object]] = {
+    "Message": lambda: Message("bench.Event", MessageType.EVENT, PAYLOAD, message_id="1"),
+    "PublishedMessage (sync)": lambda: SyncPublishedMessage("1", "bench:Event", PAYLOAD),
+    "PublishedMessage (asyncio)": lambda: AsyncPublishedMessage("1", "bench:Event", PAYLOAD),
+    "UniversalPublishingMessage": lambda: UniversalPublishingMessage("bench.Event", PAYLOAD, message_id="1"),
+    "Snapshot": lambda: Snapshot(b"{}", "1", 1),
+    "Tracker": lambda: Tracker("bench"),
+}
+
+
+def measure_memory(factory: t.Callable[[], object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_overhead = sys.getsizeof(objects)
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def measure_time(factory: t.Callable[[], object], count: int) -> float:
+    return min(timeit.repeat(factory, number=count, repeat=5)) / count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'object':<30}{'bytes/object':>15}{'ns/object':>12}{'__dict__':>10}")
+    for name, factory in FACTORIES.items():
+        memory = measure_memory(factory, args.count)
+        duration = measure_time(factory, args.count)
+        has_dict = hasattr(factory(), "__dict__")
+        print(f"{name:<30}{memory:>15.1f}{duration * 1e9:>12.1f}{str(has_dict):>10}")
+
+
+if __name__ == "__main__":
+    main()
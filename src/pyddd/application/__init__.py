@@ -9,6 +9,11 @@ from .executor import (
     SyncExecutor,
     AsyncExecutor,
 )
+from .process import ProcessExecutor
+from .dependency import (
+    Provider,
+    Scope,
+)
 from .condition import (
     And,
     HasAttrs,
@@ -16,12 +21,16 @@ from .condition import (
     Not,
     Equal,
 )
-from .abstractions import IRetryStrategy, IApplication, ICondition
+from .abstractions import IRetryStrategy, IApplication, ICondition, IMiddleware
+from .middleware import HandlerContext
 
 __all__ = [
     "Module",
     "SyncExecutor",
     "AsyncExecutor",
+    "ProcessExecutor",
+    "Provider",
+    "Scope",
     "And",
     "HasAttrs",
     "Or",
@@ -34,4 +43,6 @@ __all__ = [
     "get_running_application",
     "ICondition",
     "IApplication",
+    "IMiddleware",
+    "HandlerContext",
 ]
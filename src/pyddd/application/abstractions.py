@@ -6,6 +6,9 @@ from enum import Enum
 from pyddd.domain.command import DomainCommand
 from pyddd.domain.abstractions import IMessage
 
+if t.TYPE_CHECKING:
+    from pyddd.application.middleware import HandlerContext
+
 R = t.TypeVar("R")
 AnyCallable = t.Callable[..., R]
 
@@ -30,6 +33,18 @@ class IExecutor(abc.ABC):
     @abc.abstractmethod
     def process_handlers(self, handlers: list[AnyCallable], **kwargs): ...
 
+    def process_many(self, handlers: list[list[AnyCallable]], **kwargs):
+        """
+        Process groups of handlers at once.
+        Returns list of results for every group, exceptions are returned instead of raised.
+        """
+        return [list(self.process_handlers(group, **kwargs)) for group in handlers]
+
+    def shutdown(self, wait: bool = True):
+        """
+        Releases workers of executor, called on application stop.
+        """
+
 
 class ICondition(abc.ABC):
     @abc.abstractmethod
@@ -45,6 +60,19 @@ class IRetryStrategy(abc.ABC):
     def __call__(self, func: AnyCallable) -> AnyCallable: ...
 
 
+class IMiddleware(abc.ABC):
+    """
+    Wraps calls of handlers. Sync handlers are called through `handle`, async ones through `handle_async`,
+    both pass the call to the next middleware or handler by default.
+    """
+
+    def handle(self, call_next: AnyCallable, context: HandlerContext, **kwargs):
+        return call_next(context, **kwargs)
+
+    async def handle_async(self, call_next: AnyCallable, context: HandlerContext, **kwargs):
+        return await call_next(context, **kwargs)
+
+
 class ISubscribe(abc.ABC):
     @abc.abstractmethod
     def subscribe(
@@ -70,12 +98,40 @@ class IModule(abc.ABC):
     @abc.abstractmethod
     def set_defaults(self, defaults: dict): ...
 
+    def get_defaults(self) -> t.Mapping[str, t.Any]:
+        """
+        Defaults of module handlers, used by application to clean up dependency providers on stop.
+        """
+        return {}
+
     @abc.abstractmethod
     def get_command_handler(self, command: IMessage) -> AnyCallable: ...
 
     @abc.abstractmethod
     def get_event_handlers(self, event: IMessage) -> t.Sequence[AnyCallable]: ...
 
+    def get_subscriptions(self) -> t.Optional[t.Collection[str]]:
+        """
+        Topics of events the module has handlers for, used by application to route events.
+        None means the module is asked for handlers of every event.
+        """
+        return None
+
+    def set_subscriptions_listener(self, listener: t.Callable[[], None]):
+        """
+        Listener called when module subscribes to a new topic, used by application to rebuild routes.
+        """
+
+    def set_middlewares(self, middlewares: t.Sequence[IMiddleware]):
+        """
+        Middlewares of application wrapping module handlers outside of module own middlewares.
+        """
+
+    def shutdown(self):
+        """
+        Releases resources of module handlers, called on application stop.
+        """
+
 
 class IApplication(abc.ABC):
     @abc.abstractmethod
@@ -87,6 +143,9 @@ class IApplication(abc.ABC):
     @abc.abstractmethod
     def handle(self, message: IMessage, **depends): ...
 
+    @abc.abstractmethod
+    def handle_many(self, messages: t.Sequence[IMessage], **depends): ...
+
     @abc.abstractmethod
     def run(self): ...
 
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import functools
 import inspect
@@ -5,12 +6,18 @@ import logging
 import typing as t
 import warnings
 from collections import defaultdict
+from itertools import chain
 from contextlib import suppress
 from typing import (
     AsyncContextManager,
     ContextManager,
 )
 
+from pyddd.application.dependency import (
+    DependencyScope,
+    Provider,
+    batch_scope,
+)
 from pyddd.application.executor import (
     SyncExecutor,
     AsyncExecutor,
@@ -18,6 +25,7 @@ from pyddd.application.executor import (
 from pyddd.application.abstractions import (
     IExecutor,
     IApplication,
+    IMiddleware,
     ApplicationSignal,
     SignalListener,
     IModule,
@@ -39,9 +47,12 @@ class Application(IApplication):
         executor: IExecutor = None,
     ):
         self._modules: dict[str, IModule] = {}
+        self._routes: dict[str, list[IModule]] = {}
+        self._any_event_modules: list[IModule] = []
         self._defaults: dict[str, dict] = defaultdict(dict)
         self._logger = logging.getLogger(logger_name)
         self._executor = executor
+        self._middlewares: list[IMiddleware] = []
         self._is_running = False
         self._is_stopped = False
         self._lifespan_context = _build_lifespan(lifespan)(self)
@@ -58,7 +69,20 @@ class Application(IApplication):
             raise ValueError("Already registered domain 'test'")
 
         module.set_defaults(self._defaults[module.domain])
+        if self._middlewares:
+            module.set_middlewares(self._middlewares)
         self._modules[module.domain] = module
+        module.set_subscriptions_listener(self._build_routes)
+        self._build_routes()
+
+    def add_middleware(self, middleware: IMiddleware):
+        """
+        Wraps calls of handlers of all modules outside of module middlewares.
+        Middlewares are called in order of adding.
+        """
+        self._middlewares.append(middleware)
+        for module in self._modules.values():
+            module.set_middlewares(self._middlewares)
 
     async def run_async(self):
         if self._is_stopped:
@@ -70,6 +94,7 @@ class Application(IApplication):
         self._lifespan = _wrap_async_ctx_manager(self._lifespan_context)
 
         await self._signal_manager.notify_async(ApplicationSignal.BEFORE_RUN, self)
+        self._build_routes()
         await anext(self._lifespan)
         self._is_running = True
 
@@ -86,6 +111,9 @@ class Application(IApplication):
         self._is_running = False
         with suppress(StopAsyncIteration):
             await anext(self._lifespan)
+        for provider in self._get_providers():
+            await provider.aclose()
+        self._shutdown()
         self._is_stopped = True
 
         await self._signal_manager.notify_async(ApplicationSignal.AFTER_STOP, self)
@@ -100,6 +128,7 @@ class Application(IApplication):
         self._lifespan = _wrap_sync_ctx_manager(self._lifespan_context)
 
         self._signal_manager.notify(ApplicationSignal.BEFORE_RUN, self)
+        self._build_routes()
 
         self._is_running = True
         next(self._lifespan)
@@ -119,10 +148,23 @@ class Application(IApplication):
         with suppress(StopIteration):
             next(self._lifespan)
 
+        for provider in self._get_providers():
+            provider.close()
+        self._shutdown()
+
         self._is_stopped = True
 
         self._signal_manager.notify(ApplicationSignal.AFTER_STOP, self)
 
+    def _shutdown(self):
+        """
+        Abandoned calls of timed out handlers are not waited for.
+        """
+        for module in self._modules.values():
+            module.shutdown()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
     def subscribe(self, signal: ApplicationSignal, listener: SignalListener):
         self._signal_manager.subscribe(signal, listener)
 
@@ -148,6 +190,81 @@ class Application(IApplication):
             return self._handle_event(event=message, **depends)
         raise RuntimeError(f"Only support command end event message handling. Got {message.__type__}")
 
+    def handle_many(self, messages: t.Sequence[IMessage], **depends):
+        """
+        Handle batch of messages by one executor call.
+        Handlers are looked up once per topic and run together.
+        Returns list of handler results for every message in order,
+        handler exceptions are returned instead of raised, so each message could be acked separately.
+        Errors of resolving handlers of a message, e.g. unknown command, are returned as its result too.
+        Dependencies of batch scoped providers are shared by all handlers and cleaned up after the batch.
+        """
+        if not self._is_running:
+            raise RuntimeError("Can not handle messages. App is not running!")
+        modules_by_topic: dict[str, t.Sequence[IModule]] = {}
+        handlers: list[list[AnyCallable]] = []
+        errors: dict[int, Exception] = {}
+        scope = DependencyScope()
+        try:
+            with batch_scope(scope):
+                for index, message in enumerate(messages):
+                    if not isinstance(message, IMessage):
+                        raise RuntimeError(f"Unexpected message type {message}")
+                    try:
+                        handlers.append(self._resolve_handlers(message, modules_by_topic))
+                    except Exception as exc:
+                        self._logger.warning(f"Can not resolve handlers of message {message}", exc_info=exc)
+                        errors[index] = exc
+                        handlers.append([])
+            result = self._executor.process_many(handlers, **depends)  # type: ignore[union-attr]
+        except BaseException:
+            scope.close()
+            raise
+        if inspect.isawaitable(result):
+            return asyncio.ensure_future(self._close_after(result, scope, errors))
+        scope.close()
+        return self._set_errors(result, errors)
+
+    def _resolve_handlers(
+        self, message: IMessage, modules_by_topic: dict[str, t.Sequence[IModule]]
+    ) -> list[AnyCallable]:
+        modules = modules_by_topic.get(message.__topic__)
+        if modules is None:
+            modules = modules_by_topic[message.__topic__] = self._get_modules(message)
+        if message.__type__ == MessageType.COMMAND:
+            return [modules[0].get_command_handler(message)]
+        return [handler for module in modules for handler in module.get_event_handlers(message)]
+
+    @classmethod
+    async def _close_after(cls, result: t.Awaitable, scope: DependencyScope, errors: dict[int, Exception]):
+        async with scope:
+            return cls._set_errors(await result, errors)
+
+    @staticmethod
+    def _set_errors(results: list[list], errors: dict[int, Exception]) -> list[list]:
+        """
+        Errors of resolving handlers are returned as the only result of their messages.
+        """
+        for index, exc in errors.items():
+            results[index] = [exc]
+        return results
+
+    def _get_providers(self) -> list[Provider]:
+        """
+        Providers set by application and by included modules, every provider once.
+        """
+        defaults = chain(self._defaults.values(), (module.get_defaults() for module in self._modules.values()))
+        return list(
+            dict.fromkeys(value for values in defaults for value in values.values() if isinstance(value, Provider))
+        )
+
+    def _get_modules(self, message: IMessage) -> t.Sequence[IModule]:
+        if message.__type__ == MessageType.COMMAND:
+            return (self._get_module_by_domain(message.__domain__),)
+        elif message.__type__ == MessageType.EVENT:
+            return self._routes.get(message.__topic__, self._any_event_modules)
+        raise RuntimeError(f"Only support command end event message handling. Got {message.__type__}")
+
     def _handle_command(self, command: IMessage, **depends):
         module = self._get_module_by_domain(command.__domain__)
         handler = module.get_command_handler(command)
@@ -155,10 +272,29 @@ class Application(IApplication):
 
     def _handle_event(self, event: IMessage, **depends):
         handlers: list[AnyCallable] = []
-        for module in self._modules.values():
+        for module in self._routes.get(event.__topic__, self._any_event_modules):
             handlers.extend(module.get_event_handlers(event))
         return self._executor.process_handlers(handlers, **depends)  # type: ignore[union-attr]
 
+    def _build_routes(self):
+        """
+        Index modules by topics of events they subscribed to.
+        Subscriptions are read on run, on include and whenever a module subscribes to a new topic,
+        modules are kept in order of including.
+        """
+        routes: dict[str, list[IModule]] = {}
+        any_event_modules: list[IModule] = []
+        for module in self._modules.values():
+            topics = module.get_subscriptions()
+            if topics is None:
+                any_event_modules.append(module)
+                for modules in routes.values():
+                    modules.append(module)
+                continue
+            for topic in topics:
+                routes.setdefault(topic, list(any_event_modules)).append(module)
+        self._routes, self._any_event_modules = routes, any_event_modules
+
     def _get_module_by_domain(self, domain: str) -> IModule:
         if module := self._modules.get(domain):
             return module
@@ -0,0 +1,98 @@
+import asyncio
+import dataclasses
+import functools
+import inspect
+import threading
+import typing as t
+import weakref
+
+from pyddd.application.abstractions import AnyCallable
+
+
+def limit_concurrency(func: AnyCallable, limits: t.Sequence["ConcurrencyLimit"]) -> AnyCallable:
+    """
+    Wraps func by limits, which are acquired in given order.
+    """
+    for limit in reversed(limits):
+        func = limit(func)
+    return func
+
+
+@dataclasses.dataclass(frozen=True)
+class ConcurrencyMetrics:
+    limit: int
+    active: int
+    waiting: int
+
+
+class ConcurrencyLimit:
+    """
+    Bulkhead limiting number of concurrent calls of wrapped handlers.
+
+    Async handlers wait on asyncio semaphore of the running loop, sync handlers wait on thread semaphore.
+    Number of running and waiting calls is available through `metrics`.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be positive, got {limit}")
+        self._limit = limit
+        self._active = 0
+        self._waiting = 0
+        self._async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_semaphore = threading.Semaphore(limit)
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> ConcurrencyMetrics:
+        return ConcurrencyMetrics(limit=self._limit, active=self._active, waiting=self._waiting)
+
+    def __call__(self, func: AnyCallable) -> AnyCallable:
+        if inspect.iscoroutinefunction(func):
+            return self._wrap_async(func)
+        return self._wrap_sync(func)
+
+    def _wrap_async(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            semaphore = self._get_async_semaphore()
+            self._waiting += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                self._waiting -= 1
+            self._active += 1
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self._active -= 1
+                semaphore.release()
+
+        return wrapper
+
+    def _get_async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self._limit)
+        return semaphore
+
+    def _wrap_sync(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self._lock:
+                self._waiting += 1
+            self._sync_semaphore.acquire()
+            with self._lock:
+                self._waiting -= 1
+                self._active += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                self._sync_semaphore.release()
+
+        return wrapper
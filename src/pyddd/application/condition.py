@@ -17,7 +17,7 @@ class HasAttrs(ICondition):
         self._attrs = set(attrs)
 
     def check(self, event: IMessage) -> bool:
-        return self._attrs.issubset(set(event.to_dict().keys()))
+        return self._attrs.issubset(event.to_dict().keys())
 
 
 class And(ICondition):
@@ -105,4 +105,5 @@ class Equal(ICondition):
         self._attrs = attrs
 
     def check(self, event: IMessage) -> bool:
-        return all((key in event.to_dict() and event.to_dict()[key] == value for key, value in self._attrs.items()))
+        payload = event.to_dict()
+        return all((key in payload and payload[key] == value for key, value in self._attrs.items()))
@@ -0,0 +1,268 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import typing as t
+from contextlib import (
+    AsyncExitStack,
+    ExitStack,
+    asynccontextmanager,
+    contextmanager,
+)
+from enum import Enum
+
+from pyddd.application.abstractions import AnyCallable
+
+_T = t.TypeVar("_T")
+
+_empty: t.Any = object()
+
+
+class Scope(str, Enum):
+    APP = "app"
+    SINGLETON = "app"
+    MESSAGE = "message"
+    BATCH = "batch"
+
+
+class Provider(t.Generic[_T]):
+    """
+    Lazily created dependency which could be passed to `set_defaults` instead of ready-made object.
+
+    Factory could be sync or async function or generator. Generators yield the dependency
+    and are resumed to clean it up, e.g. close DB session, when its scope ends.
+    With `Scope.APP` the dependency is created once and cleaned up on application stop,
+    with `Scope.MESSAGE` it is created for every handler call and cleaned up after it,
+    with `Scope.BATCH` it is shared by handlers of one `Application.handle_many` call
+    and cleaned up after the batch, outside of batches it works as `Scope.MESSAGE`.
+    Async factories could be used only by async handlers.
+    """
+
+    def __init__(self, factory: t.Callable[..., t.Any], scope: Scope = Scope.APP):
+        self._factory = factory
+        self._scope = Scope(scope)
+        self._is_async = inspect.iscoroutinefunction(factory) or inspect.isasyncgenfunction(factory)
+        self._app_scope = DependencyScope()
+
+    @property
+    def scope(self) -> Scope:
+        return self._scope
+
+    @property
+    def is_async(self) -> bool:
+        return self._is_async
+
+    def create(self, stack: ExitStack) -> _T:
+        if self._is_async:
+            raise TypeError(f"Async provider {self!r} could be used only by async handlers")
+        if inspect.isgeneratorfunction(self._factory):
+            return stack.enter_context(contextmanager(self._factory)())
+        return self._factory()
+
+    async def acreate(self, stack: AsyncExitStack) -> _T:
+        if inspect.isasyncgenfunction(self._factory):
+            return await stack.enter_async_context(asynccontextmanager(self._factory)())
+        if inspect.isgeneratorfunction(self._factory):
+            return stack.enter_context(contextmanager(self._factory)())
+        value = self._factory()
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    def close(self):
+        """
+        Cleans up dependency of `Scope.APP`, so it is created again on next use.
+        """
+        scope, self._app_scope = self._app_scope, DependencyScope()
+        scope.close()
+
+    async def aclose(self):
+        scope, self._app_scope = self._app_scope, DependencyScope()
+        await scope.aclose()
+
+    def _get_scope(self, message_scope: "DependencyScope", batch_scope: t.Optional["DependencyScope"]):
+        if self._scope is Scope.APP:
+            return self._app_scope
+        if self._scope is Scope.BATCH and batch_scope is not None:
+            return batch_scope
+        return message_scope
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._factory!r}, scope={self._scope.value})"
+
+
+class DependencyScope:
+    """
+    Dependencies created by providers for one scope and cleaned up together when the scope is closed.
+    Every provider creates dependency at most once per scope, also when requested concurrently.
+    Message scopes also keep dependencies injected into the handler by name in `dependencies`.
+    """
+
+    def __init__(self):
+        self._values: dict[Provider, t.Any] = {}
+        self._tasks: dict[Provider, asyncio.Future] = {}
+        self.dependencies: dict[str, t.Any] = {}
+        self._lock = threading.Lock()
+        self._stack = ExitStack()
+        self._async_stack = AsyncExitStack()
+
+    def get(self, provider: Provider):
+        value = self._values.get(provider, _empty)
+        if value is not _empty:
+            return value
+        with self._lock:
+            if provider not in self._values:
+                self._values[provider] = provider.create(self._stack)
+            return self._values[provider]
+
+    async def aget(self, provider: Provider):
+        value = self._values.get(provider, _empty)
+        if value is not _empty:
+            return value
+        task = self._tasks.get(provider)
+        if task is None:
+            task = self._tasks[provider] = asyncio.ensure_future(provider.acreate(self._async_stack))
+        try:
+            value = await asyncio.shield(task)
+        except Exception:
+            self._tasks.pop(provider, None)
+            raise
+        self._values[provider] = value
+        return value
+
+    def close(self):
+        self._stack.close()
+
+    async def aclose(self):
+        await self._async_stack.aclose()
+        self._stack.close()
+
+    def __enter__(self) -> "DependencyScope":
+        return self
+
+    def __exit__(self, *exc_info) -> t.Optional[bool]:
+        return self._stack.__exit__(*exc_info)
+
+    async def __aenter__(self) -> "DependencyScope":
+        return self
+
+    async def __aexit__(self, *exc_info) -> t.Optional[bool]:
+        try:
+            return await self._async_stack.__aexit__(*exc_info)
+        finally:
+            self._stack.close()
+
+
+_batch_scope: contextvars.ContextVar[t.Optional[DependencyScope]] = contextvars.ContextVar(
+    "pyddd_batch_scope", default=None
+)
+_message_scope: contextvars.ContextVar[t.Optional[DependencyScope]] = contextvars.ContextVar(
+    "pyddd_message_scope", default=None
+)
+
+
+def get_batch_scope() -> t.Optional[DependencyScope]:
+    return _batch_scope.get()
+
+
+def get_message_scope() -> t.Optional[DependencyScope]:
+    """
+    Scope of the running handler call, e.g. used by retry strategies to refresh injected dependencies.
+    """
+    return _message_scope.get()
+
+
+@contextmanager
+def batch_scope(scope: DependencyScope):
+    """
+    Handlers resolved inside share dependencies of `Scope.BATCH` providers created in given scope.
+    """
+    token = _batch_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _batch_scope.reset(token)
+
+
+def open_scope(func: AnyCallable) -> AnyCallable:
+    """
+    Wraps func to run it in a new message scope, which is shared by every retry attempt of the call
+    and is cleaned up after the call. Does nothing when called inside of another message scope.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _message_scope.get() is not None:
+                return await func(*args, **kwargs)
+            async with DependencyScope() as scope:
+                token = _message_scope.set(scope)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _message_scope.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _message_scope.get() is not None:
+            return func(*args, **kwargs)
+        with DependencyScope() as scope:
+            token = _message_scope.set(scope)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _message_scope.reset(token)
+
+    return wrapper
+
+
+def inject(
+    func: AnyCallable,
+    providers: t.Mapping[str, Provider],
+    batch: t.Optional[DependencyScope] = None,
+) -> AnyCallable:
+    """
+    Wraps func to create dependencies of providers before call.
+    Dependencies of `Scope.MESSAGE` are created in message scope opened by `open_scope`,
+    or in own scope cleaned up after the call.
+    Dependencies passed explicitly are not created. Async dependencies are created concurrently.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        async def async_call(scope: DependencyScope, args, kwargs):
+            names = [name for name in providers if name not in kwargs]
+            values = await asyncio.gather(
+                *(providers[name]._get_scope(scope, batch).aget(providers[name]) for name in names)
+            )
+            depends = dict(zip(names, values))
+            scope.dependencies.update(depends)
+            return await func(*args, **depends, **kwargs)
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            scope = _message_scope.get()
+            if scope is not None:
+                return await async_call(scope, args, kwargs)
+            async with DependencyScope() as scope:
+                return await async_call(scope, args, kwargs)
+
+        return async_wrapper
+
+    def call(scope: DependencyScope, args, kwargs):
+        for name, provider in providers.items():
+            if name not in kwargs:
+                kwargs[name] = scope.dependencies[name] = provider._get_scope(scope, batch).get(provider)
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        scope = _message_scope.get()
+        if scope is not None:
+            return call(scope, args, kwargs)
+        with DependencyScope() as scope:
+            return call(scope, args, kwargs)
+
+    return wrapper
@@ -2,3 +2,6 @@ class ApplicationError(Exception): ...
 
 
 class FailedHandlerCondition(ApplicationError): ...
+
+
+class HandlerTimeout(ApplicationError, TimeoutError): ...
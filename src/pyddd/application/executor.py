@@ -1,30 +1,100 @@
 import asyncio
+import contextvars
 import logging
+import threading
+import time
+import typing as t
 from functools import partial
 
 from pyddd.application.abstractions import (
     IExecutor,
     AnyCallable,
 )
+from pyddd.application.exceptions import HandlerTimeout
 from concurrent.futures import (
+    Future,
     ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
 )
 
 
 class SyncExecutor(IExecutor):
-    def __init__(self, logger_name: str = "pyddd.executor"):
+    def __init__(
+        self,
+        logger_name: str = "pyddd.executor",
+        timeout: t.Optional[float] = None,
+        max_workers: int = 16,
+    ):
+        """
+        Args:
+            timeout: seconds to wait for handlers of one dispatch, handlers still running after it are abandoned.
+            max_workers: threads running handlers, abandoned handlers keep their threads until they return.
+        """
         self._logger = logging.getLogger(logger_name)
-        self._executor = ThreadPoolExecutor()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyddd-executor")
+        self._timeout = timeout
+        self._abandoned = 0
+        self._lock = threading.Lock()
+
+    @property
+    def abandoned(self) -> int:
+        """
+        Number of abandoned handlers still occupying threads.
+        """
+        return self._abandoned
 
     def process_handler(self, handler: AnyCallable, **kwargs):
-        return handler(**kwargs)
+        if self._timeout is None:
+            return handler(**kwargs)
+        task = self._executor.submit(contextvars.copy_context().run, partial(handler, **kwargs))
+        result = self._get_result(task, handler, time.monotonic() + self._timeout)
+        if isinstance(result, HandlerTimeout):
+            raise result
+        return result
 
     def process_handlers(self, handlers: list[AnyCallable], **kwargs):
+        deadline = self._get_deadline()
         tasks = []
         for handler in handlers:
             task = self._executor.submit(self._process_handler, handler, **kwargs)
-            tasks.append(task)
-        return (task.result() for task in tasks)
+            tasks.append((task, handler))
+        return (self._get_result(task, handler, deadline) for task, handler in tasks)
+
+    def process_many(self, handlers: list[list[AnyCallable]], **kwargs):
+        deadline = self._get_deadline()
+        tasks = [
+            [(self._executor.submit(self._process_handler, handler, **kwargs), handler) for handler in group]
+            for group in handlers
+        ]
+        return [[self._get_result(task, handler, deadline) for task, handler in group] for group in tasks]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_deadline(self) -> t.Optional[float]:
+        return None if self._timeout is None else time.monotonic() + self._timeout
+
+    def _get_result(self, task: Future, handler: AnyCallable, deadline: t.Optional[float]):
+        if deadline is None:
+            return task.result()
+        try:
+            return task.result(timeout=max(deadline - time.monotonic(), 0))
+        except FuturesTimeoutError:
+            if task.done():
+                raise
+            if not task.cancel():
+                self._abandon(task)
+                self._logger.warning(f"Abandoned handler {handler} after timeout {self._timeout}s")
+            return HandlerTimeout(f"Handler {handler} timed out after {self._timeout}s")
+
+    def _abandon(self, task: Future):
+        with self._lock:
+            self._abandoned += 1
+        task.add_done_callback(self._release)
+
+    def _release(self, _: Future):
+        with self._lock:
+            self._abandoned -= 1
 
     def _process_handler(self, handler: AnyCallable, **kwargs):
         try:
@@ -35,9 +105,16 @@ class SyncExecutor(IExecutor):
 
 
 class AsyncExecutor(IExecutor):
+    def __init__(self, timeout: t.Optional[float] = None):
+        """
+        Args:
+            timeout: seconds to wait for handlers of one dispatch, handlers still running after it are cancelled.
+        """
+        self._timeout = timeout
+
     def process_handler(self, handler: AnyCallable, **kwargs):
         future: asyncio.Future = asyncio.Future()
-        task = asyncio.create_task(handler(**kwargs))
+        task = asyncio.create_task(self._call(handler, **kwargs))
         task.add_done_callback(partial(self._set_task_result, future=future))
         return future
 
@@ -45,11 +122,44 @@ class AsyncExecutor(IExecutor):
         future: asyncio.Future = asyncio.Future()
         tasks = []
         for handler in handlers:
-            tasks.append(asyncio.create_task(handler(**kwargs)))
+            tasks.append(asyncio.create_task(self._call(handler, **kwargs)))
         result = asyncio.gather(*tasks, return_exceptions=True)
         result.add_done_callback(partial(self._set_task_result, future=future))
         return future
 
+    def process_many(self, handlers: list[list[AnyCallable]], **kwargs):
+        future: asyncio.Future = asyncio.Future()
+        tasks = [asyncio.create_task(self._call(handler, **kwargs)) for group in handlers for handler in group]
+        result = asyncio.gather(*tasks, return_exceptions=True)
+        result.add_done_callback(
+            partial(self._set_many_result, future=future, sizes=[len(group) for group in handlers])
+        )
+        return future
+
+    def _call(self, handler: AnyCallable, **kwargs) -> t.Coroutine:
+        if self._timeout is None:
+            return handler(**kwargs)
+        return self._wait_for(handler, handler(**kwargs))
+
+    async def _wait_for(self, handler: AnyCallable, coroutine: t.Coroutine):
+        try:
+            return await asyncio.wait_for(coroutine, self._timeout)
+        except asyncio.TimeoutError:
+            raise HandlerTimeout(f"Handler {handler} timed out after {self._timeout}s") from None
+
+    @staticmethod
+    def _set_many_result(task: asyncio.Future, /, future: asyncio.Future, sizes: list[int]):
+        if task.exception() is not None:
+            future.set_exception(task.exception())  # type: ignore
+            return
+        results = task.result()
+        groups = []
+        start = 0
+        for size in sizes:
+            groups.append(results[start : start + size])
+            start += size
+        future.set_result(groups)
+
     @staticmethod
     def _set_task_result(task: asyncio.Future, /, future: asyncio.Future):
         if task.exception() is not None:
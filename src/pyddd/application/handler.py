@@ -13,7 +13,23 @@ from pyddd.application.abstractions import (
     AnyCallable,
     IRetryStrategy,
 )
+from pyddd.application.concurrency import (
+    ConcurrencyLimit,
+    limit_concurrency,
+)
+from pyddd.application.dependency import (
+    Provider,
+    get_batch_scope,
+    inject,
+    open_scope,
+)
 from pyddd.application.exceptions import FailedHandlerCondition
+from pyddd.application.middleware import Pipeline
+from pyddd.application.process import (
+    ProcessCall,
+    ProcessTarget,
+)
+from pyddd.application.timeout import Timeout
 from pyddd.application.retry import none_retry
 from pyddd.domain.abstractions import (
     IMessage,
@@ -27,20 +43,51 @@ class EventHandler(IHandler):
         self._converter: IPayloadConverter = lambda x: x
         self._condition: ICondition = none_condition
         self._retry_strategy: IRetryStrategy = none_retry
+        self._concurrency_limits: tuple[ConcurrencyLimit, ...] = ()
+        self._timeout: t.Optional[Timeout] = None
+        self._process_target: t.Optional[ProcessTarget] = None
+        self._pipeline: t.Optional[Pipeline] = None
         self._defaults: dict[str, t.Any] = {}
 
     def set_defaults(self, defaults: dict):
         self._handler.set_defaults(defaults)
 
-    def resolve(self, message: IMessage) -> AnyCallable:
+    def set_concurrency_limits(self, *limits: ConcurrencyLimit):
+        self._concurrency_limits = limits
+
+    def set_timeout(self, timeout: t.Optional[Timeout]):
+        self._timeout = timeout
+
+    def set_process_target(self, target: t.Optional[ProcessTarget]):
+        self._process_target = target
+
+    def set_pipeline(self, pipeline: t.Optional[Pipeline]):
+        self._pipeline = pipeline
+
+    def bind(self, message: IMessage) -> AnyCallable:
+        """
+        Handler of converted event without retry strategy, concurrency limits, timeout and middlewares.
+        """
         if not self._condition.check(message):
             raise FailedHandlerCondition(
                 f"Failed check condition {self._condition.__class__.__name__} "
                 f"with message {message.__topic__}:{message.to_json()}"
             )
         command_type = self._handler.get_command_type()
-        message = command_type(**self._converter(message.to_dict()))
-        return self._retry_strategy(self._handler.resolve(message=message))
+        return self._handler.resolve(message=command_type(**self._converter(message.to_dict())))
+
+    def resolve(self, message: IMessage) -> AnyCallable:
+        handler = self.bind(message)
+        if self._process_target is not None:
+            handler = ProcessCall(handler, self._process_target, message)
+        handler = limit_concurrency(handler, self._concurrency_limits)
+        if self._timeout is not None:
+            handler = self._timeout(handler)
+        if self._retry_strategy is not none_retry:
+            handler = open_scope(self._retry_strategy(handler))
+        if self._pipeline is not None:
+            handler = self._pipeline.wrap(handler, message)
+        return handler
 
     def set_condition(self, condition: ICondition):
         self._condition = condition
@@ -59,22 +106,87 @@ class CommandHandler(ICommandHandler):
         self._func = func
         self._signature = signature
         self._command_param = command_param
-        self._defaults: dict[str, t.Any] = {}
+        self._retry_strategy: IRetryStrategy = none_retry
+        self._concurrency_limits: tuple[ConcurrencyLimit, ...] = ()
+        self._timeout: t.Optional[Timeout] = None
+        self._process_target: t.Optional[ProcessTarget] = None
+        self._pipeline: t.Optional[Pipeline] = None
+        self.set_defaults({})
 
     def set_defaults(self, defaults: dict):
+        """
+        Binds defaults used by handler signature once, so resolving handler only adds the command.
+        Dependencies of providers are created on handler call.
+        """
         self._defaults = defaults
+        names = [name for name in self._signature.parameters if name in defaults and name != self._command_param.name]
+        self._providers: dict[str, Provider] = {
+            name: defaults[name] for name in names if isinstance(defaults[name], Provider)
+        }
+        self._call = partial(self._func, **{name: defaults[name] for name in names if name not in self._providers})
+        if self._providers and not inspect.iscoroutinefunction(self._func):
+            async_providers = [name for name, provider in self._providers.items() if provider.is_async]
+            if async_providers:
+                raise TypeError(f"Sync handler {self._func} could not depend on async providers {async_providers}")
+
+    def set_concurrency_limits(self, *limits: ConcurrencyLimit):
+        """
+        Limits are acquired in given order before handler call and are released after it.
+        """
+        self._concurrency_limits = limits
+
+    def set_timeout(self, timeout: t.Optional[Timeout]):
+        """
+        Timeout includes waiting for concurrency limits, abandoned calls hold their slots until they finish.
+        """
+        self._timeout = timeout
+
+    def set_retry_strategy(self, strategy: IRetryStrategy):
+        self._retry_strategy = strategy
+
+    def set_process_target(self, target: t.Optional[ProcessTarget]):
+        """
+        Resolved handlers are marked to be run in worker process by `ProcessExecutor`.
+        Only sync handlers could be run in worker processes.
+        """
+        if target is not None and inspect.iscoroutinefunction(self._func):
+            raise TypeError(f"Async handler {self._func} could not be run in process pool")
+        self._process_target = target
+
+    def set_pipeline(self, pipeline: t.Optional[Pipeline]):
+        """
+        Middlewares wrapping resolved handlers outside of retry strategy.
+        """
+        self._pipeline = pipeline
 
     def get_command_type(self) -> type[DomainCommand]:
         return self._command_param.annotation
 
+    def bind(self, message: IMessage) -> AnyCallable:
+        """
+        Handler with bound command and dependencies without retry strategy, concurrency limits, timeout and middlewares.
+        """
+        command_type = self._command_param.annotation
+        if not isinstance(message, command_type):
+            message = command_type.load(message)
+        handler: AnyCallable = partial(self._call, **{self._command_param.name: message})
+        if self._providers:
+            handler = inject(handler, self._providers, get_batch_scope())
+        return handler
+
     def resolve(self, message: IMessage) -> AnyCallable:
-        depends = {
-            self._command_param.name: self._command_param.annotation.load(message),
-        }
-        for name, param in self._signature.parameters.items():
-            if name in self._defaults:
-                depends[name] = self._defaults[name]
-        return partial(self._func, **depends)
+        handler = self.bind(message)
+        if self._process_target is not None:
+            handler = ProcessCall(handler, self._process_target, message)
+        handler = limit_concurrency(handler, self._concurrency_limits)
+        if self._timeout is not None:
+            handler = self._timeout(handler)
+        handler = self._retry_strategy(handler)
+        if self._providers:
+            handler = open_scope(handler)
+        if self._pipeline is not None:
+            handler = self._pipeline.wrap(handler, message)
+        return handler
 
     @staticmethod
     def _get_signature(func) -> inspect.Signature:
@@ -0,0 +1,51 @@
+import typing as t
+from functools import partial
+
+from pyddd.application.abstractions import (
+    AnyCallable,
+    IMiddleware,
+)
+from pyddd.domain.abstractions import IMessage
+
+
+class HandlerContext:
+    """
+    Handler call passed through middlewares.
+    """
+
+    __slots__ = ("name", "message", "handler")
+
+    def __init__(self, name: str, message: IMessage, handler: AnyCallable):
+        self.name = name
+        self.message = message
+        self.handler = handler
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, message={self.message.__topic__})"
+
+
+def _call(context: HandlerContext, **kwargs):
+    return context.handler(**kwargs)
+
+
+async def _call_async(context: HandlerContext, **kwargs):
+    return await context.handler(**kwargs)
+
+
+class Pipeline:
+    """
+    Middlewares of one handler compiled once into a single call chain,
+    so wrapping resolved handler only creates its context.
+    """
+
+    __slots__ = ("_name", "_chain")
+
+    def __init__(self, middlewares: t.Sequence[IMiddleware], name: str, is_async: bool):
+        chain: AnyCallable = _call_async if is_async else _call
+        for middleware in reversed(middlewares):
+            chain = partial(middleware.handle_async if is_async else middleware.handle, chain)
+        self._name = name
+        self._chain = chain
+
+    def wrap(self, handler: AnyCallable, message: IMessage) -> AnyCallable:
+        return partial(self._chain, HandlerContext(self._name, message, handler))
@@ -1,6 +1,8 @@
+import inspect
 import logging
 import typing as t
 from collections import defaultdict
+from itertools import chain
 
 from pyddd.application.condition import (
     none_condition,
@@ -8,13 +10,21 @@ from pyddd.application.condition import (
 from pyddd.application.abstractions import (
     ICondition,
     IExecutor,
+    IMiddleware,
     IPayloadConverter,
     IRetryStrategy,
     IModule,
     ISubscribe,
     IRegister,
 )
+from pyddd.application.concurrency import (
+    ConcurrencyLimit,
+    ConcurrencyMetrics,
+)
 from pyddd.application.exceptions import FailedHandlerCondition
+from pyddd.application.middleware import Pipeline
+from pyddd.application.process import ProcessTarget
+from pyddd.application.timeout import Timeout
 from pyddd.application.executor import (
     SyncExecutor,
 )
@@ -28,13 +38,27 @@ from pyddd.domain.abstractions import IMessage
 
 
 class Module(IModule, ISubscribe, IRegister):
-    def __init__(self, domain: str, executor: IExecutor = None, logger_name: str = "pyddd.module"):
+    def __init__(
+        self,
+        domain: str,
+        executor: IExecutor = None,
+        logger_name: str = "pyddd.module",
+        concurrency_limit: t.Optional[int] = None,
+    ):
         self._domain = DomainName(domain)
         self._executor = executor or SyncExecutor()
         self._defaults: dict[str, t.Any] = {}
         self._event_handlers: dict[str, list[EventHandler]] = defaultdict(list)
         self._command_handlers: dict[str, CommandHandler] = {}
         self._logger = logging.getLogger(logger_name)
+        self._concurrency_limit = ConcurrencyLimit(concurrency_limit) if concurrency_limit is not None else None
+        self._handler_concurrency_limits: dict[str, ConcurrencyLimit] = {}
+        self._process_handlers: dict[tuple[str, str], t.Union[CommandHandler, EventHandler]] = {}
+        self._middlewares: list[IMiddleware] = []
+        self._app_middlewares: tuple[IMiddleware, ...] = ()
+        self._handler_funcs: list[tuple[t.Union[CommandHandler, EventHandler], t.Callable]] = []
+        self._timeouts: list[Timeout] = []
+        self._subscriptions_listener: t.Optional[t.Callable[[], None]] = None
 
     @property
     def domain(self) -> str:
@@ -42,15 +66,39 @@ class Module(IModule, ISubscribe, IRegister):
 
     def set_defaults(self, defaults: dict):
         self._defaults.update(defaults)
+        for handler in (*self._command_handlers.values(), *chain.from_iterable(self._event_handlers.values())):
+            handler.set_defaults(self._defaults)
+
+    def get_defaults(self) -> t.Mapping[str, t.Any]:
+        return self._defaults
+
+    def register(
+        self,
+        func=None,
+        *,
+        retry_strategy: IRetryStrategy = none_retry,
+        concurrency_limit: t.Optional[int] = None,
+        timeout: t.Optional[float] = None,
+        in_process_pool: bool = False,
+    ):
+        def wrapper(func):
+            handler = CommandHandler(func)
+            command_type = handler.get_command_type()
+            handler.set_defaults(self._defaults)
+            handler.set_retry_strategy(retry_strategy)
+            handler.set_concurrency_limits(*self._get_concurrency_limits(func, concurrency_limit))
+            handler.set_timeout(self._get_timeout(timeout))
+            if command_type.__topic__ in self._command_handlers:
+                raise ValueError(f"Already registered command '{command_type.__topic__}'")
+            if in_process_pool:
+                self._set_process_target(command_type.__topic__, func, handler)
+            self._set_pipeline(handler, func)
+            self._command_handlers[command_type.__topic__] = handler
+            return func
 
-    def register(self, func):
-        handler = CommandHandler(func)
-        command_type = handler.get_command_type()
-        handler.set_defaults(self._defaults)
-        if command_type.__topic__ in self._command_handlers:
-            raise ValueError(f"Already registered command '{command_type.__topic__}'")
-        self._command_handlers[command_type.__topic__] = handler
-        return func
+        if func is None:
+            return wrapper
+        return wrapper(func)
 
     def subscribe(
         self,
@@ -59,6 +107,9 @@ class Module(IModule, ISubscribe, IRegister):
         converter: IPayloadConverter = lambda x: x,
         condition: ICondition = none_condition,
         retry_strategy: IRetryStrategy = none_retry,
+        concurrency_limit: t.Optional[int] = None,
+        timeout: t.Optional[float] = None,
+        in_process_pool: bool = False,
     ):
         def wrapper(func):
             handler = EventHandler(CommandHandler(func))
@@ -66,16 +117,105 @@ class Module(IModule, ISubscribe, IRegister):
             handler.set_condition(condition)
             handler.set_defaults(self._defaults)
             handler.set_retry_strategy(retry_strategy)
+            handler.set_concurrency_limits(*self._get_concurrency_limits(func, concurrency_limit))
+            handler.set_timeout(self._get_timeout(timeout))
+            if in_process_pool:
+                self._set_process_target(event_name, func, handler)
+            self._set_pipeline(handler, func)
+            is_new_topic = event_name not in self._event_handlers
             self._event_handlers[event_name].append(handler)
+            if is_new_topic and self._subscriptions_listener is not None:
+                self._subscriptions_listener()
             return func
 
         return wrapper
 
+    def _get_timeout(self, timeout: t.Optional[float]) -> t.Optional[Timeout]:
+        if timeout is None:
+            return None
+        self._timeouts.append(Timeout(timeout))
+        return self._timeouts[-1]
+
+    def shutdown(self):
+        for timeout in self._timeouts:
+            timeout.shutdown()
+
+    def add_middleware(self, middleware: IMiddleware):
+        """
+        Wraps calls of module handlers. Middlewares are called in order of adding.
+        """
+        self._middlewares.append(middleware)
+        self._compile_pipelines()
+
+    def set_middlewares(self, middlewares: t.Sequence[IMiddleware]):
+        self._app_middlewares = tuple(middlewares)
+        self._compile_pipelines()
+
+    def _compile_pipelines(self):
+        for handler, func in self._handler_funcs:
+            self._compile_pipeline(handler, func)
+
+    def _set_pipeline(self, handler: t.Union[CommandHandler, EventHandler], func):
+        self._handler_funcs.append((handler, func))
+        self._compile_pipeline(handler, func)
+
+    def _compile_pipeline(self, handler: t.Union[CommandHandler, EventHandler], func):
+        middlewares = [*self._app_middlewares, *self._middlewares]
+        pipeline = None
+        if middlewares:
+            pipeline = Pipeline(
+                middlewares,
+                name=f"{func.__module__}.{func.__qualname__}",
+                is_async=inspect.iscoroutinefunction(func),
+            )
+        handler.set_pipeline(pipeline)
+
+    def get_concurrency_metrics(self) -> dict[str, ConcurrencyMetrics]:
+        """
+        Running and waiting calls of concurrency limited handlers by handler name
+        and of the whole module by module domain.
+        """
+        metrics = {name: limit.metrics for name, limit in self._handler_concurrency_limits.items()}
+        if self._concurrency_limit is not None:
+            metrics[self._domain] = self._concurrency_limit.metrics
+        return metrics
+
+    def _get_concurrency_limits(self, func, concurrency_limit: t.Optional[int]) -> list[ConcurrencyLimit]:
+        limits = []
+        if concurrency_limit is not None:
+            limit = ConcurrencyLimit(concurrency_limit)
+            self._handler_concurrency_limits[f"{func.__module__}.{func.__qualname__}"] = limit
+            limits.append(limit)
+        if self._concurrency_limit is not None:
+            limits.append(self._concurrency_limit)
+        return limits
+
+    def _set_process_target(self, topic: str, func, handler: t.Union[CommandHandler, EventHandler]):
+        target = ProcessTarget(module=func.__module__, domain=self._domain, handler=func.__qualname__)
+        handler.set_process_target(target)
+        self._process_handlers[(topic, target.handler)] = handler
+
+    def get_process_handler(self, message: IMessage, name: str):
+        """
+        Binds handler registered with `in_process_pool=True` by its qualified name,
+        used by `ProcessExecutor` workers to rebuild handlers of received messages.
+        Retry strategy, concurrency limits, timeout and middlewares are applied by calling process.
+        """
+        if (message.__topic__, name) not in self._process_handlers:
+            raise RuntimeError(f"Unregistered process pool handler {name} of {message.__topic__} in {self._domain}")
+        return self._process_handlers[(message.__topic__, name)].bind(message)
+
     def get_command_handler(self, command: IMessage):
         if command.__topic__ not in self._command_handlers:
             raise RuntimeError(f"Unregistered command {command.__topic__} in {self.__class__.__name__}:{self._domain}")
         return self._command_handlers[command.__topic__].resolve(command)
 
+    def get_subscriptions(self) -> set[str]:
+        return set(self._event_handlers)
+
+    def set_subscriptions_listener(self, listener: t.Callable[[], None]):
+        self._subscriptions_listener = listener
+
     def get_event_handlers(self, event: IMessage):
         handlers = []
         for handler in self._event_handlers.get(event.__topic__, []):
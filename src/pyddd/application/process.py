@@ -0,0 +1,202 @@
+import contextvars
+import datetime as dt
+import functools
+import importlib
+import logging
+import multiprocessing.context
+import typing as t
+import uuid
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from pyddd.application.abstractions import (
+    AnyCallable,
+    IExecutor,
+    IModule,
+)
+from pyddd.domain.abstractions import (
+    IESEvent,
+    IMessage,
+    MessageTopic,
+)
+from pyddd.domain.message import (
+    Message,
+    get_message_class,
+)
+
+
+class ProcessTarget(t.NamedTuple):
+    """
+    Location of handler registered to run in process pool.
+    """
+
+    module: str
+    domain: str
+    handler: str
+
+
+class Envelope(t.NamedTuple):
+    """
+    Compact picklable form of handler call sent to worker process.
+    """
+
+    target: ProcessTarget
+    topic: str
+    type: str
+    payload: str
+    message_id: str
+    timestamp: t.Optional[dt.datetime]
+    entity: t.Optional[tuple[str, int]]
+
+    @classmethod
+    def build(cls, target: ProcessTarget, message: IMessage) -> "Envelope":
+        entity = None
+        if isinstance(message, IESEvent):
+            entity = (str(message.__entity_reference__), message.__entity_version__)
+        return cls(
+            target=target,
+            topic=message.__topic__,
+            type=message.__type__.value,
+            payload=message.to_json(),
+            message_id=str(message.__message_id__),
+            timestamp=message.__timestamp__,
+            entity=entity,
+        )
+
+    def load_message(self) -> IMessage:
+        topic = MessageTopic(self.topic)
+        try:
+            message_type = get_message_class(topic)
+        except ValueError:
+            return Message(topic, self.type, self.payload, message_id=self.message_id, occurred_on=self.timestamp)
+        kwargs = {}
+        if self.entity is not None:
+            kwargs = {"entity_reference": self.entity[0], "entity_version": self.entity[1]}
+        return message_type.load(
+            self.payload,  # type: ignore[arg-type]
+            message_id=uuid.UUID(self.message_id),
+            timestamp=self.timestamp,
+            **kwargs,
+        )
+
+
+_process_pool: contextvars.ContextVar[t.Optional[ProcessPoolExecutor]] = contextvars.ContextVar(
+    "pyddd_process_pool", default=None
+)
+
+
+class ProcessCall:
+    """
+    Handler with bound dependencies, which is run in worker process when called by `ProcessExecutor`
+    and in place otherwise. Retry strategy, concurrency limits, timeout and middlewares wrap it in the calling
+    process. Only the message and call arguments are sent to worker, defaults are bound there again.
+    """
+
+    __slots__ = ("__wrapped__", "_target", "_message")
+
+    def __init__(self, handler: AnyCallable, target: ProcessTarget, message: IMessage):
+        self.__wrapped__ = handler
+        self._target = target
+        self._message = message
+
+    @property
+    def target(self) -> ProcessTarget:
+        return self._target
+
+    def build_envelope(self) -> Envelope:
+        return Envelope.build(self._target, self._message)
+
+    def __call__(self, **kwargs):
+        pool = _process_pool.get()
+        if pool is None:
+            return self.__wrapped__(**kwargs)
+        return pool.submit(run_envelope, self.build_envelope(), kwargs).result()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._target.module}.{self._target.handler})"
+
+
+@functools.cache
+def _find_module(module_name: str, domain: str) -> IModule:
+    module = importlib.import_module(module_name)
+    for value in vars(module).values():
+        if isinstance(value, IModule) and not isinstance(value, type) and value.domain == domain:
+            return value
+    raise LookupError(f"Could not find module of domain {domain} in {module_name}")
+
+
+def run_envelope(envelope: Envelope, kwargs: dict[str, t.Any]):
+    """
+    Rebuilds handler from module registered in handler's python module and runs it.
+    Entry point of worker processes.
+    """
+    module = _find_module(envelope.target.module, envelope.target.domain)
+    resolve = getattr(module, "get_process_handler", None)
+    if resolve is None:
+        raise TypeError(f"Module {module!r} could not resolve process pool handlers")
+    return resolve(envelope.load_message(), envelope.target.handler)(**kwargs)
+
+
+class ProcessExecutor(IExecutor):
+    """
+    Executor running handlers registered with `in_process_pool=True` in a process pool.
+
+    Handlers are called in threads of this process, so their retry strategy, concurrency limits, timeout
+    and middlewares work as with `SyncExecutor`, only the handler function itself is run in worker.
+    Messages are sent to workers as envelopes and the function is resolved again in the worker
+    by module imported from handler's python module, so modules must be defined at module level
+    and their defaults, including dependency providers, must be set there or by `initializer`.
+    Dependencies passed to `Application.handle` and handler results must be picklable.
+    """
+
+    def __init__(
+        self,
+        max_workers: t.Optional[int] = None,
+        *,
+        mp_context: t.Optional[multiprocessing.context.BaseContext] = None,
+        initializer: t.Optional[t.Callable[..., t.Any]] = None,
+        initargs: tuple = (),
+        logger_name: str = "pyddd.executor",
+    ):
+        self._logger = logging.getLogger(logger_name)
+        self._processes = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+        self._threads = ThreadPoolExecutor()
+
+    def process_handler(self, handler: AnyCallable, **kwargs):
+        return self._run(handler, kwargs)
+
+    def process_handlers(self, handlers: list[AnyCallable], **kwargs):
+        tasks = [(self._threads.submit(self._run, handler, kwargs), handler) for handler in handlers]
+        return (self._get_result(task, handler) for task, handler in tasks)
+
+    def process_many(self, handlers: list[list[AnyCallable]], **kwargs):
+        tasks = [
+            [(self._threads.submit(self._run, handler, kwargs), handler) for handler in group] for group in handlers
+        ]
+        return [[self._get_result(task, handler) for task, handler in group] for group in tasks]
+
+    def shutdown(self, wait: bool = True):
+        self._processes.shutdown(wait=wait)
+        self._threads.shutdown(wait=wait)
+
+    def _run(self, handler: AnyCallable, kwargs: dict[str, t.Any]):
+        token = _process_pool.set(self._processes)
+        try:
+            return handler(**kwargs)
+        finally:
+            _process_pool.reset(token)
+
+    def _get_result(self, task: Future, handler: AnyCallable):
+        try:
+            return task.result()
+        except Exception as exc:
+            self._logger.warning(f"Failed to process handler {handler}", exc_info=exc)
+            return exc
@@ -0,0 +1,88 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+)
+
+from pyddd.application.abstractions import AnyCallable
+from pyddd.application.exceptions import HandlerTimeout
+
+
+class Timeout:
+    """
+    Limits duration of handler call.
+
+    Async handlers are cancelled on timeout. Sync handlers are run in one of `max_workers` threads
+    and abandoned on timeout, the thread keeps running until handler returns.
+    Calls waiting for a free thread longer than timeout are dropped without running.
+    Both raise `HandlerTimeout`.
+    """
+
+    def __init__(self, seconds: float, max_workers: int = 4):
+        if seconds <= 0:
+            raise ValueError(f"Timeout must be positive, got {seconds}")
+        self._seconds = seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyddd-timeout")
+        self._abandoned = 0
+        self._lock = threading.Lock()
+
+    @property
+    def seconds(self) -> float:
+        return self._seconds
+
+    @property
+    def abandoned(self) -> int:
+        """
+        Number of abandoned sync calls still occupying threads.
+        """
+        return self._abandoned
+
+    def shutdown(self):
+        """
+        Releases threads of sync handlers, abandoned calls are not waited for.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __call__(self, func: AnyCallable) -> AnyCallable:
+        if inspect.iscoroutinefunction(func):
+            return self._wrap_async(func)
+        return self._wrap_sync(func)
+
+    def _wrap_async(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await asyncio.wait_for(func(*args, **kwargs), self._seconds)
+            except asyncio.TimeoutError:
+                raise HandlerTimeout(f"Handler {func} timed out after {self._seconds}s") from None
+
+        return wrapper
+
+    def _wrap_sync(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            future = self._executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+            try:
+                return future.result(timeout=self._seconds)
+            except FuturesTimeoutError:
+                if future.done():
+                    raise
+                if not future.cancel():
+                    self._abandon(future)
+                raise HandlerTimeout(f"Handler {func} timed out after {self._seconds}s") from None
+
+        return wrapper
+
+    def _abandon(self, future: Future):
+        with self._lock:
+            self._abandoned += 1
+        future.add_done_callback(self._release)
+
+    def _release(self, _: Future):
+        with self._lock:
+            self._abandoned -= 1
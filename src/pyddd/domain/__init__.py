@@ -1,20 +1,25 @@
+import typing as t
+
+from pyddd.lazy import lazy_exports
 from .abstractions import (
     IEntity,
     IRootEntity,
     IESRootEntity,
 )
-from .event import (
-    DomainEvent,
-)
-from .command import DomainCommand
-from .entity import (
-    RootEntity,
-    Entity,
-)
-from .types import (
-    DomainName,
-    DomainError,
-)
+
+if t.TYPE_CHECKING:
+    from .event import (
+        DomainEvent,
+    )
+    from .command import DomainCommand
+    from .entity import (
+        RootEntity,
+        Entity,
+    )
+    from .types import (
+        DomainName,
+        DomainError,
+    )
 
 __all__ = [
     "DomainEvent",
@@ -27,3 +32,15 @@ __all__ = [
     "DomainError",
     "IESRootEntity",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DomainEvent": ".event",
+        "DomainCommand": ".command",
+        "RootEntity": ".entity",
+        "Entity": ".entity",
+        "DomainName": ".types",
+        "DomainError": ".types",
+    },
+)
@@ -13,18 +13,42 @@ class EntityUid(ValueObject, UUID): ...
 
 
 class MessageTopic(str):
+    """
+    Full message name in format 'domain.message_name'.
+    Topics are interned: each distinct topic is validated and split once per process.
+    At most `max_interned` topics are kept, further topics, e.g. of high cardinality transport names,
+    are validated on every creation.
+    """
+
+    max_interned: t.ClassVar[int] = 4096
+    _interned: t.ClassVar[dict[str, MessageTopic]] = {}
+    _domain: str
+    _name: str
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
     def __new__(cls, value: str):
+        if type(value) is cls:
+            return value
         if not isinstance(value, str) or "." not in value:
             raise ValueError(f"Invalid topic format: {value}. Expected format 'domain.message_name'")
-        return super().__new__(cls, value)
+        topic = cls._interned.get(value)
+        if topic is None:
+            topic = super().__new__(cls, value)
+            topic._domain, topic._name = value.rsplit(".", 1)
+            if len(cls._interned) < cls.max_interned:
+                topic = cls._interned.setdefault(str(value), topic)
+        return topic
 
     @property
     def domain(self) -> str:
-        return self.rsplit(".", 1)[0]
+        return self._domain
 
     @property
     def name(self) -> str:
-        return self.rsplit(".", maxsplit=1)[-1]
+        return self._name
 
 
 IdType = t.TypeVar("IdType")
@@ -87,12 +111,32 @@ class IMessageMeta(abc.ABCMeta):
             timestamp (Optional[datetime]): The creation timestamp of the message.
                 If not provided, the current time will be used.
 
+            trusted (bool): Whether the payload was validated before, e.g. when read from own event store.
+                Implementations could skip validation of trusted payloads.
+
         Returns:
             IMessage: The newly created message object.
         """
 
+    def load_many(cls, items: t.Iterable[t.Mapping[str, t.Any]], **kwargs) -> t.Sequence["IMessage"]:
+        """
+        Constructs many messages of this class.
+
+        Args:
+            items (Iterable[Mapping]): Arguments of `load` for each message:
+                "payload" and optional "message_id", "timestamp" and other keyword arguments.
+
+            kwargs: Arguments of `load` shared by all messages, e.g. trusted.
+
+        Returns:
+            Sequence[IMessage]: The newly created messages in the order of items.
+        """
+        return [cls.load(**item, **kwargs) for item in items]
+
 
 class IMessage(abc.ABC, metaclass=IMessageMeta):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def __domain__(self) -> str: ...
@@ -0,0 +1,14 @@
+import functools
+
+
+@functools.cache
+def get_pydantic_version() -> str:
+    """
+    Returns the version of installed pydantic.
+
+    The version is read from the imported pydantic package instead of the distribution metadata,
+    which is much slower to load at import time.
+    """
+    from pydantic.version import VERSION
+
+    return str(VERSION)
@@ -1,6 +1,5 @@
 import typing as t
 import uuid
-from importlib.metadata import version as meta_version
 
 from pyddd.domain.abstractions import (
     EntityUid,
@@ -10,16 +9,25 @@ from pyddd.domain.abstractions import (
     Version,
     IEvent,
 )
+from pyddd.domain.compat import get_pydantic_version
 
-pydantic_version = meta_version("pydantic")
+pydantic_version = get_pydantic_version()
 if pydantic_version.startswith("2"):
     from pydantic import (
         BaseModel,
         PrivateAttr,
     )
     from pydantic._internal._model_construction import ModelMetaclass
+
+    def _dump_model_json_bytes(obj) -> bytes:
+        return obj.__pydantic_serializer__.to_json(obj)
+
 elif pydantic_version.startswith("1"):
     from pydantic.main import ModelMetaclass, BaseModel, PrivateAttr  # type: ignore[no-redef]
+
+    def _dump_model_json_bytes(obj) -> bytes:
+        return obj.json().encode()
+
 else:
     raise ImportError("Can not import pydantic. Please setup pydantic >= 1.x.x <= 2.x.x")
 
@@ -1,17 +1,16 @@
 import datetime as dt
-import json
 import typing as t
-from typing import Mapping
 from uuid import UUID
 
+from pyddd.domain import serialization
 from pyddd.domain.entity import (
     _EntityMeta,
     Entity,
     increment_version,
+    _dump_model_json_bytes,
 )
 from pyddd.domain.message import (
     BaseDomainMessageMeta,
-    _T,
     BaseDomainMessage,
 )
 from pyddd.domain.abstractions import (
@@ -40,20 +39,19 @@ class _ESDomainEventMeta(BaseDomainMessageMeta, IESEventMeta):
         )
         return instance
 
-    def load(  # type: ignore[misc]
-        cls: type[_T],
-        payload: Mapping | str | bytes,
+    def _set_loaded_metadata(
+        cls,
+        obj,
         message_id: UUID | None = None,
         timestamp: dt.datetime | None = None,
         **kwargs,
-    ) -> _T:
-        obj = super().load(payload, message_id, timestamp, **kwargs)  # type: ignore[misc]
+    ):
+        super()._set_loaded_metadata(obj, message_id, timestamp, **kwargs)
         _ESDomainEventMeta._set_entity_reference_and_version(
             instance=obj,
             entity_reference=kwargs.get("entity_reference"),
             entity_version=kwargs.get("entity_version"),
         )
-        return obj
 
     @classmethod
     def _set_entity_reference_and_version(
@@ -112,6 +110,8 @@ class _EventSourcedEntityMeta(_EntityMeta):
 
 
 class Snapshot:
+    __slots__ = ("_state", "_reference", "_version")
+
     def __init__(self, state: bytes, reference: str, version: int):
         self._state = state
         self._reference = reference
@@ -148,6 +148,42 @@ class RootEntity(IESRootEntity[IdType], Entity, metaclass=_EventSourcedEntityMet
     def register_event(self, event: IESEvent):
         self._events.append(event)
 
+    def replay(self, events: t.Iterable[IESEvent]) -> "RootEntity[IdType]":
+        """
+        Applies stored events to the entity in batch and returns the entity.
+
+        References and versions of the whole batch are checked once before applying:
+        versions must continue the entity version without gaps.
+        Events with default mutate are applied without per-event checks,
+        apply sees the entity version preceding the event as in mutate.
+        Events with custom mutate are mutated as usual.
+        Replayed events are not registered as changes.
+        """
+        events = events if isinstance(events, t.Sequence) else list(events)
+        if not events:
+            return self
+        first_version = self.__version__ + 1
+        versions = [event.__entity_version__ for event in events]
+        if versions != list(range(first_version, first_version + len(events))):
+            raise ValueError(
+                f"Could not replay events with versions {versions[0]}..{versions[-1]} "
+                f"on entity {self.__reference__} of version {self.__version__}"
+            )
+        reference = str(self.__reference__)
+        if any(str(event.__entity_reference__) != reference for event in events):
+            raise ValueError(f"Could not replay events of another entity on entity {reference}")
+
+        entity: RootEntity[IdType] = self
+        default_mutate = DomainEvent.mutate
+        for event in events:
+            entity._version = Version(event.__entity_version__ - 1)
+            if getattr(type(event), "mutate", None) is default_mutate:
+                event.apply(entity)
+            else:
+                entity = t.cast(RootEntity[IdType], event.mutate(entity))
+        entity._version = Version(versions[-1])
+        return entity
+
     def collect_events(self) -> t.Iterable[IESEvent]:
         events = self._events
         self._events = []
@@ -157,12 +193,12 @@ class RootEntity(IESRootEntity[IdType], Entity, metaclass=_EventSourcedEntityMet
         return Snapshot(
             reference=self.__reference__,
             version=int(self.__version__),
-            state=self.json().encode(),
+            state=_dump_model_json_bytes(self),
         )
 
     @classmethod
     def from_snapshot(cls, snapshot: SnapshotProtocol):
-        state = json.loads(snapshot.__state__)
+        state = serialization.loads(snapshot.__state__)
         return cls(
             __reference__=snapshot.__entity_reference__,
             __version__=Version(snapshot.__entity_version__),
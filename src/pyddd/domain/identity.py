@@ -0,0 +1,55 @@
+import os
+import threading
+import time
+import typing as t
+from uuid import UUID
+
+IdGenerator = t.Callable[[], UUID]
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Generates time-ordered UUID version 7.
+    The first 48 bits hold unix time in milliseconds, followed by 12-bit counter
+    which keeps identifiers generated within the same millisecond monotonic.
+    """
+    global _last_timestamp, _counter
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            timestamp = _last_timestamp
+            _counter += 1
+            if _counter > 0xFFF:
+                timestamp += 1
+                _counter = 0
+        _last_timestamp = timestamp
+        counter = _counter
+    random = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(int=(timestamp << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random)
+
+
+__generator: IdGenerator = uuid7
+
+
+def set_id_generator(generator: IdGenerator):
+    """
+    Set generator of message identifiers used by messages, transports and event stores.
+    """
+    if not callable(generator):
+        raise TypeError(f"{generator!r} required be callable")
+    global __generator
+    __generator = generator
+
+
+def get_id_generator() -> IdGenerator:
+    return __generator
+
+
+def generate_id() -> UUID:
+    return __generator()
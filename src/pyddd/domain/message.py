@@ -1,19 +1,21 @@
 import abc
 import datetime as dt
+import functools
 import json
+import typing as t
 from contextlib import suppress
+from types import UnionType
 from typing import (
     Optional,
     Union,
     Mapping,
     TypeVar,
 )
-from uuid import (
-    uuid4,
-    UUID,
-)
-from importlib.metadata import version as package_version
+from uuid import UUID
 
+from pyddd.domain import serialization
+from pyddd.domain.compat import get_pydantic_version
+from pyddd.domain.identity import generate_id
 from pyddd.domain.types import DomainName
 from pyddd.domain.abstractions import (
     MessageType,
@@ -26,21 +28,92 @@ from pyddd.domain.abstractions import (
 from pydantic import (
     BaseModel,
     PrivateAttr,
-    root_validator,
 )
 
-pydantic_version = package_version("pydantic")
+pydantic_version = get_pydantic_version()
 
 if pydantic_version.startswith("2"):
+    from pydantic import (
+        ConfigDict,
+        TypeAdapter,
+        model_validator,
+    )
     from pydantic._internal._model_construction import ModelMetaclass
+
+    def _before_validator(func):
+        return model_validator(mode="before")(func)
+
+    def _get_field_parser(annotation) -> t.Callable[[t.Any], t.Any]:
+        return TypeAdapter(annotation).validate_python
+
+    def _get_model_fields(model) -> dict[str, tuple[t.Any, bool]]:
+        return {name: (field.annotation, field.is_required()) for name, field in model.model_fields.items()}
+
+    def _construct_model(model, values: dict):
+        return model.model_construct(**values)
+
+    def _validate_model(model, payload: Mapping | str | bytes):
+        if isinstance(payload, (str, bytes, bytearray)):
+            return model.model_validate_json(payload)
+        return model.model_validate(payload)
+
+    def _dump_model(obj) -> dict:
+        return obj.model_dump()
+
+    def _dump_model_json(obj) -> str:
+        return obj.model_dump_json()
+
+    def _dump_model_json_bytes(obj) -> bytes:
+        return obj.__pydantic_serializer__.to_json(obj)
+
 elif pydantic_version.startswith("1"):
+    from pydantic import (
+        parse_obj_as,
+        root_validator,
+    )
     from pydantic.main import ModelMetaclass  # type: ignore[no-redef]
+
+    def _before_validator(func):
+        return root_validator(pre=True, allow_reuse=True)(func)
+
+    def _get_field_parser(annotation) -> t.Callable[[t.Any], t.Any]:
+        return functools.partial(parse_obj_as, annotation)
+
+    def _get_model_fields(model) -> dict[str, tuple[t.Any, bool]]:
+        return {name: (field.annotation, field.required is True) for name, field in model.__fields__.items()}
+
+    def _construct_model(model, values: dict):
+        return model.construct(**values)
+
+    def _validate_model(model, payload: Mapping | str | bytes):
+        if isinstance(payload, (str, bytes, bytearray)):
+            return model.parse_raw(payload)
+        return model.parse_obj(payload)
+
+    def _dump_model(obj) -> dict:
+        return obj.dict()
+
+    def _dump_model_json(obj) -> str:
+        return obj.json()
+
+    def _dump_model_json_bytes(obj) -> bytes:
+        return obj.json().encode()
+
 else:
     raise ImportError("Can not import pydantic. Please setup pydantic >= 1.x.x <= 2.x.x")
 
 _T = TypeVar("_T", bound="BaseDomainMessage")
 
 
+def _json_dumps(obj: t.Any, *, default: t.Optional[t.Callable[[t.Any], t.Any]] = None, **kwargs) -> str:
+    """
+    Json dumps of pydantic v1 models, formatting options like `indent` are supported by stdlib json only.
+    """
+    if kwargs:
+        return json.dumps(obj, default=default, **kwargs)
+    return serialization.dumps(obj, default=default)
+
+
 class _DomainMessagesCollection:
     def __init__(self):
         self._collection: dict[MessageTopic, IMessageMeta] = dict()
@@ -58,21 +131,61 @@ class _DomainMessagesCollection:
 
 _domain_message_collection = _DomainMessagesCollection()
 
+_JSON_NATIVE_TYPES = frozenset((str, int, float, bool, type(None), list, dict, t.Any))
+
+
+def _is_json_native(annotation) -> bool:
+    """
+    Checks that json decoded value of the annotation equals to the validated one.
+    """
+    if annotation in _JSON_NATIVE_TYPES:
+        return True
+    origin, args = t.get_origin(annotation), t.get_args(annotation)
+    if origin is t.Literal:
+        return all(isinstance(arg, (str, int, bool, type(None))) for arg in args)
+    if origin in (t.Union, UnionType, list):
+        return all(_is_json_native(arg) for arg in args)
+    if origin is dict:
+        return args[0] is str and _is_json_native(args[1])
+    return False
+
 
 class Message(IMessage):
+    """
+    Generic message built from transport data without a registered message class.
+
+    The payload could be passed either decoded (mapping) or encoded (json string or bytes).
+    The other form is computed once on construction, which also validates the payload.
+    """
+
+    __slots__ = (
+        "_topic",
+        "_type",
+        "_payload",
+        "_payload_json",
+        "_message_id",
+        "_occurred_on",
+        "_version",
+    )
+
     def __init__(
         self,
         full_name: str,
         message_type: Union[MessageType, str],
-        payload: dict,
+        payload: Union[Mapping, str, bytes],
         message_id: Optional[str] = None,
         occurred_on: Optional[dt.datetime] = None,
         event_version: Version = Version(1),
     ):
-        self._domain, self._name = full_name.rsplit(".", 1)
+        self._topic = MessageTopic(full_name)
         self._type = MessageType(message_type)
-        self._payload = json.dumps(payload)
-        self._message_id = message_id or str(uuid4())
+        if isinstance(payload, (str, bytes)):
+            self._payload: dict = serialization.loads(payload)
+            self._payload_json = payload.decode() if isinstance(payload, bytes) else payload
+        else:
+            self._payload = dict(payload)
+            self._payload_json = serialization.dumps(self._payload)
+        self._message_id = message_id or str(generate_id())
         self._occurred_on = occurred_on or dt.datetime.utcnow()
         self._version = event_version
 
@@ -90,11 +203,11 @@ class Message(IMessage):
 
     @property
     def __domain__(self) -> str:
-        return self._domain
+        return self._topic.domain
 
     @property
     def __message_name__(self) -> str:
-        return self._name
+        return self._topic.name
 
     @property
     def __version__(self) -> Version:
@@ -102,21 +215,35 @@ class Message(IMessage):
 
     @property
     def __topic__(self) -> MessageTopic:
-        return MessageTopic(f"{self._domain}.{self._name}")
+        return self._topic
 
     def to_dict(self) -> dict:
-        return json.loads(self._payload)
+        """
+        Returns a copy of the decoded payload.
+        """
+        return dict(self._payload)
 
     def to_json(self) -> str:
-        return self._payload
+        return self._payload_json
+
+
+def _upcast(cls, values):
+    if isinstance(values, dict):
+        return cls.upcast_payload(values)
+    return values
 
 
 class BaseDomainMessageMeta(IMessageMeta, ModelMetaclass, abc.ABCMeta):
     _domain_name: DomainName
     _message_name: str
+    _topic: MessageTopic
     _version: Version
+    _upcasters: tuple[Optional[t.Callable[[dict], t.Any]], ...]
+    _trusted_fields: Optional["_TrustedFields"]
 
     def __new__(mcs, name, bases, namespace, domain: Optional[str] = None, version: int = 1):
+        if version != 1:
+            namespace["upcast"] = _before_validator(_upcast)
         cls: "BaseDomainMessageMeta" = super().__new__(mcs, name, bases, namespace)  # type: ignore[assignment]
         if domain is not None:
             cls._domain_name = DomainName(domain)
@@ -126,8 +253,10 @@ class BaseDomainMessageMeta(IMessageMeta, ModelMetaclass, abc.ABCMeta):
         super().__init__(name, bases, namespace, domain=domain)
         cls._message_name = name
         cls._version = Version(version)
+        cls._upcasters = tuple(getattr(cls, f"upcast_v{v}_v{v + 1}", None) for v in range(1, version))
         with suppress(AttributeError):
-            _domain_message_collection.register(cls.__topic__, cls)
+            cls._topic = MessageTopic(f"{cls._domain_name}.{cls._message_name}")
+            _domain_message_collection.register(cls._topic, cls)
 
     @property
     def __domain__(cls) -> str:
@@ -139,32 +268,110 @@ class BaseDomainMessageMeta(IMessageMeta, ModelMetaclass, abc.ABCMeta):
 
     @property
     def __topic__(cls) -> MessageTopic:
-        return MessageTopic(f"{cls._domain_name}.{cls._message_name}")
+        return cls._topic
 
     @property
     def __version__(cls) -> Version:
         return cls._version
 
+    def upcast_payload(cls, payload: dict) -> dict:
+        """
+        Upcasts raw payload of the previous message version to the current one in place.
+        The version of payload is taken from "class_version" key, 1 by default.
+        Could be applied by event stores to raw rows before constructing messages.
+
+        Raises:
+            ValueError: If there is no upcaster between payload and message versions.
+        """
+        class_version = payload.get("class_version", 1)
+        if class_version == cls._version:
+            return payload
+        upcasters = cls._upcasters[class_version - 1 :] if 1 <= class_version < cls._version else (None,)
+        for version, upcast in enumerate(upcasters, start=class_version):
+            if upcast is None:
+                raise ValueError(f"Could not upcast message {cls.__topic__} from version {version} to {version + 1}")
+            upcast(payload)
+        payload["class_version"] = cls._version
+        return payload
+
     def load(  # type: ignore[misc]
         cls: type[_T],
         payload: Mapping | str | bytes,
         message_id: UUID | None = None,
         timestamp: dt.datetime | None = None,
+        *,
+        trusted: bool = False,
         **kwargs,
     ) -> _T:
-        obj = cls.parse_obj(payload)
+        """
+        Constructs message from payload.
+        Messages of the first version are not upcasted and accept payloads of newer versions,
+        so consumers could be upgraded after producers.
+
+        Args:
+            trusted (bool): Skip validation if payload was validated before, e.g. read from own event store.
+                Message is constructed without validation only when the payload class_version matches
+                the message version, only fields of not json native types are parsed.
+                Otherwise, falls back to validation.
+        """
+        meta = t.cast(BaseDomainMessageMeta, cls)
+        obj = meta._load_object(payload, _get_trusted_fields(meta) if trusted else None)
+        meta._set_loaded_metadata(obj, message_id, timestamp, **kwargs)
+        return obj
+
+    def load_many(  # type: ignore[misc, override]
+        cls: type[_T],
+        items: t.Iterable[Mapping[str, t.Any]],
+        *,
+        trusted: bool = False,
+    ) -> list[_T]:
+        """
+        Constructs messages of this class from many payloads.
+        Class level checks are done once for the whole batch.
+
+        Args:
+            items: Arguments of `load` for each message: "payload" and optional "message_id", "timestamp"
+                and other keyword arguments.
+            trusted (bool): The same as in `load`.
+        """
+        meta = t.cast(BaseDomainMessageMeta, cls)
+        trusted_fields = _get_trusted_fields(meta) if trusted else None
+        load_object = meta._load_object
+        set_metadata = meta._set_loaded_metadata
+        result = []
+        for item in items:
+            kwargs = dict(item)
+            obj = load_object(kwargs.pop("payload"), trusted_fields)
+            set_metadata(obj, **kwargs)
+            result.append(obj)
+        return result
+
+    def _load_object(cls, payload: Mapping | str | bytes, trusted_fields: Optional["_TrustedFields"]):
+        obj = _construct_trusted(cls, payload, trusted_fields) if trusted_fields is not None else None
+        if obj is None:
+            if cls._version != 1 and isinstance(payload, Mapping) and payload.get("class_version", 1) != cls._version:
+                payload = cls.upcast_payload(dict(payload))
+            obj = _validate_model(cls, payload)
+        return obj
+
+    def _set_loaded_metadata(cls, obj, message_id: UUID | None = None, timestamp: dt.datetime | None = None, **kwargs):
         obj._reference = message_id or UUID(str(obj.__message_id__))
         obj._occurred_on = timestamp or obj.__timestamp__
-        return obj
 
 
 class BaseDomainMessage(BaseModel, IMessage, abc.ABC, metaclass=BaseDomainMessageMeta):
     _occurred_on: dt.datetime = PrivateAttr(default_factory=lambda: dt.datetime.utcnow())
-    _reference: UUID = PrivateAttr(default_factory=uuid4)
+    _reference: UUID = PrivateAttr(default_factory=generate_id)
     _version: Version = PrivateAttr(default=Version(1))
 
-    class Config:
-        frozen = True
+    if pydantic_version.startswith("2"):
+        model_config = ConfigDict(frozen=True)
+    else:
+
+        class Config:
+            frozen = True
+            json_dumps = _json_dumps
+            json_loads = serialization.loads
 
     @property
     def __domain__(self) -> str:
@@ -192,25 +399,55 @@ class BaseDomainMessage(BaseModel, IMessage, abc.ABC, metaclass=BaseDomainMessag
         return self._version
 
     def to_dict(self) -> dict:
-        return self.dict()
+        return _dump_model(self)
 
     def to_json(self) -> str:
-        return self.json()
-
-    @root_validator(pre=True, allow_reuse=True)
-    def upcast(cls, values):
-        class_version = values.get("class_version", 1)
-        while class_version != cls._version:
-            next_version = class_version + 1
-            upcast = getattr(cls, f"upcast_v{class_version}_v{next_version}", None)
-            if upcast is None:
-                raise ValueError(
-                    f"Could not upcast message {cls.__domain__}.{cls.__message_name__} "
-                    f"from version {class_version} to {next_version}"
-                )
-            upcast(values)
-            class_version = next_version
-        return values
+        return _dump_model_json(self)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Returns json encoded message without building intermediate string.
+        """
+        return _dump_model_json_bytes(self)
+
+
+class _TrustedFields(t.NamedTuple):
+    names: frozenset[str]
+    required: frozenset[str]
+    parsers: dict[str, t.Callable[[t.Any], t.Any]]
+
+
+def _get_trusted_fields(cls: BaseDomainMessageMeta) -> Optional[_TrustedFields]:
+    if "_trusted_fields" not in cls.__dict__:
+        fields = _get_model_fields(cls)
+        try:
+            parsers = {
+                name: _get_field_parser(annotation)
+                for name, (annotation, _) in fields.items()
+                if not _is_json_native(annotation)
+            }
+        except Exception:
+            cls._trusted_fields = None
+        else:
+            required = frozenset(name for name, (_, is_required) in fields.items() if is_required)
+            cls._trusted_fields = _TrustedFields(frozenset(fields), required, parsers)
+    return cls.__dict__["_trusted_fields"]
+
+
+def _construct_trusted(
+    cls: BaseDomainMessageMeta,
+    payload: Mapping | str | bytes,
+    trusted_fields: _TrustedFields,
+) -> Optional[BaseDomainMessage]:
+    if not isinstance(payload, Mapping) or payload.get("class_version", 1) != cls.__version__:
+        return None
+    if not trusted_fields.required.issubset(payload.keys()):
+        return None
+    values = {key: value for key, value in payload.items() if key in trusted_fields.names}
+    for name, parse in trusted_fields.parsers.items():
+        if name in values:
+            values[name] = parse(values[name])
+    return _construct_model(cls, values)
 
 
 def get_message_class(topic: MessageTopic) -> IMessageMeta:
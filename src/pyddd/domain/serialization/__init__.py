@@ -0,0 +1,19 @@
+from .abstractions import IJsonSerializer
+from .stdlib import StdlibJsonSerializer
+from .backend import (
+    set_json_serializer,
+    get_json_serializer,
+    dumps,
+    dumpb,
+    loads,
+)
+
+__all__ = [
+    "IJsonSerializer",
+    "StdlibJsonSerializer",
+    "set_json_serializer",
+    "get_json_serializer",
+    "dumps",
+    "dumpb",
+    "loads",
+]
@@ -0,0 +1,28 @@
+import abc
+import typing as t
+
+DefaultEncoder = t.Callable[[t.Any], t.Any]
+
+
+class IJsonSerializer(abc.ABC):
+    @abc.abstractmethod
+    def dumps(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> str:
+        """
+        Serialize object to json string.
+
+        Args:
+            obj: Object to serialize.
+            default: Function called for objects that can not be serialized otherwise.
+        """
+
+    @abc.abstractmethod
+    def dumpb(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> bytes:
+        """
+        Serialize object to utf-8 encoded json bytes.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+        """
+        Deserialize json string or bytes to python object.
+        """
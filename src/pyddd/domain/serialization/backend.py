@@ -0,0 +1,35 @@
+import typing as t
+
+from pyddd.domain.serialization.abstractions import (
+    IJsonSerializer,
+    DefaultEncoder,
+)
+from pyddd.domain.serialization.stdlib import StdlibJsonSerializer
+
+__serializer: IJsonSerializer = StdlibJsonSerializer()
+
+
+def set_json_serializer(serializer: IJsonSerializer):
+    """
+    Set json serializer used by messages, JsonDict, event stores and transports.
+    """
+    if not isinstance(serializer, IJsonSerializer):
+        raise TypeError(f"{serializer!r} required be is instance of {IJsonSerializer!r}")
+    global __serializer
+    __serializer = serializer
+
+
+def get_json_serializer() -> IJsonSerializer:
+    return __serializer
+
+
+def dumps(obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> str:
+    return __serializer.dumps(obj, default=default)
+
+
+def dumpb(obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> bytes:
+    return __serializer.dumpb(obj, default=default)
+
+
+def loads(data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+    return __serializer.loads(data)
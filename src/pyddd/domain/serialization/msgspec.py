@@ -0,0 +1,25 @@
+import typing as t
+
+import msgspec
+
+from pyddd.domain.serialization.abstractions import (
+    IJsonSerializer,
+    DefaultEncoder,
+)
+
+
+class MsgspecSerializer(IJsonSerializer):
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> str:
+        return self.dumpb(obj, default=default).decode()
+
+    def dumpb(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> bytes:
+        if default is None:
+            return self._encoder.encode(obj)
+        return msgspec.json.encode(obj, enc_hook=default)
+
+    def loads(self, data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+        return self._decoder.decode(data)
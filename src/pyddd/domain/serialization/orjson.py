@@ -0,0 +1,22 @@
+import typing as t
+
+import orjson
+
+from pyddd.domain.serialization.abstractions import (
+    IJsonSerializer,
+    DefaultEncoder,
+)
+
+
+class OrjsonSerializer(IJsonSerializer):
+    def __init__(self, option: int = orjson.OPT_NON_STR_KEYS):
+        self._option = option
+
+    def dumps(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> str:
+        return orjson.dumps(obj, default=default, option=self._option).decode()
+
+    def dumpb(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> bytes:
+        return orjson.dumps(obj, default=default, option=self._option)
+
+    def loads(self, data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+        return orjson.loads(data)
@@ -0,0 +1,20 @@
+import json
+import typing as t
+
+from pyddd.domain.serialization.abstractions import (
+    IJsonSerializer,
+    DefaultEncoder,
+)
+
+
+class StdlibJsonSerializer(IJsonSerializer):
+    def dumps(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> str:
+        return json.dumps(obj, default=default)
+
+    def dumpb(self, obj: t.Any, *, default: t.Optional[DefaultEncoder] = None) -> bytes:
+        return json.dumps(obj, default=default).encode()
+
+    def loads(self, data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
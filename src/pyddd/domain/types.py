@@ -1,4 +1,3 @@
-import json
 import re
 import typing as t
 import warnings
@@ -7,10 +6,14 @@ from enum import Enum
 from types import MappingProxyType
 import datetime as dt
 
+from pyddd.domain import serialization
+
 
 class DomainName(str):
     """
     DomainName class represents a domain name string. It extends the built-in `str` class and adds validation for domain name format.
+    Domain names are interned: each distinct name and its parents are validated once per process.
+    At most `max_interned` names are kept, further names are validated on every creation.
 
     Attributes:
         part_of (Optional[DomainName]): Gets the parent DomainName of a sub-domain.
@@ -20,18 +23,30 @@ class DomainName(str):
 
     """
 
+    _PATTERN = re.compile(r"^([a-z]|[a-z0-9]-)+$")
+    max_interned: t.ClassVar[int] = 4096
+    _interned: t.ClassVar[dict[str, "DomainName"]] = {}
+    _part_of: "DomainName | None"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
     def __new__(cls, value):
         if isinstance(value, cls):
             return value
-        return super().__new__(cls, value)
-
-    def __init__(self, value: str):
         if not isinstance(value, str):
             raise ValueError(f"Domain name must be subclass of string. Got {value}")
-        items = value.rsplit(".", maxsplit=1)
-        is_subdomain = len(items) != 1
-        self._validate(items[1] if is_subdomain else items[0])
-        self._part_of: DomainName | None = DomainName(items[0]) if is_subdomain else None
+        domain = cls._interned.get(value)
+        if domain is None:
+            domain = super().__new__(cls, value)
+            items = value.rsplit(".", maxsplit=1)
+            is_subdomain = len(items) != 1
+            domain._validate(items[1] if is_subdomain else items[0])
+            domain._part_of = cls(items[0]) if is_subdomain else None
+            if len(cls._interned) < cls.max_interned:
+                domain = cls._interned.setdefault(str(value), domain)
+        return domain
 
     @property
     def part_of(self):
@@ -44,7 +59,7 @@ class DomainName(str):
         return self._part_of
 
     def _validate(self, value: str):
-        if not re.search(r"^([a-z]|[a-z0-9]-)+$", value):
+        if not self._PATTERN.search(value):
             raise ValueError(f'DomainName "{self}" has not allowed symbols in section "{value}"')
 
     def __repr__(self):
@@ -106,8 +121,21 @@ class DomainError(Exception, metaclass=_DomainErrorMeta):
         super().__init__(message)
 
 
+_KEEP, _CONVERT, _MAPPING, _ITERABLE = range(4)
+
+
+class _Frame:
+    __slots__ = ("items", "result", "build", "key")
+
+    def __init__(self, items: t.Iterator, result, build: t.Callable[[t.Iterable], t.Iterable] | None):
+        self.items = items
+        self.result = result
+        self.build = build
+        self.key: t.Any = None
+
+
 class JsonDict(dict):
-    JSON_CONVERTER = json
+    JSON_CONVERTER = serialization
     CONVERTABLE_TYPES = (bool, int, float, str, type(None))
     CONVERTERS: t.Mapping[type, t.Callable[[t.Any], t.Any]] = MappingProxyType(
         {
@@ -119,11 +147,48 @@ class JsonDict(dict):
         {tuple: tuple}
     )
     DEFAULT_ITERABLE_CONVERTER: t.Callable[[t.Iterable], t.Iterable] = list
+    _dispatch: dict[type, tuple[int, t.Callable[[t.Any], t.Any] | None]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
 
     def __init__(self, __obj: t.Mapping | None = None, /, **kwargs):
         result = self._parse_object(kwargs if __obj is None else __obj)
         super().__init__(result)
 
+    @classmethod
+    def _resolve(cls, type_: type) -> tuple[int, t.Callable[[t.Any], t.Any] | None]:
+        """
+        Returns how values of the concrete type are converted. Resolved once per type and class.
+        """
+        try:
+            return cls._dispatch[type_]
+        except KeyError:
+            pass
+        rule: tuple[int, t.Callable[[t.Any], t.Any] | None]
+        if issubclass(type_, cls.CONVERTABLE_TYPES):
+            rule = (_KEEP, None)
+        elif issubclass(type_, tuple(cls.CONVERTERS.keys())):
+            rule = (_CONVERT, next(func for base, func in cls.CONVERTERS.items() if issubclass(type_, base)))
+        elif issubclass(type_, t.Mapping):
+            rule = (_MAPPING, None)
+        elif issubclass(type_, t.Iterable):
+            rule = (_ITERABLE, cls._get_iterable_type(type_))
+        else:
+            rule = (_CONVERT, str)
+        cls._dispatch[type_] = rule
+        return rule
+
+    @classmethod
+    def _get_iterable_type(cls, type_: type) -> t.Callable[[t.Iterable], t.Iterable]:
+        for iterable_type, converter in cls.ITERABLE_CONVERTERS.items():
+            if issubclass(type_, iterable_type):
+                return converter
+        if cls.DEFAULT_ITERABLE_CONVERTER is None:
+            return type_  # pragma: no cover
+        return cls.DEFAULT_ITERABLE_CONVERTER
+
     def _parse_object(self, obj: t.Mapping):
         result = {}
         markers = {id(obj): obj}
@@ -131,50 +196,63 @@ class JsonDict(dict):
             result[key] = self._parse_value(value, markers)
         return result
 
-    def _parse_mapping(self, obj: t.Mapping, markers: dict):
-        marker_id = id(obj)
-        if marker_id in markers:
-            raise ValueError("Circular reference detected")
-        markers[id(obj)] = obj
-
-        result = self.__class__()
-        for key, value in obj.items():
-            dict.__setitem__(result, key, self._parse_value(value, markers))
-        return result
+    def _parse_value(self, value, markers: dict):
+        kind, converter = self._resolve(type(value))
+        if kind == _KEEP:
+            return value
+        if kind == _CONVERT:
+            return converter(value)  # type: ignore[misc]
+        return self._parse_nested(value, kind, converter, markers)
 
-    def _parse_iterable(self, values: t.Iterable, markers) -> t.Iterable:
-        marker_id = id(values)
+    def _open(self, obj, kind: int, converter, markers: dict) -> "_Frame":
+        marker_id = id(obj)
         if marker_id in markers:
             raise ValueError("Circular reference detected")
-        markers[id(values)] = values
-
-        result = [self._parse_value(value, markers) for value in values]
-        return self._get_iterable_type(values)(result)
-
-    def _get_iterable_type(self, values) -> t.Callable[[t.Iterable], t.Iterable]:
-        for type_, converter in self.ITERABLE_CONVERTERS.items():
-            if isinstance(values, type_):
-                return converter
-        if self.DEFAULT_ITERABLE_CONVERTER is None:
-            return type(values)  # pragma: no cover
-        return self.DEFAULT_ITERABLE_CONVERTER
-
-    def _parse_value(self, value, markers: dict):
-        if isinstance(value, self.CONVERTABLE_TYPES):
-            return value
-        elif isinstance(value, tuple(self.CONVERTERS.keys())):
-            return self._parse_other(value)
-        elif isinstance(value, t.Mapping):
-            return self._parse_mapping(value, markers)
-        elif isinstance(value, t.Iterable):
-            return self._parse_iterable(value, markers)
-        else:
-            return str(value)
+        markers[marker_id] = obj
+        if kind == _MAPPING:
+            return _Frame(iter(obj.items()), self.__class__(), None)
+        return _Frame(iter(obj), [], converter)
 
-    def _parse_other(self, value):
-        for type_, converter in self.CONVERTERS.items():
-            if isinstance(value, type_):
-                return converter(value)
+    def _parse_nested(self, obj, kind: int, converter, markers: dict):
+        """
+        Converts nested mappings and iterables with an explicit stack instead of recursion,
+        so the depth of the structure is not limited by the interpreter recursion limit.
+        """
+        resolve = self._resolve
+        stack = [self._open(obj, kind, converter, markers)]
+        while True:
+            frame = stack[-1]
+            result = frame.result
+            is_mapping = frame.build is None
+            for item in frame.items:
+                if is_mapping:
+                    key, value = item
+                else:
+                    value = item
+                kind, converter = resolve(type(value))
+                if kind == _KEEP:
+                    pass
+                elif kind == _CONVERT:
+                    value = converter(value)  # type: ignore[misc]
+                else:
+                    if is_mapping:
+                        frame.key = key
+                    stack.append(self._open(value, kind, converter, markers))
+                    break
+                if is_mapping:
+                    dict.__setitem__(result, key, value)
+                else:
+                    result.append(value)
+            else:
+                stack.pop()
+                value = result if is_mapping else frame.build(result)  # type: ignore[misc]
+                if not stack:
+                    return value
+                parent = stack[-1]
+                if parent.build is None:
+                    dict.__setitem__(parent.result, parent.key, value)
+                else:
+                    parent.result.append(value)
 
     def __repr__(self):
         return super().__repr__()
@@ -207,15 +285,16 @@ class FrozenJsonDict(JsonDict):
 
     def __init__(self, __obj: t.Mapping | None = None, /, **kwargs):
         super().__init__(__obj, **kwargs)
-        self.__hash = hash(str(self))
+        self.__hash: int | None = None
+        self.__json: str | None = None
 
     def __setitem__(self, key, value):
         raise NotImplementedError()
 
     def __str__(self):
-        if not hasattr(self, "__json"):
-            setattr(self, "__json", super().__str__())
-        return getattr(self, "__json")
+        if self.__json is None:
+            self.__json = super().__str__()
+        return self.__json
 
     def update(self, __m=None, **kwargs):
         warnings.warn("Method not implemented", DeprecationWarning, stacklevel=2)
@@ -241,4 +320,10 @@ class FrozenJsonDict(JsonDict):
         raise NotImplementedError()
 
     def __hash__(self):
+        """
+        Structural hash computed on first use. Nested frozen dicts cache their own hashes,
+        so hashing a parent does not walk already hashed children again.
+        """
+        if self.__hash is None:
+            self.__hash = hash(frozenset(self.items()))
         return self.__hash
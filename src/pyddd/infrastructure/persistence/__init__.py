@@ -1,3 +1,6 @@
+import typing as t
+
+from pyddd.lazy import lazy_exports
 from .abstractions import (
     IRepository,
     IUnitOfWorkBuilder,
@@ -5,4 +8,22 @@ from .abstractions import (
     ILocker,
 )
 
-__all__ = ["IRepository", "IRepositoryBuilder", "ILocker", "IUnitOfWorkBuilder"]
+if t.TYPE_CHECKING:
+    from .repository import EventSourcedRepository, AsyncEventSourcedRepository
+
+__all__ = [
+    "IRepository",
+    "IRepositoryBuilder",
+    "ILocker",
+    "IUnitOfWorkBuilder",
+    "EventSourcedRepository",
+    "AsyncEventSourcedRepository",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "EventSourcedRepository": ".repository",
+        "AsyncEventSourcedRepository": ".repository",
+    },
+)
@@ -7,6 +7,7 @@ from pyddd.domain.abstractions import (
     SnapshotProtocol,
     IEvent,
     IESEvent,
+    IESRootEntity,
 )
 
 TLock = t.TypeVar("TLock")
@@ -20,6 +21,15 @@ class IRepository(abc.ABC):
     def commit(self): ...
 
 
+class IRefreshable(abc.ABC):
+    @abc.abstractmethod
+    def refresh(self):
+        """
+        Drop uncommitted changes and reload state changed concurrently.
+        Called by conflict retry before re-running a handler.
+        """
+
+
 class IUnitOfWork(t.Generic[TRepo], abc.ABC):
     @property
     @abc.abstractmethod
@@ -91,6 +101,15 @@ class IEventStore(abc.ABC):
         Optimistic lock checker could be implemented by repository.
         """
 
+    def append_to_streams(self, streams: t.Mapping[str, t.Sequence[IESEvent]]):
+        """
+        Add events to several streams at once.
+        Stores which support transactions should override it to append all events atomically,
+        default implementation appends streams one by one.
+        """
+        for stream_name, events in streams.items():
+            self.append_to_stream(stream_name, events)
+
     @abc.abstractmethod
     def get_stream(
         self,
@@ -119,3 +138,11 @@ class ISnapshotStore(abc.ABC):
         """
         Find latest snapshot from stream.
         """
+
+
+class IProjectionWriter(abc.ABC):
+    @abc.abstractmethod
+    def write(self, entities: t.Sequence[IESRootEntity]):
+        """
+        Write rebuilt entities to read model in bulk.
+        """
@@ -1,4 +1,11 @@
+import typing as t
+
+from pyddd.lazy import lazy_exports
 from .exceptions import OptimisticConcurrencyError, EventStoreError
-from .in_memory import InMemoryStore
+
+if t.TYPE_CHECKING:
+    from .in_memory import InMemoryStore
 
 __all__ = ["OptimisticConcurrencyError", "EventStoreError", "InMemoryStore"]
+
+__getattr__ = lazy_exports(__name__, {"InMemoryStore": ".in_memory"})
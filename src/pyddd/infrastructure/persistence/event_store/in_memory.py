@@ -21,13 +21,24 @@ class InMemoryStore(IEventStore, ISnapshotStore):
         self._snapshots = snapshots if snapshots is not None else {}
 
     def append_to_stream(self, stream_name: str, events: t.Iterable[IESEvent]):
-        stream = self._get_or_create_event_stream(stream_name)
-        for event in events:
-            if event.__entity_version__ in stream:
-                raise OptimisticConcurrencyError(
-                    f"Conflict version of stream {stream_name}. Version {event.__entity_version__} exists"
-                )
-            stream[event.__entity_version__] = event
+        self.append_to_streams({stream_name: list(events)})
+
+    def append_to_streams(self, streams: t.Mapping[str, t.Sequence[IESEvent]]):
+        """
+        Appends all events or none, versions must be new to stored events and unique within the batch.
+        """
+        for stream_name, events in streams.items():
+            versions = set(self._get_or_create_event_stream(stream_name))
+            for event in events:
+                if event.__entity_version__ in versions:
+                    raise OptimisticConcurrencyError(
+                        f"Conflict version of stream {stream_name}. Version {event.__entity_version__} exists"
+                    )
+                versions.add(event.__entity_version__)
+        for stream_name, events in streams.items():
+            stream = self._get_or_create_event_stream(stream_name)
+            for event in events:
+                stream[event.__entity_version__] = event
 
     def get_stream(self, stream_name: str, from_version: int, to_version: int) -> t.Iterable[IESEvent]:
         stream = self._get_or_create_event_stream(stream_name)
@@ -1,9 +1,9 @@
 import abc
 import contextlib
-import json
 import typing as t
 import datetime as dt
 from contextlib import contextmanager
+from itertools import islice
 
 import psycopg_pool
 from psycopg import (
@@ -20,9 +20,11 @@ from psycopg.sql import (
     Identifier,
 )
 
+from pyddd.domain import serialization
 from pyddd.domain.abstractions import (
     SnapshotProtocol,
     IESEvent,
+    IMessageMeta,
     MessageTopic,
 )
 from pyddd.domain.event_sourcing import Snapshot
@@ -181,6 +183,23 @@ class PostgresEventStore(IEventStore, ICanCreateTable):
             except UniqueViolation:
                 raise OptimisticConcurrencyError(f"Conflict version of stream {stream_name}.")
 
+    def append_to_streams(self, streams: t.Mapping[str, t.Sequence[IESEvent]]) -> None:
+        with self._datastore.transaction(commit=True) as cur:
+            try:
+                cur.executemany(
+                    Statements.INSERT_EVENTS.format(
+                        schema=Identifier(self._datastore.schema),
+                        table=Identifier(self._events_table),
+                    ),
+                    (
+                        Converter.event_to_dict(stream_name, event)
+                        for stream_name, events in streams.items()
+                        for event in events
+                    ),
+                )
+            except UniqueViolation:
+                raise OptimisticConcurrencyError(f"Conflict version of streams {', '.join(streams)}.")
+
     def get_stream(self, stream_name: str, from_version: int, to_version: int) -> t.Iterable[IESEvent]:
         with self._datastore.cursor() as cur:
             cur.execute(
@@ -190,7 +209,7 @@ class PostgresEventStore(IEventStore, ICanCreateTable):
                 ),
                 {"stream_id": stream_name, "from_version": from_version, "to_version": to_version},
             )
-            yield from (Converter.event_from_dict(row) for row in cur)
+            yield from Converter.iter_events(cur)
 
     def create_table(self) -> None:
         with self._datastore.get_connection() as conn:
@@ -258,24 +277,81 @@ class Converter:
             "correlation_id": event.__message_id__,
             "domain": event.__domain__,
             "name": event.__message_name__,
-            "state": event.to_json(),
+            "state": cls._dump_state(event),
             "created_at": event.__timestamp__,
         }
 
+    @staticmethod
+    def _dump_state(event: IESEvent) -> str:
+        """
+        States of events past the first version keep their "class_version",
+        so they are loaded without upcasting. Dumps of messages themselves stay without it.
+        """
+        state = event.to_json()
+        version = t.cast(IMessageMeta, type(event)).__version__
+        if version == 1:
+            return state
+        if state == "{}":
+            return f'{{"class_version": {version}}}'
+        return f'{state[:-1]}, "class_version": {version}}}'
+
     @classmethod
     def event_from_dict(cls, data: dict) -> IESEvent:
         topic = MessageTopic(f"{data['domain']}.{data['name']}")
         entity_type = get_message_class(topic)
         event = entity_type.load(
-            payload=json.loads(data["state"]),
+            payload=serialization.loads(data["state"]),
             entity_reference=data["stream_id"],
             entity_version=data["version"],
             message_id=data["correlation_id"],
             timestamp=data["created_at"],
+            trusted=True,
         )
         assert isinstance(event, IESEvent)
         return event
 
+    @classmethod
+    def iter_events(cls, rows: t.Iterable[dict], chunk_size: int = 100) -> t.Iterator[IESEvent]:
+        """
+        Converts rows lazily, reading and decoding at most `chunk_size` rows at once.
+        """
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield from cls.events_from_dicts(chunk)
+
+    @classmethod
+    def events_from_dicts(cls, rows: t.Iterable[dict]) -> list[IESEvent]:
+        """
+        Converts rows in batch keeping their order.
+        Rows are grouped by topic, states of a group are decoded in one pass
+        and events of a group are constructed by one load_many call.
+        """
+        groups: dict[tuple[str, str], list[tuple[int, dict]]] = {}
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            groups.setdefault((row["domain"], row["name"]), []).append((count - 1, row))
+        events: list[t.Any] = [None] * count
+        for (domain, name), group in groups.items():
+            entity_type = get_message_class(MessageTopic(f"{domain}.{name}"))
+            states = serialization.loads(b"[" + b",".join(_as_bytes(row["state"]) for _, row in group) + b"]")
+            loaded = entity_type.load_many(
+                (
+                    {
+                        "payload": state,
+                        "entity_reference": row["stream_id"],
+                        "entity_version": row["version"],
+                        "message_id": row["correlation_id"],
+                        "timestamp": row["created_at"],
+                    }
+                    for (_, row), state in zip(group, states)
+                ),
+                trusted=True,
+            )
+            for (index, _), event in zip(group, loaded):
+                assert isinstance(event, IESEvent)
+                events[index] = event
+        return events
+
     @classmethod
     def snapshot_to_dict(cls, snapshot: SnapshotProtocol) -> dict:
         return {
@@ -295,6 +371,10 @@ class Converter:
         return snapshot
 
 
+def _as_bytes(value: t.Union[str, bytes, memoryview]) -> t.Union[bytes, memoryview]:
+    return value.encode() if isinstance(value, str) else value
+
+
 class Statements:
     CREATE_EVENT_TABLE = SQL(
         """
@@ -352,6 +432,7 @@ class Statements:
         SELECT stream_id, version, domain, name, state, created_at, correlation_id
         FROM {schema}.{table}
         WHERE stream_id = %(stream_id)s AND version BETWEEN %(from_version)s AND %(to_version)s
+        ORDER BY version
         """
     )
 
@@ -0,0 +1,118 @@
+import os
+import sys
+import typing as t
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+
+from pyddd.domain.abstractions import IESRootEntity
+from pyddd.infrastructure.persistence.abstractions import (
+    IEventStore,
+    IProjectionWriter,
+)
+from pyddd.infrastructure.persistence.repository import rehydrate
+
+EventStoreFactory = t.Callable[[], IEventStore]
+ProjectionWriterFactory = t.Callable[[], IProjectionWriter]
+
+
+def get_partition(stream_name: str, partitions: int) -> int:
+    """
+    Stable partition of stream, the same in every process unlike builtin hash.
+    """
+    return zlib.crc32(stream_name.encode()) % partitions
+
+
+def rebuild_streams(
+    stream_names: t.Iterable[str],
+    event_store: IEventStore,
+    writer: IProjectionWriter,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Rehydrate entities of streams and write them in batches.
+    Returns number of written entities.
+    """
+    batch: list[IESRootEntity] = []
+    count = 0
+    for stream_name in stream_names:
+        entity = rehydrate(None, event_store.get_stream(stream_name, from_version=1, to_version=sys.maxsize))
+        if entity is None:
+            continue
+        batch.append(entity)
+        if len(batch) >= batch_size:
+            writer.write(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        writer.write(batch)
+        count += len(batch)
+    return count
+
+
+def _rebuild_partition(
+    event_store_factory: EventStoreFactory,
+    writer_factory: ProjectionWriterFactory,
+    stream_names: list[str],
+    batch_size: int,
+) -> int:
+    return rebuild_streams(stream_names, event_store_factory(), writer_factory(), batch_size)
+
+
+class ProjectionRebuilder:
+    """
+    Rebuilds read model from event streams in parallel processes.
+
+    Streams are partitioned by stable hash of stream name, each partition is rehydrated
+    by one worker process which reads events through its own event store and writes
+    entities in batches through its own projection writer.
+    Factories are sent to worker processes, so they must be picklable,
+    e.g. module level functions or `functools.partial` of them.
+    """
+
+    def __init__(
+        self,
+        event_store_factory: EventStoreFactory,
+        writer_factory: ProjectionWriterFactory,
+        *,
+        max_workers: t.Optional[int] = None,
+        partitions: t.Optional[int] = None,
+        batch_size: int = 1000,
+        mp_context: t.Optional[BaseContext] = None,
+    ):
+        self._event_store_factory = event_store_factory
+        self._writer_factory = writer_factory
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._partitions = partitions or self._max_workers
+        self._batch_size = batch_size
+        self._mp_context = mp_context
+
+    def partition(self, stream_names: t.Iterable[str]) -> list[list[str]]:
+        partitions: list[list[str]] = [[] for _ in range(self._partitions)]
+        for stream_name in stream_names:
+            partitions[get_partition(stream_name, self._partitions)].append(stream_name)
+        return partitions
+
+    def rebuild(self, stream_names: t.Iterable[str]) -> int:
+        """
+        Rebuild read model of streams.
+        Returns number of written entities.
+        """
+        partitions = [partition for partition in self.partition(stream_names) if partition]
+        if not partitions:
+            return 0
+        with ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(partitions)),
+            mp_context=self._mp_context,
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _rebuild_partition,
+                    self._event_store_factory,
+                    self._writer_factory,
+                    partition,
+                    self._batch_size,
+                )
+                for partition in partitions
+            ]
+            return sum(future.result() for future in futures)
@@ -0,0 +1,211 @@
+import asyncio
+import sys
+import typing as t
+
+from pyddd.domain.abstractions import (
+    IdType,
+    IESEvent,
+    SnapshotProtocol,
+)
+from pyddd.domain.event_sourcing import RootEntity
+from pyddd.infrastructure.persistence.abstractions import (
+    IRepository,
+    IEventStore,
+    ISnapshotStore,
+    IRefreshable,
+)
+
+TEntity = t.TypeVar("TEntity", bound=RootEntity)
+
+
+def rehydrate(entity: t.Optional[TEntity], events: t.Iterable[IESEvent]) -> t.Optional[TEntity]:
+    """
+    Restores entity from events following its state.
+    If entity is None, it is created by the first event.
+    Returns None if there is neither entity nor events.
+    """
+    events = list(events)
+    if entity is None:
+        if not events:
+            return None
+        entity = t.cast(TEntity, events[0].mutate(None))
+        events = events[1:]
+    return t.cast(TEntity, entity.replay(events))
+
+
+class _EventSourcedRepository(t.Generic[TEntity]):
+    def __init__(
+        self,
+        entity_type: type[TEntity],
+        event_store: IEventStore,
+        snapshot_store: t.Optional[ISnapshotStore] = None,
+        snapshot_interval: t.Optional[int] = None,
+    ):
+        """
+        Args:
+            entity_type: root entity restored from snapshots.
+            event_store: store of entity events, stream name is the entity reference.
+            snapshot_store: store of snapshots, entities are loaded from the latest snapshot plus tail events.
+            snapshot_interval: take snapshot on commit each time entity version passes a multiple of interval.
+        """
+        if snapshot_interval is not None and (snapshot_store is None or snapshot_interval <= 0):
+            raise ValueError("snapshot_interval requires snapshot_store and must be positive")
+        self._entity_type = entity_type
+        self._events = event_store
+        self._snapshots = snapshot_store
+        self._interval = snapshot_interval
+        self._seen: dict[str, TEntity] = {}
+        self._bases: dict[str, t.Optional[SnapshotProtocol]] = {}
+
+    def add(self, entity: TEntity):
+        """
+        Track entity, its new events will be appended on commit.
+        """
+        stream_name = str(entity.__reference__)
+        self._seen[stream_name] = entity
+        self._bases.setdefault(stream_name, None)
+
+    def _get_seen(self, reference: IdType) -> t.Optional[TEntity]:
+        return self._seen.get(str(reference))
+
+    def _load(self, reference: IdType) -> t.Optional[TEntity]:
+        stream_name = str(reference)
+        snapshot = self._snapshots.get_last_snapshot(stream_name) if self._snapshots is not None else None
+        from_version = snapshot.__entity_version__ + 1 if snapshot is not None else 1
+        events = list(self._events.get_stream(stream_name, from_version=from_version, to_version=sys.maxsize))
+        entity = self._restore_entity(snapshot, events)
+        if entity is not None:
+            self._seen[stream_name] = entity
+            self._bases[stream_name] = entity.snapshot() if events else snapshot
+        return entity
+
+    def _restore_entity(self, snapshot: t.Optional[SnapshotProtocol], events: list[IESEvent]) -> t.Optional[TEntity]:
+        entity = self._entity_type.from_snapshot(snapshot) if snapshot is not None else None
+        return rehydrate(entity, events)
+
+    def _refresh(self):
+        """
+        Entities without uncommitted changes are caught up in place,
+        changed entities are restored from the in-memory snapshot of their committed state.
+        Either way only events after the committed version are read and replayed.
+        """
+        for stream_name, seen in list(self._seen.items()):
+            snapshot = self._bases[stream_name]
+            entity: t.Optional[TEntity] = seen
+            if list(seen.collect_events()):
+                entity = self._entity_type.from_snapshot(snapshot) if snapshot is not None else None
+            version = entity.__version__ if entity is not None else 0
+            events = list(self._events.get_stream(stream_name, from_version=version + 1, to_version=sys.maxsize))
+            entity = rehydrate(entity, events)
+            if entity is None:
+                del self._seen[stream_name], self._bases[stream_name]
+                continue
+            self._seen[stream_name] = entity
+            if events:
+                self._bases[stream_name] = entity.snapshot()
+
+    def _committed(self, changes: dict[str, tuple[TEntity, list[IESEvent]]]):
+        for stream_name, (entity, _) in changes.items():
+            self._bases[stream_name] = entity.snapshot()
+
+    def _collect(self) -> dict[str, tuple[TEntity, list[IESEvent]]]:
+        changes = {}
+        for stream_name, entity in self._seen.items():
+            events = list(entity.collect_events())
+            if events:
+                changes[stream_name] = (entity, events)
+        return changes
+
+    @staticmethod
+    def _restore(changes: dict[str, tuple[TEntity, list[IESEvent]]]):
+        for entity, events in changes.values():
+            pending = list(entity.collect_events())
+            for event in [*events, *pending]:
+                entity.register_event(event)
+
+    def _iter_snapshots(self, changes: dict[str, tuple[TEntity, list[IESEvent]]]):
+        if self._interval is None:
+            return
+        for stream_name, (entity, events) in changes.items():
+            previous_version = events[0].__entity_version__ - 1
+            if entity.__version__ // self._interval > previous_version // self._interval:
+                yield stream_name, t.cast(SnapshotProtocol, self._bases[stream_name])
+
+
+class EventSourcedRepository(_EventSourcedRepository[TEntity], IRepository, IRefreshable):
+    """
+    Repository of event sourced root entities.
+
+    Loaded and added entities are tracked, commit appends new events of all changed entities
+    by one `IEventStore.append_to_streams` call.
+    """
+
+    def get(self, reference: IdType) -> t.Optional[TEntity]:
+        """
+        Get entity by reference, loading it from the latest snapshot plus tail events.
+        Returns None if entity has no events.
+        """
+        entity = self._get_seen(reference)
+        if entity is not None:
+            return entity
+        return self._load(reference)
+
+    def refresh(self):
+        """
+        Drop uncommitted changes and catch tracked entities up with the store.
+        Only events appended after the last load, commit or refresh are read and replayed.
+        """
+        self._refresh()
+
+    def commit(self):
+        changes = self._collect()
+        if not changes:
+            return
+        try:
+            self._events.append_to_streams({stream_name: events for stream_name, (_, events) in changes.items()})
+        except Exception:
+            self._restore(changes)
+            raise
+        self._committed(changes)
+        for stream_name, snapshot in self._iter_snapshots(changes):
+            t.cast(ISnapshotStore, self._snapshots).add_snapshot(stream_name, snapshot)
+
+
+class AsyncEventSourcedRepository(_EventSourcedRepository[TEntity], IRepository, IRefreshable):
+    """
+    Asyncio variant of `EventSourcedRepository`.
+    Calls of blocking stores are executed in a worker thread.
+    """
+
+    async def get(self, reference: IdType) -> t.Optional[TEntity]:
+        """
+        Get entity by reference, loading it from the latest snapshot plus tail events.
+        Returns None if entity has no events.
+        """
+        entity = self._get_seen(reference)
+        if entity is not None:
+            return entity
+        return await asyncio.to_thread(self._load, reference)
+
+    async def refresh(self):
+        """
+        Drop uncommitted changes and catch tracked entities up with the store.
+        Only events appended after the last load, commit or refresh are read and replayed.
+        """
+        await asyncio.to_thread(self._refresh)
+
+    async def commit(self):
+        changes = self._collect()
+        if not changes:
+            return
+        try:
+            await asyncio.to_thread(
+                self._events.append_to_streams,
+                {stream_name: events for stream_name, (_, events) in changes.items()},
+            )
+        except Exception:
+            self._restore(changes)
+            raise
+        self._committed(changes)
+        for stream_name, snapshot in self._iter_snapshots(changes):
+            await asyncio.to_thread(t.cast(ISnapshotStore, self._snapshots).add_snapshot, stream_name, snapshot)
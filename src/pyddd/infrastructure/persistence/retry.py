@@ -0,0 +1,90 @@
+import asyncio
+import functools
+import inspect
+import random
+import time
+import typing as t
+
+from pyddd.application.abstractions import (
+    AnyCallable,
+    IRetryStrategy,
+)
+from pyddd.application.dependency import get_message_scope
+from pyddd.infrastructure.persistence.abstractions import IRefreshable
+from pyddd.infrastructure.persistence.event_store import OptimisticConcurrencyError
+
+
+class ConflictRetry(IRetryStrategy):
+    """
+    Re-runs handler when commit fails with optimistic concurrency conflict.
+
+    Before every next attempt refreshable dependencies of the handler, e.g. event sourced repositories,
+    are refreshed, so they drop failed changes and read only events appended concurrently.
+    Dependencies created by providers are found in the message scope shared by all attempts.
+    Attempts are delayed by exponential backoff with full jitter.
+    Works with sync and async handlers.
+    """
+
+    def __init__(
+        self,
+        max_tries: int = 5,
+        base_delay: float = 0.01,
+        max_delay: float = 1.0,
+        exceptions: tuple[type[Exception], ...] = (OptimisticConcurrencyError,),
+    ):
+        if max_tries < 1:
+            raise ValueError("max_tries must be positive")
+        self._max_tries = max_tries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._exceptions = exceptions
+
+    def __call__(self, func: AnyCallable) -> AnyCallable:
+        if inspect.iscoroutinefunction(func):
+            return self._wrap_async(func)
+        return self._wrap_sync(func)
+
+    def _wrap_sync(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, self._max_tries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except self._exceptions:
+                    if attempt == self._max_tries:
+                        raise
+                for dependency in self._get_refreshable(func, kwargs):
+                    dependency.refresh()
+                time.sleep(self._get_delay(attempt))
+
+        return wrapper
+
+    def _wrap_async(self, func: AnyCallable) -> AnyCallable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, self._max_tries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except self._exceptions:
+                    if attempt == self._max_tries:
+                        raise
+                for dependency in self._get_refreshable(func, kwargs):
+                    result = dependency.refresh()
+                    if inspect.isawaitable(result):
+                        await result
+                await asyncio.sleep(self._get_delay(attempt))
+
+        return wrapper
+
+    def _get_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _get_refreshable(func: AnyCallable, kwargs: dict[str, t.Any]) -> list[IRefreshable]:
+        scope = get_message_scope()
+        dependencies = {
+            **(scope.dependencies if scope is not None else {}),
+            **getattr(inspect.unwrap(func), "keywords", {}),
+            **kwargs,
+        }
+        return [value for value in dependencies.values() if isinstance(value, IRefreshable)]
@@ -1,3 +1,10 @@
-from .redis import RedisPubSubConsumer, RedisPubSubPublisher, RedisStreamPublisher, RedisStreamGroupConsumer
+import typing as t
+
+from pyddd.lazy import lazy_exports
+
+if t.TYPE_CHECKING:
+    from .redis import RedisPubSubConsumer, RedisPubSubPublisher, RedisStreamPublisher, RedisStreamGroupConsumer
 
 __all__ = ["RedisStreamPublisher", "RedisStreamGroupConsumer", "RedisPubSubConsumer", "RedisPubSubPublisher"]
+
+__getattr__ = lazy_exports(__name__, {name: ".redis" for name in __all__})
@@ -1,4 +1,5 @@
 from .abstractions import (
+    IBatchCallback,
     ICallback,
     INotificationQueue,
     IMessageHandler,
@@ -10,6 +11,7 @@ from .notification import PublishedMessage
 from .queue import NotificationQueue
 
 __all__ = [
+    "IBatchCallback",
     "ICallback",
     "INotificationQueue",
     "IMessageHandler",
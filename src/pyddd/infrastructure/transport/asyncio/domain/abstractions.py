@@ -25,15 +25,41 @@ class IAskPolicy(abc.ABC):
         application: IApplication,
     ): ...
 
+    async def process_many(
+        self,
+        notifications: t.Sequence[IPublishedMessage],
+        event_factory: IEventFactory,
+        application: IApplication,
+    ):
+        """
+        Process batch of notifications, acking or rejecting each of them.
+        """
+        for notification in notifications:
+            await self.process(notification, event_factory, application)
+
 
 class ICallback(t.Protocol):
     async def __call__(self, message: IPublishedMessage): ...
 
 
+class IBatchCallback(t.Protocol):
+    async def __call__(self, messages: t.Sequence[IPublishedMessage]): ...
+
+
 class INotificationQueue(abc.ABC):
     @abc.abstractmethod
     async def consume(self, callback: ICallback): ...
 
+    async def consume_many(self, callback: IBatchCallback):
+        """
+        Consume messages by batches read from topics.
+        """
+
+        async def consume_one(message: IPublishedMessage):
+            await callback([message])
+
+        await self.consume(consume_one)
+
     @abc.abstractmethod
     async def bind(self, topic: str): ...
 
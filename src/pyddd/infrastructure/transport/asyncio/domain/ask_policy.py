@@ -1,6 +1,9 @@
 import logging
+import typing as t
 
 from pyddd.application.abstractions import IApplication
+from pyddd.application.exceptions import HandlerTimeout
+from pyddd.domain.abstractions import IMessage
 from pyddd.infrastructure.transport.asyncio.domain.abstractions import (
     IAskPolicy,
     IEventFactory,
@@ -9,8 +12,15 @@ from pyddd.infrastructure.transport.asyncio.domain.abstractions import (
 
 
 class DefaultAskPolicy(IAskPolicy):
-    def __init__(self, logger_name: str = "pyddd.transport.ask_policy"):
+    def __init__(self, logger_name: str = "pyddd.transport.ask_policy", requeue_partial_timeouts: bool = False):
+        """
+        Args:
+            requeue_partial_timeouts: requeue message when some of its handlers timed out and others succeeded.
+                Successful handlers are run again on redelivery, so they must be idempotent.
+                By default such message is acked and only messages without successful handlers are requeued.
+        """
         self._logger = logging.getLogger(logger_name)
+        self._requeue_partial_timeouts = requeue_partial_timeouts
 
     async def process(
         self,
@@ -18,8 +28,44 @@ class DefaultAskPolicy(IAskPolicy):
         event_factory: IEventFactory,
         application: IApplication,
     ):
+        event = await self._build_event(notification, event_factory)
+        if event is None:
+            return
+
+        try:
+            results = await application.handle(event)
+            await self._ask(notification, event, results)
+        except Exception as exc:
+            self._logger.error(f"Error when handling notification {event}", exc_info=exc)
+
+    async def process_many(
+        self,
+        notifications: t.Sequence[IPublishedMessage],
+        event_factory: IEventFactory,
+        application: IApplication,
+    ):
+        built = []
+        for notification in notifications:
+            event = await self._build_event(notification, event_factory)
+            if event is not None:
+                built.append((notification, event))
+        if not built:
+            return
+
+        try:
+            results = await application.handle_many([event for _, event in built])
+        except Exception as exc:
+            self._logger.error(f"Error when handling {len(built)} notifications", exc_info=exc)
+            return
+        for (notification, event), event_results in zip(built, results):
+            try:
+                await self._ask(notification, event, event_results)
+            except Exception as exc:
+                self._logger.error(f"Error when handling notification {event}", exc_info=exc)
+
+    async def _build_event(self, notification: IPublishedMessage, event_factory: IEventFactory) -> t.Optional[IMessage]:
         try:
-            event = event_factory.build_event(notification)
+            return event_factory.build_event(notification)
         except Exception as e:
             self._logger.critical(
                 "Fail build event from message %s by reason: %s(%s)",
@@ -29,21 +75,21 @@ class DefaultAskPolicy(IAskPolicy):
                 exc_info=e,
             )
             await notification.reject(requeue=False)
-            return
+            return None
 
-        try:
-            results = await application.handle(event)
-            if len(results) == 0:
-                self._logger.warning("Rejecting message %s by reason: %s", event, "Not handled")
-                await notification.reject(requeue=False)
-            elif all((isinstance(result, Exception) for result in results)):
-                self._logger.exception(
-                    "Requeue message %s by reason: %s",
-                    event,
-                    "All handlers finished with exception",
-                )
-                await notification.reject(requeue=True)
-            else:
-                await notification.ack()
-        except Exception as exc:
-            self._logger.error(f"Error when handling notification {event}", exc_info=exc)
+    async def _ask(self, notification: IPublishedMessage, event: IMessage, results: list):
+        if len(results) == 0:
+            self._logger.warning("Rejecting message %s by reason: %s", event, "Not handled")
+            await notification.reject(requeue=False)
+        elif all((isinstance(result, Exception) for result in results)):
+            self._logger.exception(
+                "Requeue message %s by reason: %s",
+                event,
+                "All handlers finished with exception",
+            )
+            await notification.reject(requeue=True)
+        elif self._requeue_partial_timeouts and any(isinstance(result, HandlerTimeout) for result in results):
+            self._logger.warning("Requeue message %s by reason: %s", event, "Handler timed out")
+            await notification.reject(requeue=True)
+        else:
+            await notification.ack()
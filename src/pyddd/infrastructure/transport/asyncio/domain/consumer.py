@@ -20,8 +20,16 @@ class MessageConsumer(IMessageConsumer):
         queue: INotificationQueue,
         ask_policy: IAskPolicy,
         event_factory: IEventFactory,
+        *,
+        batch: bool = False,
     ):
+        """
+        Args:
+            batch: Pass every batch read by queue to `IAskPolicy.process_many`,
+                so handlers of the whole batch are dispatched by one `Application.handle_many` call.
+        """
         self._queue = queue
+        self._batch = batch
         self._ask_policy = ask_policy
         self._application: t.Optional[IApplication] = None
         self._subscriptions: set[str] = set()
@@ -48,7 +56,10 @@ class MessageConsumer(IMessageConsumer):
             await self._queue.bind(topic)
 
     async def _after_run_handler(self, _signal: ApplicationSignal, _app: IApplication):
-        await self._queue.consume(self._ask_message)
+        if self._batch:
+            await self._queue.consume_many(self._ask_messages)
+        else:
+            await self._queue.consume(self._ask_message)
 
     async def _before_stop_handler(self, _signal: ApplicationSignal, _app: IApplication):
         await self._queue.stop_consume()
@@ -64,3 +75,11 @@ class MessageConsumer(IMessageConsumer):
                 event_factory=self._event_factory,
                 application=self._application,
             )
+
+    async def _ask_messages(self, messages: t.Sequence[IPublishedMessage]):
+        if self._application:
+            await self._ask_policy.process_many(
+                notifications=messages,
+                event_factory=self._event_factory,
+                application=self._application,
+            )
@@ -10,6 +10,8 @@ async def _mock_ask(*args, **kwargs):
 
 
 class PublishedMessage(IPublishedMessage):
+    __slots__ = ("_reference", "_name", "_payload", "_ask_func", "_reject_func")
+
     def __init__(
         self,
         message_id: str,
@@ -5,6 +5,7 @@ from pyddd.infrastructure.transport.asyncio.domain.abstractions import (
     INotificationQueue,
     IMessageHandler,
     ICallback,
+    IBatchCallback,
 )
 
 
@@ -35,6 +36,15 @@ class NotificationQueue(INotificationQueue):
             task = asyncio.create_task(self._long_pull(topic, callback))
             self._tasks.append(task)
 
+    async def consume_many(self, callback: IBatchCallback):
+        """
+        Every read batch is passed to callback at once in its own task.
+        """
+        self._running = True
+        for topic in self._topics:
+            task = asyncio.create_task(self._long_pull_many(topic, callback))
+            self._tasks.append(task)
+
     async def stop_consume(self):
         self._running = False
         for task in self._tasks:
@@ -49,3 +59,13 @@ class NotificationQueue(INotificationQueue):
             except Exception as exc:
                 self._logger.error(f"Unexpected error while pulling {topic} messages!", exc_info=exc)
             await asyncio.sleep(self._delay_ms)
+
+    async def _long_pull_many(self, topic: str, callback: IBatchCallback):
+        while self._running:
+            try:
+                messages = await self._handler.read(topic, limit=self._batch_size)
+                if messages:
+                    asyncio.create_task(callback(messages))
+            except Exception as exc:
+                self._logger.error(f"Unexpected error while pulling {topic} messages!", exc_info=exc)
+            await asyncio.sleep(self._delay_ms)
@@ -1,13 +1,13 @@
 import asyncio
-import json
 import logging
 import typing as t
-import uuid
 
 from redis.asyncio import Redis
 from redis.asyncio.client import PubSub
 
 from pyddd.application.abstractions import IApplication
+from pyddd.domain import serialization
+from pyddd.domain.identity import generate_id
 from pyddd.infrastructure.transport.core.abstractions import (
     IMessageConsumer,
     IEventFactory,
@@ -86,9 +86,9 @@ class PubSubNotificationQueue(INotificationQueue):
                 async for message in self._pubsub.listen():
                     if message["type"] == "message":
                         notification = PublishedMessage(
-                            message_id=str(uuid.uuid4()),
+                            message_id=str(generate_id()),
                             name=message["channel"].decode(),
-                            payload=json.loads(message["data"]),
+                            payload=serialization.loads(message["data"]),
                         )
                         await callback(notification)
             except Exception as exc:
@@ -7,6 +7,8 @@ from pyddd.infrastructure.transport.core.value_objects import TrackerState
 
 
 class IPublishingMessage(abc.ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def message_id(self) -> str: ...
@@ -21,6 +23,8 @@ class IPublishingMessage(abc.ABC):
 
 
 class IPublishedMessage(IPublishingMessage, abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def ack(self): ...
 
@@ -37,6 +41,8 @@ class IEventFactory(abc.ABC):
 
 
 class ITracker(abc.ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def last_recent_message_id(self): ...
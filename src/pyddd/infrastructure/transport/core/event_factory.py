@@ -1,7 +1,6 @@
 import datetime as dt
-import json
-import uuid
 
+from pyddd.domain.identity import generate_id
 from pyddd.domain.message import (
     Message,
 )
@@ -18,13 +17,15 @@ from pyddd.infrastructure.transport.core.value_objects import PublishedEvent
 
 
 class UniversalPublishingMessage(IPublishingMessage):
+    __slots__ = ("_message_id", "_full_name", "_payload")
+
     def __init__(
         self,
         full_name: str,
         payload: dict,
         message_id: str = None,
     ):
-        self._message_id = message_id or str(uuid.uuid4())
+        self._message_id = message_id or str(generate_id())
         self._full_name = full_name
         self._payload = payload
 
@@ -64,7 +65,7 @@ class PublishedEventFactory(IEventFactory):
             full_name=published_event.full_event_name,
             message_id=published_event.message_id,
             message_type=MessageType.EVENT,
-            payload=json.loads(published_event.payload),
+            payload=published_event.payload,
             occurred_on=dt.datetime.fromtimestamp(float(published_event.timestamp)),
         )
 
@@ -18,6 +18,7 @@ class EventPublisherModule(IModule):
     def __init__(self, publisher: PublisherProtocol):
         self._publisher = publisher
         self._events: set[str] = set()
+        self._subscriptions_listener: t.Optional[t.Callable[[], None]] = None
 
     @property
     def domain(self) -> str:
@@ -27,7 +28,11 @@ class EventPublisherModule(IModule):
         pass
 
     def register(self, event_topic: str):
+        if event_topic in self._events:
+            return
         self._events.add(event_topic)
+        if self._subscriptions_listener is not None:
+            self._subscriptions_listener()
 
     def get_command_handler(self, command: IMessage) -> AnyCallable:
         raise NotImplementedError()
@@ -39,3 +44,6 @@ class EventPublisherModule(IModule):
 
     def get_subscriptions(self) -> set[str]:
         return set(self._events)
+
+    def set_subscriptions_listener(self, listener: t.Callable[[], None]):
+        self._subscriptions_listener = listener
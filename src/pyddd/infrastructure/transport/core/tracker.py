@@ -21,6 +21,8 @@ class DefaultTrackerStrategy(ITrackerStrategy):
 
 
 class Tracker(ITracker):
+    __slots__ = ("_strategy", "_tracker")
+
     def __init__(
         self,
         track_key: str,
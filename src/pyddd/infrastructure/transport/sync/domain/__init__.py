@@ -1,4 +1,5 @@
 from .abstractions import (
+    IBatchCallback,
     ICallback,
     INotificationQueue,
     IMessageHandler,
@@ -15,6 +16,7 @@ __all__ = [
     "PublishedMessage",
     "NotificationQueue",
     "IAskPolicy",
+    "IBatchCallback",
     "ICallback",
     "INotificationQueue",
     "IMessageHandler",
@@ -25,15 +25,37 @@ class IAskPolicy(abc.ABC):
         application: IApplication,
     ): ...
 
+    def process_many(
+        self,
+        notifications: t.Sequence[IPublishedMessage],
+        event_factory: IEventFactory,
+        application: IApplication,
+    ):
+        """
+        Process batch of notifications, acking or rejecting each of them.
+        """
+        for notification in notifications:
+            self.process(notification, event_factory, application)
+
 
 class ICallback(t.Protocol):
     def __call__(self, message: IPublishedMessage): ...
 
 
+class IBatchCallback(t.Protocol):
+    def __call__(self, messages: t.Sequence[IPublishedMessage]): ...
+
+
 class INotificationQueue(abc.ABC):
     @abc.abstractmethod
     def consume(self, callback: ICallback): ...
 
+    def consume_many(self, callback: IBatchCallback):
+        """
+        Consume messages by batches read from topics.
+        """
+        self.consume(lambda message: callback([message]))
+
     @abc.abstractmethod
     def bind(self, topic: str): ...
 
@@ -19,8 +19,16 @@ class MessageConsumer(IMessageConsumer):
         queue: INotificationQueue,
         ask_policy: IAskPolicy,
         event_factory: IEventFactory,
+        *,
+        batch: bool = False,
     ):
+        """
+        Args:
+            batch: Pass every batch read by queue to `IAskPolicy.process_many`,
+                so handlers of the whole batch are dispatched by one `Application.handle_many` call.
+        """
         self._queue = queue
+        self._batch = batch
         self._ask_policy = ask_policy
         self._application: t.Optional[IApplication] = None
         self._subscriptions: set[str] = set()
@@ -46,7 +54,10 @@ class MessageConsumer(IMessageConsumer):
             self._queue.bind(topic)
 
     def _after_run_handler(self, _signal: ApplicationSignal, _app: IApplication):
-        self._queue.consume(self._ask_message)
+        if self._batch:
+            self._queue.consume_many(self._ask_messages)
+        else:
+            self._queue.consume(self._ask_message)
 
     def _before_stop_handler(self, _signal: ApplicationSignal, _app: IApplication):
         self._queue.stop_consume()
@@ -60,3 +71,11 @@ class MessageConsumer(IMessageConsumer):
                 event_factory=self._event_factory,
                 application=self._application,
             )
+
+    def _ask_messages(self, messages: t.Sequence[IPublishedMessage]):
+        if self._application:
+            self._ask_policy.process_many(
+                notifications=messages,
+                event_factory=self._event_factory,
+                application=self._application,
+            )
@@ -6,6 +6,7 @@ from pyddd.infrastructure.transport.sync.domain.abstractions import (
     INotificationQueue,
     IMessageHandler,
     ICallback,
+    IBatchCallback,
 )
 
 
@@ -31,10 +32,19 @@ class NotificationQueue(INotificationQueue):
         self._handler.bind(topic)
 
     def consume(self, callback: ICallback):
+        self._start(self._long_pull, callback)
+
+    def consume_many(self, callback: IBatchCallback):
+        """
+        Every read batch is passed to callback at once in its own thread.
+        """
+        self._start(self._long_pull_many, callback)
+
+    def _start(self, target, callback):
         self._is_running = True
         for topic in self._topics:
             thread = threading.Thread(
-                target=self._long_pull,
+                target=target,
                 args=(
                     topic,
                     callback,
@@ -65,6 +75,22 @@ class NotificationQueue(INotificationQueue):
                 self._logger.error(f"Unexpected error while pulling {topic} messages!", exc_info=exc)
             time.sleep(self._delay_ms)
 
+    def _long_pull_many(self, topic: str, callback: IBatchCallback):
+        while self._is_running:
+            try:
+                messages = self._handler.read(topic, limit=self._batch_size)
+                if messages:
+                    thread = threading.Thread(
+                        target=self._process_callback,
+                        args=(callback, messages),
+                        daemon=True,
+                    )
+                    self._threads.append(thread)
+                    thread.start()
+            except Exception as exc:
+                self._logger.error(f"Unexpected error while pulling {topic} messages!", exc_info=exc)
+            time.sleep(self._delay_ms)
+
     def _process_callback(self, callback, message):
         try:
             callback(message)
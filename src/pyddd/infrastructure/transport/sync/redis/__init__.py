@@ -1,12 +1,24 @@
-from .pubsub import (
-    RedisPubSubConsumer,
-    RedisPubSubPublisher,
-)
-from .stream_group import RedisStreamGroupConsumer, RedisStreamPublisher
+import typing as t
+
+from pyddd.lazy import lazy_exports
+
+if t.TYPE_CHECKING:
+    from .pubsub import RedisPubSubConsumer, RedisPubSubPublisher
+    from .stream_group import RedisStreamGroupConsumer, RedisStreamPublisher
 
 __all__ = [
-    "RedisPubSubPublisher",
     "RedisPubSubConsumer",
+    "RedisPubSubPublisher",
     "RedisStreamPublisher",
     "RedisStreamGroupConsumer",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "RedisPubSubConsumer": ".pubsub",
+        "RedisPubSubPublisher": ".pubsub",
+        "RedisStreamPublisher": ".stream_group",
+        "RedisStreamGroupConsumer": ".stream_group",
+    },
+)
@@ -1,14 +1,14 @@
-import json
 import logging
 import threading
 import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 from redis import Redis
 from redis.client import PubSub
 
 from pyddd.application.abstractions import IApplication
+from pyddd.domain import serialization
+from pyddd.domain.identity import generate_id
 from pyddd.infrastructure.transport.core.abstractions import (
     IMessageConsumer,
     IEventFactory,
@@ -92,9 +92,9 @@ class PubSubNotificationQueue(INotificationQueue):
                 for message in self._pubsub.listen():
                     if message["type"] == "message":
                         notification = PublishedMessage(
-                            message_id=str(uuid.uuid4()),
+                            message_id=str(generate_id()),
                             name=message["channel"].decode(),
-                            payload=json.loads(message["data"]),
+                            payload=serialization.loads(message["data"]),
                         )
                         threading.Thread(target=callback, args=(notification,), daemon=True).start()
             except Exception as exc:
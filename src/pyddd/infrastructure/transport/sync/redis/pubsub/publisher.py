@@ -1,4 +1,3 @@
-import json
 import logging
 
 from redis import Redis
@@ -6,6 +5,7 @@ from pyddd.application.abstractions import (
     IApplication,
     ApplicationSignal,
 )
+from pyddd.domain import serialization
 from pyddd.domain.abstractions import IMessage
 from pyddd.infrastructure.transport.core.abstractions import IEventFactory
 from pyddd.infrastructure.transport.core.event_factory import (
@@ -48,7 +48,7 @@ class RedisPubSubPublisher:
         try:
             self._client.publish(
                 channel=message.__topic__,
-                message=json.dumps(notification.payload),
+                message=serialization.dumpb(notification.payload),
             )
         except Exception as exc:
             self._logger.critical(f"Failed to publish message {message.__topic__}", exc_info=exc)
@@ -45,6 +45,7 @@ class RedisStreamGroupConsumer(IMessageConsumer):
         event_factory: IEventFactory = None,
         ask_policy: IAskPolicy = None,
         block_ms: int = 0,
+        batch: bool = False,
     ):
         self._ask_policy = ask_policy or DefaultAskPolicy()
         self._event_factory = event_factory or PublishedEventFactory()
@@ -61,6 +62,7 @@ class RedisStreamGroupConsumer(IMessageConsumer):
             queue=self._queue,
             event_factory=self._event_factory,
             ask_policy=self._ask_policy,
+            batch=batch,
         )
 
     def subscribe(self, topic: str):
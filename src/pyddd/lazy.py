@@ -0,0 +1,24 @@
+import importlib
+import sys
+import typing as t
+
+
+def lazy_exports(package: str, exports: t.Mapping[str, str]) -> t.Callable[[str], t.Any]:
+    """
+    Builds module level __getattr__ which imports exported names on first access.
+
+    Args:
+        package: Name of the package that exports names, usually __name__.
+        exports: Mapping of exported name to relative module name it is imported from.
+    """
+
+    def __getattr__(name: str) -> t.Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -6,6 +6,7 @@ from unittest.mock import (
     Mock,
     AsyncMock,
     call,
+    patch,
 )
 
 import pytest
@@ -23,6 +24,7 @@ from pyddd.application import (
 from pyddd.application.abstractions import (
     IApplication,
     ApplicationSignal,
+    IModule,
 )
 from pyddd.application.application import get_running_application
 
@@ -30,6 +32,7 @@ from pyddd.domain import (
     DomainCommand,
     DomainEvent,
 )
+from pyddd.domain.abstractions import IMessage
 
 
 class ExampleCommand(DomainCommand, domain="test"): ...
@@ -38,6 +41,9 @@ class ExampleCommand(DomainCommand, domain="test"): ...
 class ExampleEvent(DomainEvent, domain="test"): ...
 
 
+class OtherEvent(DomainEvent, domain="test"): ...
+
+
 class TestApplication:
     @pytest.fixture
     def application(self):
@@ -261,6 +267,152 @@ class TestApplication:
         assert isinstance(app._executor, SyncExecutor)
 
 
+def handle_first(cmd: ExampleCommand):
+    return "first"
+
+
+def handle_last(cmd: ExampleCommand):
+    return "last"
+
+
+class TestEventRouting:
+    @pytest.fixture
+    def application(self):
+        app = Application()
+        app.run()
+        yield app
+        app.stop()
+
+    def test_ask_only_subscribed_modules(self, application):
+        subscribed = Module("test.subscribed")
+        subscribed.subscribe(ExampleEvent.__topic__)(handle_first)
+        other = Module("test.other")
+        other.get_event_handlers = Mock(return_value=[])  # type: ignore[method-assign]
+        application.include(subscribed)
+        application.include(other)
+
+        assert list(application.handle(ExampleEvent())) == ["first"]
+        other.get_event_handlers.assert_not_called()
+
+    def test_build_routes_on_run(self):
+        module = Module("test")
+        app = Application()
+        app.include(module)
+        module.subscribe(ExampleEvent.__topic__)(handle_first)
+        app.run()
+        assert list(app.handle(ExampleEvent())) == ["first"]
+
+    def test_route_subscriptions_added_after_run(self):
+        module = Module("test")
+        app = Application()
+        app.include(module)
+        app.run()
+        module.subscribe(ExampleEvent.__topic__)(handle_first)
+        assert list(app.handle(ExampleEvent())) == ["first"]
+
+    def test_ask_modules_without_subscriptions_for_every_event(self, application):
+        class AnyEventModule(IModule):
+            domain = "test.any"
+
+            def set_defaults(self, defaults: dict): ...
+
+            def get_command_handler(self, command: IMessage): ...
+
+            def get_event_handlers(self, event: IMessage):
+                return [lambda: "any"]
+
+        first = Module("test.first")
+        first.subscribe(ExampleEvent.__topic__)(handle_first)
+        last = Module("test.last")
+        last.subscribe(ExampleEvent.__topic__)(handle_last)
+        application.include(first)
+        application.include(AnyEventModule())
+        application.include(last)
+
+        assert list(application.handle(ExampleEvent())) == ["first", "any", "last"]
+        assert list(application.handle(OtherEvent())) == ["any"]
+
+
+class TestHandleMany:
+    def test_handle_many(self):
+        module = Module("test")
+        module.register(handle_first)
+        module.subscribe(ExampleEvent.__topic__)(handle_last)
+        app = Application()
+        app.include(module)
+        app.run()
+
+        results = app.handle_many([ExampleEvent(), ExampleCommand(), OtherEvent(), ExampleEvent()])
+
+        assert results == [["last"], ["first"], [], ["last"]]
+
+    async def test_handle_many_async(self):
+        async def handle(cmd: ExampleCommand, value: int):
+            if value < 0:
+                raise ValueError()
+            return value
+
+        module = Module("test", executor=AsyncExecutor())
+        module.subscribe(ExampleEvent.__topic__)(handle)
+        app = Application()
+        app.include(module)
+        await app.run_async()
+
+        results = await app.handle_many([ExampleEvent(), ExampleEvent()], value=1)
+        failed = await app.handle_many([ExampleEvent()], value=-1)
+
+        assert results == [[1], [1]]
+        assert isinstance(failed[0][0], ValueError)
+
+    def test_return_resolve_error_as_message_result(self):
+        class UnknownCommand(DomainCommand, domain="test.unknown"): ...
+
+        module = Module("test")
+        module.register(handle_first)
+        app = Application()
+        app.include(module)
+        app.run()
+
+        first, unknown, last = app.handle_many([ExampleCommand(), UnknownCommand(), ExampleCommand()])
+
+        assert first == last == ["first"]
+        assert len(unknown) == 1
+        assert isinstance(unknown[0], Exception)
+
+    async def test_return_resolve_error_as_message_result_async(self):
+        class UnknownAsyncCommand(DomainCommand, domain="test.unknown"): ...
+
+        async def handle(cmd: ExampleCommand):
+            return "first"
+
+        module = Module("test", executor=AsyncExecutor())
+        module.register(handle)
+        app = Application()
+        app.include(module)
+        await app.run_async()
+
+        first, unknown = await app.handle_many([ExampleCommand(), UnknownAsyncCommand()])
+
+        assert first == ["first"]
+        assert isinstance(unknown[0], Exception)
+
+    def test_could_not_handle_many_if_not_running(self):
+        with pytest.raises(RuntimeError):
+            Application().handle_many([ExampleEvent()])
+
+    def test_resolve_modules_once_per_topic(self):
+        module = Module("test")
+        module.subscribe(ExampleEvent.__topic__)(handle_last)
+        app = Application()
+        app.include(module)
+        app.run()
+
+        with patch.object(app, "_get_modules", wraps=app._get_modules) as get_modules:
+            app.handle_many([ExampleEvent() for _ in range(5)])
+
+        get_modules.assert_called_once()
+
+
 def test_set_and_get_application():
     app = Application()
     set_application(app)
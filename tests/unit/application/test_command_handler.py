@@ -1,14 +1,23 @@
-from unittest.mock import Mock
+from unittest.mock import (
+    Mock,
+    patch,
+)
 
 import pytest
 
+from pyddd.application.dependency import (
+    Provider,
+    Scope,
+)
 from pyddd.application.handler import (
     CommandHandler,
+    EventHandler,
 )
 from pyddd.domain import (
     DomainCommand,
     DomainEvent,
 )
+from pyddd.domain.message import BaseDomainMessageMeta
 from pyddd.domain.types import FrozenJsonDict
 
 
@@ -86,3 +95,78 @@ class TestCommandHandler:
 
         with pytest.raises(AttributeError):
             CommandHandler(foo)
+
+    def test_must_not_load_command_of_handler_type(self):
+        def foo(cmd: ExampleCommand):
+            return cmd
+
+        command = ExampleCommand()
+        handler = CommandHandler(foo)
+        with patch.object(BaseDomainMessageMeta, "load") as load:
+            result = handler.resolve(command)()
+        assert not load.called
+        assert result is command
+
+    def test_must_construct_command_once_from_event(self):
+        class ValidatedCommand(DomainCommand, domain="test.command-handler"):
+            value: int
+
+        class SourceEvent(DomainEvent, domain="test.command-handler"):
+            value: int
+
+        def foo(cmd: ValidatedCommand):
+            return cmd
+
+        handler = EventHandler(CommandHandler(foo))
+        with patch.object(BaseDomainMessageMeta, "load") as load:
+            result = handler.resolve(SourceEvent(value=1))()
+        assert not load.called
+        assert isinstance(result, ValidatedCommand)
+        assert result.value == 1
+
+    def test_bind_defaults_once(self):
+        def foo(cmd: ExampleCommand, callback):
+            return callback
+
+        defaults = dict(callback=1, other=2)
+        handler = CommandHandler(foo)
+        handler.set_defaults(defaults)
+        defaults["callback"] = 3
+
+        func = handler.resolve(ExampleCommand())
+        assert set(func.keywords) == {"cmd", "callback"}
+        assert func() == 1
+
+    def test_create_app_provider_once(self):
+        def foo(cmd: ExampleCommand, callback):
+            return callback
+
+        factory = Mock(side_effect=lambda: object())
+        handler = CommandHandler(foo)
+        handler.set_defaults(dict(callback=Provider(factory)))
+
+        assert not factory.called
+        assert handler.resolve(ExampleCommand())() is handler.resolve(ExampleCommand())()
+        assert factory.call_count == 1
+
+    def test_create_message_provider_per_message(self):
+        def foo(cmd: ExampleCommand, callback):
+            return callback
+
+        factory = Mock(side_effect=lambda: object())
+        handler = CommandHandler(foo)
+        handler.set_defaults(dict(callback=Provider(factory, scope=Scope.MESSAGE)))
+
+        assert handler.resolve(ExampleCommand())() is not handler.resolve(ExampleCommand())()
+        assert factory.call_count == 2
+
+    def test_not_create_provider_not_in_signature(self):
+        def foo(cmd: ExampleCommand):
+            return cmd
+
+        factory = Mock()
+        handler = CommandHandler(foo)
+        handler.set_defaults(dict(callback=Provider(factory)))
+        handler.resolve(ExampleCommand())()
+
+        assert not factory.called
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyddd.application import (
+    AsyncExecutor,
+    Module,
+)
+from pyddd.application.concurrency import (
+    ConcurrencyLimit,
+    ConcurrencyMetrics,
+)
+from pyddd.domain import (
+    DomainCommand,
+    DomainEvent,
+    DomainName,
+)
+
+__domain__ = DomainName("test.concurrency")
+
+
+class ExampleCommand(DomainCommand, domain=__domain__): ...
+
+
+class ExampleEvent(DomainEvent, domain=__domain__): ...
+
+
+class TestConcurrencyLimit:
+    def test_could_not_create_not_positive(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimit(0)
+
+    async def test_limit_async_calls(self):
+        limit = ConcurrencyLimit(2)
+        running = 0
+        max_running = 0
+
+        @limit
+        async def foo():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        tasks = [asyncio.create_task(foo()) for _ in range(10)]
+        await asyncio.sleep(0)
+        assert limit.metrics == ConcurrencyMetrics(limit=2, active=2, waiting=8)
+        await asyncio.gather(*tasks)
+
+        assert max_running == 2
+        assert limit.metrics == ConcurrencyMetrics(limit=2, active=0, waiting=0)
+
+    def test_limit_sync_calls(self):
+        limit = ConcurrencyLimit(2)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        @limit
+        def foo():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.001)
+            with lock:
+                running -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: foo(), range(20)))
+
+        assert max_running == 2
+        assert limit.metrics == ConcurrencyMetrics(limit=2, active=0, waiting=0)
+
+    async def test_release_on_error(self):
+        limit = ConcurrencyLimit(1)
+
+        @limit
+        async def foo():
+            raise ValueError()
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await foo()
+        assert limit.metrics.active == 0
+
+
+class TestModuleConcurrencyLimit:
+    async def test_limit_event_handler(self):
+        module = Module(__domain__, executor=AsyncExecutor())
+        running = 0
+        max_running = 0
+
+        @module.subscribe(ExampleEvent.__topic__, concurrency_limit=3)
+        async def foo(cmd: ExampleCommand):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        handlers = [handler for _ in range(10) for handler in module.get_event_handlers(ExampleEvent())]
+        await asyncio.gather(*(handler() for handler in handlers))
+
+        assert max_running == 3
+
+    async def test_module_limit_is_shared(self):
+        module = Module(__domain__, executor=AsyncExecutor(), concurrency_limit=1)
+        running = 0
+        max_running = 0
+
+        async def track():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        @module.register
+        async def foo(cmd: ExampleCommand):
+            await track()
+
+        @module.subscribe(ExampleEvent.__topic__)
+        async def bar(cmd: ExampleCommand):
+            await track()
+
+        await asyncio.gather(
+            module.get_command_handler(ExampleCommand())(),
+            *(handler() for handler in module.get_event_handlers(ExampleEvent())),
+        )
+
+        assert max_running == 1
+
+    def test_metrics(self):
+        module = Module(__domain__, concurrency_limit=10)
+
+        @module.register(concurrency_limit=2)
+        def foo(cmd: ExampleCommand): ...
+
+        metrics = module.get_concurrency_metrics()
+        assert metrics == {
+            f"{__name__}.{foo.__qualname__}": ConcurrencyMetrics(limit=2, active=0, waiting=0),
+            __domain__: ConcurrencyMetrics(limit=10, active=0, waiting=0),
+        }
+
+    def test_no_metrics_without_limits(self):
+        assert Module(__domain__).get_concurrency_metrics() == {}
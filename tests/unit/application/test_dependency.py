@@ -0,0 +1,252 @@
+import asyncio
+
+import pytest
+
+from pyddd.application import (
+    Application,
+    AsyncExecutor,
+    Module,
+    Provider,
+    Scope,
+)
+from pyddd.application.dependency import (
+    DependencyScope,
+    inject,
+)
+from pyddd.domain import (
+    DomainCommand,
+    DomainName,
+)
+
+__domain__ = DomainName("test.dependency")
+
+
+class ExampleCommand(DomainCommand, domain=__domain__): ...
+
+
+class Session:
+    def __init__(self):
+        self.closed = False
+
+
+class TestProvider:
+    def test_singleton_is_app_scope(self):
+        assert Provider(Session, scope=Scope.SINGLETON).scope is Scope.APP
+
+    def test_create_app_dependency_once(self):
+        func = inject(lambda session: session, {"session": Provider(Session)})
+
+        assert func() is func()
+
+    def test_clean_up_message_dependency_after_call(self):
+        sessions = []
+
+        def get_session():
+            session = Session()
+            sessions.append(session)
+            yield session
+            session.closed = True
+
+        func = inject(lambda session: session.closed, {"session": Provider(get_session, scope=Scope.MESSAGE)})
+
+        assert func() is False
+        assert func() is False
+        assert [session.closed for session in sessions] == [True, True]
+
+    def test_clean_up_app_dependency_on_close(self):
+        def get_session():
+            session = Session()
+            yield session
+            session.closed = True
+
+        provider = Provider(get_session)
+        session = inject(lambda session: session, {"session": provider})()
+
+        assert not session.closed
+        provider.close()
+        assert session.closed
+
+    def test_share_batch_dependency(self):
+        provider = Provider(Session, scope=Scope.BATCH)
+        scope = DependencyScope()
+        first = inject(lambda session: session, {"session": provider}, scope)
+        second = inject(lambda session: session, {"session": provider}, scope)
+
+        assert first() is second()
+        assert first() is not inject(lambda session: session, {"session": provider})()
+
+    def test_not_create_passed_dependency(self):
+        def fail():
+            raise AssertionError()
+
+        assert inject(lambda session: session, {"session": Provider(fail)})(session=1) == 1
+
+    def test_could_not_use_async_provider_in_sync_handler(self):
+        async def get_session():
+            return Session()
+
+        module = Module(__domain__)
+
+        @module.register
+        def foo(command: ExampleCommand, session: Session):
+            return session
+
+        with pytest.raises(TypeError):
+            module.set_defaults(dict(session=Provider(get_session)))
+
+    async def test_resolve_async_dependencies_concurrently(self):
+        started = 0
+        both_started = asyncio.Event()
+
+        async def get_session():
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return Session()
+
+        async def foo(first, second):
+            return first, second
+
+        func = inject(
+            foo,
+            {
+                "first": Provider(get_session, scope=Scope.MESSAGE),
+                "second": Provider(get_session, scope=Scope.MESSAGE),
+            },
+        )
+
+        first, second = await func()
+        assert isinstance(first, Session)
+        assert first is not second
+
+    async def test_clean_up_async_dependency_after_call(self):
+        async def get_session():
+            session = Session()
+            yield session
+            session.closed = True
+
+        async def foo(session):
+            return session
+
+        session = await inject(foo, {"session": Provider(get_session, scope=Scope.MESSAGE)})()
+
+        assert session.closed
+
+    async def test_create_app_dependency_once_concurrently(self):
+        calls = 0
+
+        async def get_session():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return Session()
+
+        async def foo(session):
+            return session
+
+        func = inject(foo, {"session": Provider(get_session)})
+        first, second = await asyncio.gather(func(), func())
+
+        assert first is second
+        assert calls == 1
+
+
+class TestApplicationProviders:
+    def test_handle_many_with_batch_dependency(self):
+        module = Module(__domain__)
+        sessions = []
+
+        def get_session():
+            session = Session()
+            sessions.append(session)
+            yield session
+            session.closed = True
+
+        @module.register
+        def foo(command: ExampleCommand, session: Session):
+            return session
+
+        app = Application()
+        app.include(module)
+        app.set_defaults(__domain__, session=Provider(get_session, scope=Scope.BATCH))
+        app.run()
+
+        [[first], [second]] = app.handle_many([ExampleCommand(), ExampleCommand()])
+
+        assert first is second
+        assert sessions == [first]
+        assert first.closed
+
+    async def test_handle_many_async_with_batch_dependency(self):
+        module = Module(__domain__, executor=AsyncExecutor())
+        sessions = []
+
+        async def get_session():
+            session = Session()
+            sessions.append(session)
+            yield session
+            session.closed = True
+
+        @module.register
+        async def foo(command: ExampleCommand, session: Session):
+            return session
+
+        app = Application()
+        app.include(module)
+        app.set_defaults(__domain__, session=Provider(get_session, scope=Scope.BATCH))
+        await app.run_async()
+
+        [[first], [second]] = await app.handle_many([ExampleCommand(), ExampleCommand()])
+
+        assert first is second
+        assert sessions == [first]
+        assert first.closed
+
+    async def test_clean_up_app_dependencies_on_stop(self):
+        module = Module(__domain__)
+
+        async def get_session():
+            session = Session()
+            yield session
+            session.closed = True
+
+        @module.register
+        async def foo(command: ExampleCommand, session: Session):
+            return session
+
+        app = Application()
+        app.include(module)
+        app.set_defaults(__domain__, session=Provider(get_session))
+        await app.run_async()
+
+        session = await app.handle(ExampleCommand())
+        await app.stop_async()
+
+        assert session.closed
+
+    def test_clean_up_module_app_dependencies_on_stop(self):
+        module = Module(__domain__)
+        sessions = []
+
+        def get_session():
+            session = Session()
+            sessions.append(session)
+            yield session
+            session.closed = True
+
+        @module.register
+        def foo(command: ExampleCommand, session: Session):
+            return session
+
+        module.set_defaults(dict(session=Provider(get_session)))
+        app = Application()
+        app.include(module)
+        app.run()
+
+        session = app.handle(ExampleCommand())
+        app.stop()
+
+        assert sessions == [session]
+        assert session.closed
@@ -72,6 +72,28 @@ class TestEventHandler:
         handler.resolve(ExampleEvent())(callback=mock)
         assert mock.called
 
+    def test_not_pass_event_class_version_to_command(self):
+        class VersionedEvent(DomainEvent, domain=__domain__, version=2):
+            name: str
+
+            @staticmethod
+            def upcast_v1_v2(state): ...
+
+        class VersionedCommand(DomainCommand, domain=__domain__, version=2):
+            title: str
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["title"] = state.pop("name")
+
+        mock = Mock()
+        handler = EventHandler(FakeCommandHandler(VersionedCommand, mock))
+
+        handler.resolve(VersionedEvent(name="first", class_version=2))()
+
+        command = mock.call_args.args[0]
+        assert command.to_dict() == {"title": "first"}
+
     def test_must_returns_result(self):
         class CustomEvent(DomainEvent, domain=__domain__):
             id: str
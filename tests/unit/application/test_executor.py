@@ -84,6 +84,19 @@ class TestSyncExecutor:
         assert isinstance(result[0], RuntimeError)
         assert result[1] == 2
 
+    def test_process_many(self):
+        def foo():
+            return 1
+
+        def bar():
+            raise ValueError()
+
+        executor = SyncExecutor()
+        result = executor.process_many(handlers=[[foo, bar], [], [foo]])
+        assert result[0][0] == 1
+        assert isinstance(result[0][1], ValueError)
+        assert result[1:] == [[], [1]]
+
 
 class TestAsyncExecutor:
     def test_init(self):
@@ -129,3 +142,16 @@ class TestAsyncExecutor:
         result = await executor.process_handlers(handlers=[foo, bar])
         assert isinstance(result[0], RuntimeError)
         assert result[1] == 2
+
+    async def test_process_many(self):
+        async def foo():
+            return 1
+
+        async def bar():
+            raise ValueError()
+
+        executor = AsyncExecutor()
+        result = await executor.process_many(handlers=[[foo, bar], [], [foo]])
+        assert result[0][0] == 1
+        assert isinstance(result[0][1], ValueError)
+        assert result[1:] == [[], [1]]
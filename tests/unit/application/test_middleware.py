@@ -0,0 +1,115 @@
+from pyddd.application import (
+    Application,
+    AsyncExecutor,
+    HandlerContext,
+    IMiddleware,
+    Module,
+)
+from pyddd.domain import (
+    DomainCommand,
+    DomainEvent,
+    DomainName,
+)
+
+__domain__ = DomainName("test.middleware")
+
+
+class ExampleCommand(DomainCommand, domain=__domain__): ...
+
+
+class ExampleEvent(DomainEvent, domain=__domain__): ...
+
+
+class RecordMiddleware(IMiddleware):
+    def __init__(self, name: str, calls: list):
+        self._name = name
+        self._calls = calls
+
+    def handle(self, call_next, context: HandlerContext, **kwargs):
+        self._calls.append((self._name, context.name, context.message.__topic__))
+        return call_next(context, **kwargs)
+
+    async def handle_async(self, call_next, context: HandlerContext, **kwargs):
+        self._calls.append((self._name, context.name, context.message.__topic__))
+        return await call_next(context, **kwargs)
+
+
+class ResultMiddleware(IMiddleware):
+    def handle(self, call_next, context: HandlerContext, **kwargs):
+        return call_next(context, **kwargs) + 1
+
+
+class TestMiddleware:
+    def test_wrap_command_handler(self):
+        calls: list = []
+        module = Module(__domain__)
+        module.add_middleware(RecordMiddleware("module", calls))
+
+        @module.register
+        def foo(command: ExampleCommand, value: int):
+            return value
+
+        app = Application()
+        app.add_middleware(RecordMiddleware("app", calls))
+        app.include(module)
+        app.run()
+
+        name = f"{foo.__module__}.{foo.__qualname__}"
+        assert app.handle(ExampleCommand(), value=1) == 1
+        assert calls == [("app", name, ExampleCommand.__topic__), ("module", name, ExampleCommand.__topic__)]
+
+    def test_wrap_event_handlers_with_event(self):
+        calls: list = []
+        module = Module(__domain__)
+
+        @module.subscribe(ExampleEvent.__topic__)
+        def foo(command: ExampleCommand):
+            return 1
+
+        module.add_middleware(RecordMiddleware("module", calls))
+
+        assert [handler() for handler in module.get_event_handlers(ExampleEvent())] == [1]
+        assert [topic for _, _, topic in calls] == [ExampleEvent.__topic__]
+
+    def test_add_middleware_to_included_modules(self):
+        module = Module(__domain__)
+
+        @module.register
+        def foo(command: ExampleCommand):
+            return 1
+
+        app = Application()
+        app.include(module)
+        app.add_middleware(ResultMiddleware())
+        app.add_middleware(ResultMiddleware())
+        app.run()
+
+        assert app.handle(ExampleCommand()) == 3
+
+    def test_pass_by_default(self):
+        class Empty(IMiddleware): ...
+
+        module = Module(__domain__)
+        module.add_middleware(Empty())
+
+        @module.register
+        def foo(command: ExampleCommand):
+            return 1
+
+        assert module.get_command_handler(ExampleCommand())() == 1
+
+    async def test_wrap_async_handler(self):
+        calls: list = []
+        module = Module(__domain__, executor=AsyncExecutor())
+        module.add_middleware(RecordMiddleware("module", calls))
+
+        @module.register
+        async def foo(command: ExampleCommand):
+            return 1
+
+        app = Application()
+        app.include(module)
+        await app.run_async()
+
+        assert await app.handle(ExampleCommand()) == 1
+        assert len(calls) == 1
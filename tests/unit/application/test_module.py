@@ -113,6 +113,17 @@ class TestModule:
         handler = module.get_command_handler(ExampleCommand())
         assert handler() == "bzz"
 
+    def test_update_defaults_of_registered_handlers(self):
+        module = Module(domain="test")
+
+        @module.register
+        def foo(cmd: ExampleCommand, bar: str):
+            return bar
+
+        module.set_defaults(dict(bar="bzz"))
+        module.set_defaults(dict(bar="baz"))
+        assert module.get_command_handler(ExampleCommand())() == "baz"
+
     def test_handle_events(self):
         class ExampleCommand2(DomainCommand, domain=__domain__): ...
 
@@ -335,3 +346,25 @@ class TestModule:
         assert len(handlers) == 1
         assert handlers[0](callback=mock) == 1
         assert mock.call_count == 3
+
+    def test_can_register_with_retry_strategy(self):
+        class RetryStrategy(IRetryStrategy):
+            def __call__(self, func: AnyCallable) -> AnyCallable:
+                def wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        return func(*args, **kwargs)
+
+                return wrapper
+
+        module = Module("test")
+
+        @module.register(retry_strategy=RetryStrategy())
+        def foo(command: ExampleCommand, callback):
+            return callback()
+
+        mock = Mock(side_effect=[Exception(), 1])
+        handler = module.get_command_handler(ExampleCommand())
+        assert handler(callback=mock) == 1
+        assert mock.call_count == 2
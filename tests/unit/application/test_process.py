@@ -0,0 +1,227 @@
+import multiprocessing
+import os
+import pickle
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pyddd.application import (
+    Application,
+    HandlerContext,
+    IMiddleware,
+    Module,
+    ProcessExecutor,
+    SyncExecutor,
+)
+from pyddd.application.process import (
+    Envelope,
+    ProcessCall,
+    ProcessTarget,
+)
+from pyddd.domain import (
+    DomainCommand,
+    DomainEvent,
+    DomainName,
+)
+from pyddd.domain.event_sourcing import DomainEvent as ESDomainEvent
+from pyddd.domain.message import Message
+
+__domain__ = DomainName("test.process")
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+
+
+class ComputeCommand(DomainCommand, domain=__domain__):
+    value: int
+
+
+class FailCommand(DomainCommand, domain=__domain__): ...
+
+
+class LocalCommand(DomainCommand, domain=__domain__): ...
+
+
+class LockCommand(DomainCommand, domain=__domain__): ...
+
+
+class ComputedEvent(DomainEvent, domain=__domain__):
+    value: int
+
+
+class StoredEvent(ESDomainEvent, domain=__domain__): ...
+
+
+module = Module(__domain__)
+
+
+@module.register(in_process_pool=True)
+def compute(command: ComputeCommand, factor: int):
+    return command.value * factor, os.getpid()
+
+
+@module.register(in_process_pool=True)
+def fail(command: FailCommand):
+    raise ValueError("failed")
+
+
+@module.register(in_process_pool=True)
+def acquire(command: LockCommand, lock):
+    return lock.acquire(blocking=False), os.getpid()
+
+
+@module.register
+def local(command: LocalCommand):
+    return os.getpid()
+
+
+@module.subscribe(ComputedEvent.__topic__, in_process_pool=True)
+def on_computed(command: ComputeCommand, factor: int):
+    return command.value * factor, os.getpid()
+
+
+@module.subscribe(ComputedEvent.__topic__)
+def on_computed_local(command: ComputeCommand):
+    return os.getpid()
+
+
+class PidMiddleware(IMiddleware):
+    def __init__(self):
+        self.pids: list[int] = []
+
+    def handle(self, call_next, context: HandlerContext, **kwargs):
+        self.pids.append(os.getpid())
+        return call_next(context, **kwargs)
+
+
+@pytest.fixture
+def executor():
+    executor = ProcessExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"))
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def app(executor):
+    app = Application(executor=executor)
+    app.include(module)
+    app.set_defaults(__domain__, factor=3, lock=threading.Lock())
+    app.run()
+    return app
+
+
+class TestEnvelope:
+    def test_mark_resolved_handlers(self):
+        handler = module.get_command_handler(ComputeCommand(value=1))
+
+        assert isinstance(handler, ProcessCall)
+        assert handler.target == ProcessTarget(module=__name__, domain=__domain__, handler="compute")
+        assert handler.build_envelope().target == handler.target
+
+    def test_not_mark_other_handlers(self):
+        assert not isinstance(module.get_command_handler(LocalCommand()), ProcessCall)
+
+    def test_load_domain_message(self):
+        event = ComputedEvent(value=2)
+        envelope = Envelope.build(ProcessTarget(__name__, __domain__, "on_computed"), event)
+
+        message = pickle.loads(pickle.dumps(envelope)).load_message()
+
+        assert message == event
+        assert message.__message_id__ == event.__message_id__
+        assert message.__timestamp__ == event.__timestamp__
+
+    def test_load_entity_of_event_sourced_message(self):
+        event = StoredEvent(entity_reference="1", entity_version=3)
+        envelope = Envelope.build(ProcessTarget(__name__, __domain__, "on_stored"), event)
+
+        message = envelope.load_message()
+
+        assert message.__entity_reference__ == "1"
+        assert message.__entity_version__ == 3
+
+    def test_load_unknown_message(self):
+        message = Message("test.process.Unknown", "EVENT", {"value": 1})
+        envelope = Envelope.build(ProcessTarget(__name__, __domain__, "on_computed"), message)
+
+        loaded = envelope.load_message()
+
+        assert isinstance(loaded, Message)
+        assert loaded.to_dict() == {"value": 1}
+        assert loaded.__message_id__ == message.__message_id__
+
+    def test_call_in_place_by_other_executors(self):
+        with patch.object(Envelope, "build", side_effect=AssertionError("envelope built")):
+            result = SyncExecutor().process_handler(module.get_command_handler(ComputeCommand(value=2)), factor=2)
+
+        assert result == (4, os.getpid())
+
+    def test_could_not_run_async_handler_in_process_pool(self):
+        other = Module(__domain__)
+
+        with pytest.raises(TypeError):
+
+            @other.register(in_process_pool=True)
+            async def foo(command: LocalCommand):
+                return 1
+
+
+class TestProcessExecutor:
+    def test_run_command_in_worker(self, app):
+        value, pid = app.handle(ComputeCommand(value=2))
+
+        assert value == 6
+        assert pid != os.getpid()
+
+    def test_run_other_handlers_in_place(self, app):
+        assert app.handle(LocalCommand()) == os.getpid()
+
+    def test_raise_handler_error(self, app):
+        with pytest.raises(ValueError, match="failed"):
+            app.handle(FailCommand())
+
+    def test_run_events(self, app):
+        results = list(app.handle(ComputedEvent(value=2)))
+
+        assert results[0][0] == 6
+        assert results[0][1] != os.getpid()
+        assert results[1] == os.getpid()
+
+    def test_run_many(self, app):
+        results = app.handle_many([ComputeCommand(value=1), FailCommand(), LocalCommand()])
+
+        assert results[0][0][0] == 3
+        assert isinstance(results[1][0], ValueError)
+        assert results[2] == [os.getpid()]
+
+    def test_override_worker_dependencies(self, app):
+        value, _ = app.handle(ComputeCommand(value=2), factor=5)
+
+        assert value == 10
+
+    def test_bind_defaults_in_worker(self, app):
+        acquired, pid = app.handle(LockCommand())
+
+        assert acquired
+        assert pid != os.getpid()
+
+    def test_run_middlewares_in_calling_process(self, executor):
+        middleware = PidMiddleware()
+        app = Application(executor=executor)
+        app.add_middleware(middleware)
+        app.include(module)
+        app.set_defaults(__domain__, factor=1)
+        app.run()
+        try:
+            _, pid = app.handle(ComputeCommand(value=1))
+        finally:
+            module.set_middlewares([])
+
+        assert middleware.pids == [os.getpid()]
+        assert pid != os.getpid()
+
+    def test_shutdown_on_application_stop(self, app, executor):
+        app.stop()
+
+        with pytest.raises(RuntimeError):
+            executor.process_handler(module.get_command_handler(ComputeCommand(value=1)), factor=1)
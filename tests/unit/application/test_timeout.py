@@ -0,0 +1,224 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from pyddd.application import (
+    Application,
+    AsyncExecutor,
+    Module,
+    SyncExecutor,
+)
+from pyddd.application.abstractions import IExecutor
+from pyddd.application.exceptions import HandlerTimeout
+from pyddd.application.timeout import Timeout
+from pyddd.domain import (
+    DomainCommand,
+    DomainEvent,
+    DomainName,
+)
+
+__domain__ = DomainName("test.timeout")
+
+
+class ExampleCommand(DomainCommand, domain=__domain__): ...
+
+
+class ExampleEvent(DomainEvent, domain=__domain__): ...
+
+
+class TestTimeout:
+    def test_could_not_create_not_positive(self):
+        with pytest.raises(ValueError):
+            Timeout(0)
+
+    async def test_cancel_async_handler(self):
+        cancelled = False
+
+        @Timeout(0.01)
+        async def foo():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        with pytest.raises(HandlerTimeout):
+            await foo()
+        assert cancelled
+
+    async def test_return_async_result_in_time(self):
+        @Timeout(1)
+        async def foo():
+            return 1
+
+        assert await foo() == 1
+
+    def test_abandon_sync_handler(self):
+        @Timeout(0.01)
+        def foo():
+            time.sleep(0.2)
+
+        start = time.monotonic()
+        with pytest.raises(HandlerTimeout):
+            foo()
+        assert time.monotonic() - start < 0.2
+
+    def test_count_abandoned_sync_calls(self):
+        release = threading.Event()
+        timeout = Timeout(0.01)
+
+        @timeout
+        def foo():
+            release.wait(1)
+
+        with pytest.raises(HandlerTimeout):
+            foo()
+        assert timeout.abandoned == 1
+        release.set()
+        time.sleep(0.05)
+        assert timeout.abandoned == 0
+
+    def test_drop_calls_waiting_for_busy_threads(self):
+        release = threading.Event()
+        calls = Mock()
+        timeout = Timeout(0.01, max_workers=1)
+
+        @timeout
+        def foo():
+            calls()
+            release.wait(1)
+
+        with pytest.raises(HandlerTimeout):
+            foo()
+        with pytest.raises(HandlerTimeout):
+            foo()
+        release.set()
+        time.sleep(0.05)
+
+        calls.assert_called_once_with()
+        assert timeout.abandoned == 0
+
+    def test_raise_sync_handler_error(self):
+        @Timeout(1)
+        def foo():
+            raise TimeoutError()
+
+        with pytest.raises(TimeoutError) as exc_info:
+            foo()
+        assert not isinstance(exc_info.value, HandlerTimeout)
+
+
+class TestExecutorTimeout:
+    def test_sync_process_handler(self):
+        def foo():
+            time.sleep(0.2)
+
+        with pytest.raises(HandlerTimeout):
+            SyncExecutor(timeout=0.01).process_handler(foo)
+
+    def test_sync_process_handlers_returns_timeout(self):
+        def foo():
+            time.sleep(0.2)
+
+        def bar():
+            return 1
+
+        results = list(SyncExecutor(timeout=0.05).process_handlers([foo, bar]))
+
+        assert isinstance(results[0], HandlerTimeout)
+        assert results[1] == 1
+
+    def test_sync_count_abandoned_handlers(self):
+        release = threading.Event()
+        executor = SyncExecutor(timeout=0.01, max_workers=1)
+
+        def foo():
+            release.wait(1)
+
+        results = list(executor.process_handlers([foo, foo]))
+
+        assert all(isinstance(result, HandlerTimeout) for result in results)
+        assert executor.abandoned == 1
+        release.set()
+        time.sleep(0.05)
+        assert executor.abandoned == 0
+
+    async def test_async_process_handler(self):
+        async def foo():
+            await asyncio.sleep(1)
+
+        with pytest.raises(HandlerTimeout):
+            await AsyncExecutor(timeout=0.01).process_handler(foo)
+
+    async def test_async_process_handlers_returns_timeout(self):
+        async def foo():
+            await asyncio.sleep(1)
+
+        async def bar():
+            return 1
+
+        results = await AsyncExecutor(timeout=0.01).process_handlers([foo, bar])
+
+        assert isinstance(results[0], HandlerTimeout)
+        assert results[1] == 1
+
+
+class TestModuleTimeout:
+    async def test_subscribe_with_timeout(self):
+        module = Module(__domain__, executor=AsyncExecutor())
+
+        @module.subscribe(ExampleEvent.__topic__, timeout=0.01)
+        async def foo(cmd: ExampleCommand):
+            await asyncio.sleep(1)
+
+        (handler,) = module.get_event_handlers(ExampleEvent())
+        with pytest.raises(HandlerTimeout):
+            await handler()
+
+    def test_register_with_timeout(self):
+        module = Module(__domain__)
+
+        @module.register(timeout=0.01)
+        def foo(cmd: ExampleCommand):
+            time.sleep(0.2)
+
+        with pytest.raises(HandlerTimeout):
+            module.get_command_handler(ExampleCommand())()
+
+    def test_hold_concurrency_slot_until_abandoned_call_finishes(self):
+        release = threading.Event()
+        module = Module(__domain__)
+
+        @module.register(timeout=0.05, concurrency_limit=1)
+        def foo(cmd: ExampleCommand):
+            release.wait(1)
+
+        with pytest.raises(HandlerTimeout):
+            module.get_command_handler(ExampleCommand())()
+        with pytest.raises(HandlerTimeout):
+            module.get_command_handler(ExampleCommand())()
+
+        (metrics,) = module.get_concurrency_metrics().values()
+        assert metrics.active == 1
+        assert metrics.waiting == 1
+        release.set()
+
+    def test_shutdown_on_application_stop(self):
+        executor = Mock(spec=IExecutor)
+        module = Module(__domain__)
+
+        @module.register(timeout=0.01)
+        def foo(cmd: ExampleCommand): ...
+
+        app = Application(executor=executor)
+        app.include(module)
+        app.run()
+        app.stop()
+
+        executor.shutdown.assert_called_once_with(wait=False)
+        with pytest.raises(RuntimeError):
+            module.get_command_handler(ExampleCommand())()
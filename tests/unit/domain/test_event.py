@@ -1,3 +1,7 @@
+import datetime as dt
+import typing as t
+from unittest.mock import Mock
+
 import pytest
 
 from pyddd.domain.abstractions import (
@@ -5,7 +9,9 @@ from pyddd.domain.abstractions import (
     Version,
 )
 from pyddd.domain.event_sourcing import DomainEvent as ESDomainEvent
+from pyddd.domain.compat import get_pydantic_version
 from pyddd.domain.event import DomainEvent
+from pyddd.domain.message import _json_dumps
 
 
 class ExampleEvent(DomainEvent, domain="test.event"):
@@ -75,6 +81,200 @@ class TestDomainEvent:
 
         assert event.renamed_attr == 123
 
+    def test_could_upcast_raw_payload(self):
+        class RawVersionedEvent(DomainEvent, domain="test.event", version=3):
+            renamed_attr: int
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["some_attr"] = int(state["some_attr"])
+
+            @staticmethod
+            def upcast_v2_v3(state):
+                state["renamed_attr"] = state.pop("some_attr")
+
+        payload = RawVersionedEvent.upcast_payload({"some_attr": "123"})
+
+        assert payload == {"renamed_attr": 123, "class_version": 3}
+        assert RawVersionedEvent(**payload).renamed_attr == 123
+
+    def test_must_not_upcast_current_version(self):
+        class CurrentVersionedEvent(DomainEvent, domain="test.event", version=2):
+            some_attr: int
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                assert False, "Should not be called"
+
+        event = CurrentVersionedEvent.load(payload={"some_attr": 1, "class_version": 2})
+
+        assert event.some_attr == 1
+
+    def test_could_not_upcast_from_future_version(self):
+        class FutureVersionedEvent(DomainEvent, domain="test.event", version=2):
+            @staticmethod
+            def upcast_v1_v2(state): ...
+
+        with pytest.raises(ValueError, match="from version 3 to 4"):
+            FutureVersionedEvent.upcast_payload({"class_version": 3})
+
+    @pytest.mark.parametrize(
+        "payload",
+        (
+            {"some_attr": "123", "renamed_attr": "456", "class_version": 2},
+            '{"some_attr": "123", "renamed_attr": "456", "class_version": 2}',
+            b'{"some_attr": "123", "renamed_attr": "456", "class_version": 2}',
+        ),
+    )
+    @pytest.mark.parametrize("trusted", (False, True))
+    def test_old_consumer_could_load_message_of_new_producer(self, payload, trusted):
+        event = ExampleEvent.load(payload=payload, trusted=trusted)
+
+        assert event.some_attr == "123"
+
+
+class TestJsonLoad:
+    @pytest.mark.parametrize("payload", ('{"some_attr": "123"}', b'{"some_attr": "123"}'))
+    def test_could_load_from_json(self, payload):
+        event = ExampleEvent.load(payload=payload)
+        assert isinstance(event, ExampleEvent)
+        assert event.some_attr == "123"
+
+    def test_must_validate_json(self):
+        with pytest.raises(ValueError):
+            ExampleEvent.load(payload=b'{"some_attr": []}')
+
+    def test_must_upcast_json(self):
+        class JsonVersionedEvent(DomainEvent, domain="test.event", version=2):
+            renamed_attr: str
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["renamed_attr"] = state.pop("some_attr")
+
+        event = JsonVersionedEvent.load(payload=b'{"some_attr": "123"}')
+        assert event.renamed_attr == "123"
+
+    def test_could_dump_json_bytes(self):
+        event = ExampleEvent(some_attr="123")
+        assert isinstance(event.to_json_bytes(), bytes)
+        assert event.to_json_bytes().decode() == event.to_json()
+        assert ExampleEvent.load(payload=event.to_json_bytes()).to_dict() == event.to_dict()
+
+    @pytest.mark.skipif(not get_pydantic_version().startswith("1"), reason="pydantic v1 json options")
+    def test_could_dump_json_with_options(self):
+        event = ExampleEvent(some_attr="123")
+
+        assert event.json(indent=2).startswith('{\n  "some_attr": "123"')
+        assert event.json() == event.to_json()
+
+    def test_could_format_json_dumps_of_v1_models(self):
+        created_at = dt.datetime(2020, 1, 1)
+
+        assert _json_dumps({"created_at": created_at}, default=str, indent=2) == (
+            '{\n  "created_at": "2020-01-01 00:00:00"\n}'
+        )
+        assert _json_dumps({"created_at": created_at}, default=str) == '{"created_at": "2020-01-01 00:00:00"}'
+
+
+class TestTrustedLoad:
+    def test_could_load_trusted(self):
+        event = ExampleEvent.load(payload={"some_attr": "123"}, trusted=True)
+        assert isinstance(event, ExampleEvent)
+        assert event.to_dict() == {"some_attr": "123"}
+        assert event.__version__ == 1
+        assert isinstance(event.__message_id__, str)
+
+    def test_must_skip_validation_when_trusted(self):
+        event = ExampleEvent.load(payload={"some_attr": 123}, trusted=True)
+        assert event.some_attr == 123
+
+    def test_must_ignore_unknown_keys(self):
+        event = ExampleEvent.load(payload={"some_attr": "123", "class_version": 1, "unknown": 1}, trusted=True)
+        assert event.to_dict() == {"some_attr": "123"}
+
+    def test_could_fill_defaults(self):
+        class EventWithDefaults(DomainEvent, domain="test.event"):
+            items: list[int] = []
+            name: t.Optional[str] = None
+
+        event = EventWithDefaults.load(payload={}, trusted=True)
+        assert event.items == []
+        assert event.name is None
+
+    def test_must_validate_when_required_field_missed(self):
+        with pytest.raises(ValueError):
+            ExampleEvent.load(payload={}, trusted=True)
+
+    def test_must_validate_not_json_native_fields(self):
+        class EventWithDate(DomainEvent, domain="test.event"):
+            created_at: dt.datetime
+
+        event = EventWithDate.load(payload={"created_at": "2020-01-01T00:00:00"}, trusted=True)
+        assert event.created_at == dt.datetime(2020, 1, 1)
+
+    def test_must_parse_only_not_json_native_fields(self, monkeypatch):
+        class EventWithParsedDate(DomainEvent, domain="test.event"):
+            created_at: dt.datetime
+            name: str
+
+        monkeypatch.setattr("pyddd.domain.message._validate_model", Mock(side_effect=AssertionError("validated")))
+        event = EventWithParsedDate.load(payload={"created_at": "2020-01-01T00:00:00", "name": 1}, trusted=True)
+
+        assert event.created_at == dt.datetime(2020, 1, 1)
+        assert event.name == 1
+
+    def test_must_upcast_when_class_version_differs(self):
+        class TrustedVersionedEvent(DomainEvent, domain="test.event", version=2):
+            renamed_attr: str
+
+            @staticmethod
+            def upcast_v1_v2(state):
+                state["renamed_attr"] = state.pop("some_attr")
+
+        event = TrustedVersionedEvent.load(payload={"some_attr": "123"}, trusted=True)
+        assert event.renamed_attr == "123"
+
+        event = TrustedVersionedEvent.load(payload={"renamed_attr": "456", "class_version": 2}, trusted=True)
+        assert event.renamed_attr == "456"
+        assert event.__version__ == 2
+
+
+class TestLoadMany:
+    def test_could_load_many(self):
+        events = ExampleEvent.load_many(
+            [
+                {"payload": {"some_attr": "1"}},
+                {"payload": {"some_attr": "2"}, "message_id": "00000000-0000-0000-0000-000000000001"},
+            ]
+        )
+        assert [event.some_attr for event in events] == ["1", "2"]
+        assert events[1].__message_id__ == "00000000-0000-0000-0000-000000000001"
+
+    def test_could_load_many_trusted(self):
+        events = ExampleEvent.load_many([{"payload": {"some_attr": 1}}, {"payload": {"some_attr": "2"}}], trusted=True)
+        assert events[0].some_attr == 1
+        assert events[1].some_attr == "2"
+
+    def test_must_validate_each_payload(self):
+        with pytest.raises(ValueError):
+            ExampleEvent.load_many([{"payload": {"some_attr": "1"}}, {"payload": {"some_attr": []}}])
+
+    def test_could_load_many_es_events(self):
+        events = ExampleESEvent.load_many(
+            [
+                {"payload": {"some_attr": "1"}, "entity_reference": "entity-1", "entity_version": 1},
+                {"payload": {"some_attr": "2"}, "entity_reference": "entity-1", "entity_version": 2},
+            ],
+            trusted=True,
+        )
+        assert [event.__entity_version__ for event in events] == [1, 2]
+        assert all(event.__entity_reference__ == "entity-1" for event in events)
+
+    def test_must_require_entity_reference_for_es_events(self):
+        with pytest.raises(ValueError):
+            ExampleESEvent.load_many([{"payload": {"some_attr": "1"}, "entity_version": 1}])
+
 
 class ExampleESEvent(ESDomainEvent, domain="test.event"):
     some_attr: str
@@ -110,3 +310,14 @@ class TestESDomainEvent:
         assert event.some_attr == "123"
         assert event.__entity_reference__ == "entity-1"
         assert event.__entity_version__ == 123
+
+    def test_could_load_trusted(self):
+        event = ExampleESEvent.load(
+            payload=dict(some_attr="123"),
+            entity_version=123,
+            entity_reference="entity-1",
+            trusted=True,
+        )
+        assert event.some_attr == "123"
+        assert event.__entity_reference__ == "entity-1"
+        assert event.__entity_version__ == 123
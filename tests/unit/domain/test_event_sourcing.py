@@ -116,3 +116,75 @@ class TestEventSourcedEntity:
         event = EntityRenamed(name="456", entity_version=2, entity_reference="wrong_reference")
         with pytest.raises(AssertionError):
             event.mutate(entity)
+
+
+class TestReplay:
+    def test_could_replay_events(self):
+        entity = SomeRootEntity.create(name="0")
+        for i in range(1, 10):
+            entity.rename(str(i))
+        created, *events = list(entity.collect_events())
+
+        new = created.mutate(None).replay(events)
+
+        assert new == entity
+        assert new.name == "9"
+        assert new.__version__ == Version(10)
+        assert list(new.collect_events()) == []
+
+    def test_could_replay_in_several_batches(self):
+        entity = SomeRootEntity.create(name="0")
+        entity.rename("1")
+        entity.rename("2")
+        created, *events = list(entity.collect_events())
+
+        new = created.mutate(None).replay(events[:1]).replay(iter(events[1:]))
+
+        assert new.name == "2"
+        assert new.__version__ == Version(3)
+
+    def test_could_replay_custom_mutate(self):
+        entity = SomeRootEntity.create(name="0")
+        events = list(entity.collect_events())
+
+        new = SomeRootEntity(__reference__=entity.__reference__, __version__=0).replay(events)
+
+        assert new.name == "0"
+        assert new.__version__ == Version(1)
+
+    def test_apply_sees_version_preceding_event(self):
+        seen = []
+
+        class EntityTouched(BaseEvent):
+            def apply(self, entity):
+                seen.append(entity.__version__)
+
+        entity = SomeRootEntity.create(name="0")
+        reference = str(entity.__reference__)
+        events = [EntityTouched(entity_version=version, entity_reference=reference) for version in (2, 3, 4)]
+
+        entity.replay(events)
+
+        assert seen == [1, 2, 3]
+        assert entity.__version__ == Version(4)
+
+    def test_could_replay_empty(self):
+        entity = SomeRootEntity.create(name="0")
+        assert entity.replay([]) is entity
+
+    def test_could_not_replay_with_version_gap(self):
+        entity = SomeRootEntity.create(name="0")
+        reference = str(entity.__reference__)
+        events = [
+            EntityRenamed(name="1", entity_version=2, entity_reference=reference),
+            EntityRenamed(name="2", entity_version=4, entity_reference=reference),
+        ]
+        with pytest.raises(ValueError):
+            entity.replay(events)
+        assert entity.name == "0"
+
+    def test_could_not_replay_events_of_another_entity(self):
+        entity = SomeRootEntity.create(name="0")
+        events = [EntityRenamed(name="1", entity_version=2, entity_reference="another")]
+        with pytest.raises(ValueError):
+            entity.replay(events)
@@ -0,0 +1,60 @@
+import time
+import uuid
+
+import pytest
+
+from pyddd.domain import DomainEvent
+from pyddd.domain.abstractions import MessageType
+from pyddd.domain.identity import (
+    generate_id,
+    get_id_generator,
+    set_id_generator,
+    uuid7,
+)
+from pyddd.domain.message import Message
+
+
+@pytest.fixture
+def fixed_id():
+    previous = get_id_generator()
+    value = uuid.UUID(int=1)
+    set_id_generator(lambda: value)
+    yield value
+    set_id_generator(previous)
+
+
+class TestUUID7:
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_contains_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_monotonic(self):
+        values = [uuid7() for _ in range(10_000)]
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+
+class TestIdGenerator:
+    def test_default_is_uuid7(self):
+        assert get_id_generator() is uuid7
+        assert generate_id().version == 7
+
+    def test_could_not_set_not_callable(self):
+        with pytest.raises(TypeError):
+            set_id_generator("uuid")  # type: ignore[arg-type]
+
+    def test_message_uses_generator(self, fixed_id):
+        message = Message("test.Event", MessageType.EVENT, payload={})
+        assert message.__message_id__ == str(fixed_id)
+
+    def test_domain_message_uses_generator(self, fixed_id):
+        class TestEvent(DomainEvent, domain="test.identity"): ...
+
+        assert TestEvent().__message_id__ == str(fixed_id)
@@ -1,6 +1,8 @@
+import sys
 from decimal import Decimal
 from types import MappingProxyType
 import datetime as dt
+from unittest.mock import patch
 from uuid import UUID
 
 import pytest
@@ -96,6 +98,29 @@ class TestJsonDict:
         with pytest.raises(ValueError, match="Circular reference detected"):
             d["dict"]["recursive"] = d
 
+    def test_deep_structure_does_not_hit_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 2
+        value: dict = {}
+        current = value
+        for _ in range(depth):
+            current["child"] = {"items": [1, (dt.date(2023, 11, 23),)]}
+            current = current["child"]
+
+        obj = JsonDict(value)
+
+        for _ in range(depth):
+            assert isinstance(obj, JsonDict)
+            assert obj["child"]["items"] == [1, ("2023-11-23",)]
+            obj = obj["child"]
+
+    def test_resolve_converter_once_per_type(self):
+        class CustomJsonDict(JsonDict):
+            CONVERTERS = MappingProxyType({Decimal: float})
+
+        assert CustomJsonDict(value=Decimal("0.5")) == {"value": 0.5}
+        assert CustomJsonDict._dispatch == {Decimal: CustomJsonDict._resolve(Decimal)}
+        assert JsonDict(value=Decimal("0.5")) == {"value": "0.5"}
+
     def test_set_default(self):
         obj = JsonDict()
         obj.setdefault("a", {})
@@ -323,8 +348,29 @@ class TestFreezeJsonDict:
 
     def test_hash(self):
         obj = FrozenJsonDict(a=1)
-        assert hash(obj) == hash('{"a": 1}')
+        assert hash(obj) == hash(FrozenJsonDict({"a": 1}))
 
         s = set()
         s.add(obj)
         assert s == {obj}
+
+    def test_hash_does_not_depend_on_keys_order(self):
+        assert hash(FrozenJsonDict(a=1, b={"c": [1]})) == hash(FrozenJsonDict(b={"c": (1,)}, a=1))
+
+    def test_hash_differs_for_different_nested_values(self):
+        assert hash(FrozenJsonDict(a={"b": 1})) != hash(FrozenJsonDict(a={"b": 2}))
+
+    def test_construction_is_lazy(self):
+        with patch.object(JsonDict, "__str__") as to_json:
+            obj = FrozenJsonDict(a={"b": {"c": 1}})
+            _ = hash(obj)
+
+        to_json.assert_not_called()
+
+    def test_str_is_cached(self):
+        obj = FrozenJsonDict(a=1)
+        with patch.object(JsonDict, "__str__", return_value='{"a": 1}') as to_json:
+            assert str(obj) == '{"a": 1}'
+            assert str(obj) == '{"a": 1}'
+
+        to_json.assert_called_once()
@@ -1,5 +1,7 @@
 import datetime as dt
 
+import pytest
+
 from pyddd.domain.message import (
     Message,
 )
@@ -32,3 +34,56 @@ class TestMessage:
             payload=dict(reference="123"),
         )
         assert message == message
+
+    def test_topic_is_built_once(self):
+        message = Message(
+            full_name="users.sub.UserCreated",
+            message_type=MessageType.EVENT,
+            payload=dict(reference="123"),
+        )
+        assert message.__topic__ is message.__topic__
+        assert message.__topic__ == "users.sub.UserCreated"
+
+    def test_has_no_instance_dict(self):
+        message = Message(
+            full_name="users.sub.UserCreated",
+            message_type=MessageType.EVENT,
+            payload=dict(reference="123"),
+        )
+        assert not hasattr(message, "__dict__")
+
+    def test_to_dict_returns_copy(self):
+        message = Message(
+            full_name="users.sub.UserCreated",
+            message_type=MessageType.EVENT,
+            payload=dict(reference="123"),
+        )
+        payload = message.to_dict()
+        payload["reference"] = "456"
+        assert type(payload) is dict
+        assert message.to_dict() == {"reference": "123"}
+
+    def test_must_not_share_payload_with_caller(self):
+        payload = dict(reference="123")
+        message = Message(full_name="users.UserCreated", message_type=MessageType.EVENT, payload=payload)
+        payload["reference"] = "456"
+        assert message.to_dict() == {"reference": "123"}
+
+    @pytest.mark.parametrize("payload", ('{"reference": "123"}', b'{"reference": "123"}'))
+    def test_could_create_from_encoded_payload(self, payload):
+        message = Message(full_name="users.UserCreated", message_type=MessageType.EVENT, payload=payload)
+        assert message.to_json() == '{"reference": "123"}'
+        assert message.to_dict() == {"reference": "123"}
+
+    def test_must_validate_payload_on_create(self):
+        with pytest.raises(TypeError):
+            Message(full_name="users.UserCreated", message_type=MessageType.EVENT, payload=dict(reference=object()))
+
+    @pytest.mark.parametrize("payload", ("{reference", b"{reference"))
+    def test_must_validate_encoded_payload_on_create(self, payload):
+        with pytest.raises(ValueError):
+            Message(full_name="users.UserCreated", message_type=MessageType.EVENT, payload=payload)
+
+    def test_must_encode_payload_once(self):
+        message = Message(full_name="users.UserCreated", message_type=MessageType.EVENT, payload=dict(reference="1"))
+        assert message.to_json() is message.to_json()
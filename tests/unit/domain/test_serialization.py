@@ -0,0 +1,75 @@
+import datetime as dt
+
+import pytest
+
+from pyddd.domain import serialization
+from pyddd.domain.abstractions import MessageType
+from pyddd.domain.message import Message
+from pyddd.domain.serialization import (
+    IJsonSerializer,
+    StdlibJsonSerializer,
+    get_json_serializer,
+    set_json_serializer,
+)
+from pyddd.domain.serialization.msgspec import MsgspecSerializer
+from pyddd.domain.serialization.orjson import OrjsonSerializer
+from pyddd.domain.types import (
+    JsonDict,
+    FrozenJsonDict,
+)
+
+
+@pytest.fixture(params=[StdlibJsonSerializer, OrjsonSerializer, MsgspecSerializer])
+def serializer(request):
+    previous = get_json_serializer()
+    serializer = request.param()
+    set_json_serializer(serializer)
+    yield serializer
+    set_json_serializer(previous)
+
+
+class TestJsonSerializer:
+    def test_must_impl_interface(self, serializer):
+        assert isinstance(serializer, IJsonSerializer)
+
+    def test_default_is_stdlib(self):
+        assert isinstance(get_json_serializer(), StdlibJsonSerializer)
+
+    def test_could_not_set_unknown_serializer(self):
+        with pytest.raises(TypeError):
+            set_json_serializer(object())  # type: ignore[arg-type]
+
+    def test_dumps_and_loads(self, serializer):
+        obj = {"str": "abc", "int": 1, "float": 1.5, "bool": True, "null": None, "list": [1, "2"]}
+        assert serializer.loads(serializer.dumps(obj)) == obj
+        assert serializer.loads(serializer.dumpb(obj)) == obj
+        assert isinstance(serializer.dumps(obj), str)
+        assert isinstance(serializer.dumpb(obj), bytes)
+
+    def test_could_load_bytes(self, serializer):
+        assert serializer.loads(b'{"value": 1}') == {"value": 1}
+        assert serializer.loads(memoryview(b'{"value": 1}')) == {"value": 1}
+
+    def test_dumps_with_default(self, serializer):
+        class Custom: ...
+
+        value = serializer.dumps({"custom": Custom()}, default=lambda x: "converted")
+        assert serializer.loads(value) == {"custom": "converted"}
+        value = serializer.dumpb({"custom": Custom()}, default=lambda x: "converted")
+        assert serializer.loads(value) == {"custom": "converted"}
+
+    def test_module_uses_configured_serializer(self, serializer):
+        assert serialization.loads(serialization.dumpb({"key": [1, 2]})) == {"key": [1, 2]}
+        assert serialization.loads(serialization.dumps({"key": [1, 2]})) == {"key": [1, 2]}
+
+    def test_json_dict_uses_configured_serializer(self, serializer):
+        obj = FrozenJsonDict({1: (1, 2), "nested": {"date": dt.date(2020, 1, 1)}})
+        assert serializer.loads(str(obj)) == {"1": [1, 2], "nested": {"date": "2020-01-01"}}
+        assert serializer.loads(str(JsonDict(a={1, 2}))) == {"a": [1, 2]}
+
+    def test_message_uses_configured_serializer(self, serializer):
+        message = Message("test.Event", MessageType.EVENT, payload=serializer.dumpb({"key": "value"}))
+        assert message.to_dict() == {"key": "value"}
+
+        message = Message("test.Event", MessageType.EVENT, payload={"key": "value"})
+        assert serializer.loads(message.to_json()) == {"key": "value"}
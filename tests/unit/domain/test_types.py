@@ -21,6 +21,28 @@ class TestDomain:
         with pytest.raises(ValueError):
             DomainName(domain)
 
+    def test_interned(self):
+        domain = DomainName("test.sub.domain")
+        assert DomainName("test.sub.domain") is domain
+        assert domain.part_of is DomainName("test.sub")
+        assert domain.part_of.part_of is DomainName("test")
+
+    def test_invalid_name_is_not_interned(self):
+        with pytest.raises(ValueError):
+            DomainName("test.Invalid")
+        with pytest.raises(ValueError):
+            DomainName("test.Invalid")
+
+    def test_bound_interned_names(self, monkeypatch):
+        monkeypatch.setattr(DomainName, "_interned", {})
+        monkeypatch.setattr(DomainName, "max_interned", 2)
+
+        domains = [DomainName(f"test.{name}") for name in ("first", "second", "third")]
+
+        assert len(DomainName._interned) == 2
+        assert DomainName("test.third") == domains[2]
+        assert DomainName("test.third").part_of is DomainName("test")
+
 
 class TestDomainError:
     def test_domain_error_must_be_subclass_of_exc(self):
@@ -71,4 +93,19 @@ class TestMessageTopic:
 
     def test_could_raise_error_if_no_domain(self):
         with pytest.raises(ValueError):
-            MessageTopic("InvalidTopic")
\ No newline at end of file
+            MessageTopic("InvalidTopic")
+
+    def test_interned(self):
+        topic = MessageTopic("sub.test.MessageName")
+        assert MessageTopic("sub.test.MessageName") is topic
+        assert MessageTopic(topic) is topic
+
+    def test_bound_interned_topics(self, monkeypatch):
+        monkeypatch.setattr(MessageTopic, "_interned", {})
+        monkeypatch.setattr(MessageTopic, "max_interned", 2)
+
+        topics = [MessageTopic(f"sub.test.Message{index}") for index in range(4)]
+
+        assert len(MessageTopic._interned) == 2
+        assert MessageTopic("sub.test.Message3") == topics[3]
+        assert MessageTopic("sub.test.Message3").name == "Message3"
@@ -1,7 +1,10 @@
+import datetime as dt
 import uuid
+from unittest.mock import patch
 
 import pytest
 
+from pyddd.domain import serialization
 from pyddd.domain.abstractions import (
     Version,
 )
@@ -15,6 +18,7 @@ from pyddd.infrastructure.persistence.abstractions import (
 )
 from pyddd.infrastructure.persistence.event_store import OptimisticConcurrencyError
 from pyddd.infrastructure.persistence.event_store.in_memory import InMemoryStore
+from pyddd.infrastructure.persistence.event_store.postgres import Converter
 
 
 class BaseEvent(DomainEvent, domain="test.event-store"):
@@ -29,6 +33,14 @@ class EntityRenamed(BaseEvent):
     name: str
 
 
+class EntityMoved(BaseEvent, version=2):
+    moved_at: dt.datetime
+    target: uuid.UUID
+
+    @staticmethod
+    def upcast_v1_v2(state): ...
+
+
 class ExampleEntity(RootEntity[str]):
     name: str
 
@@ -68,6 +80,20 @@ class TestInMemoryEventStore:
         ):
             store.append_to_stream(stream_name, events)
 
+    def test_could_not_append_same_version_twice_in_batch(self, store, stream_name):
+        other_stream_name = str(uuid.uuid4())
+        created = EntityCreated(entity_version=Version(1), entity_reference=other_stream_name, name="123")
+        events = [
+            EntityRenamed(entity_version=Version(1), entity_reference=stream_name, name="1"),
+            EntityRenamed(entity_version=Version(1), entity_reference=stream_name, name="2"),
+        ]
+        with pytest.raises(
+            OptimisticConcurrencyError, match=f"Conflict version of stream {stream_name}. Version 1 exists"
+        ):
+            store.append_to_streams({other_stream_name: [created], stream_name: events})
+        assert list(store.get_stream(stream_name, 0, 100)) == []
+        assert list(store.get_stream(other_stream_name, 0, 100)) == []
+
     def test_could_add_and_get_snapshot(self, store, stream_name):
         store.add_snapshot(stream_name, Snapshot(state=b"{}", version=1, reference="123"))
         snapshot = store.get_last_snapshot(stream_name)
@@ -77,3 +103,65 @@ class TestInMemoryEventStore:
 
     def test_could_get_none_if_not_created_snapshot(self, store, stream_name):
         assert store.get_last_snapshot(stream_name) is None
+
+
+class TestPostgresConverter:
+    def test_could_convert_many_events(self):
+        reference = str(uuid.uuid4())
+        source = [
+            EntityCreated(entity_reference=reference, entity_version=Version(1), name="first"),
+            EntityRenamed(entity_reference=reference, entity_version=Version(2), name="second"),
+            EntityRenamed(entity_reference=reference, entity_version=Version(3), name="third"),
+        ]
+        rows = [Converter.event_to_dict(reference, event) for event in source]
+
+        events = Converter.events_from_dicts(rows)
+
+        assert [type(event) for event in events] == [EntityCreated, EntityRenamed, EntityRenamed]
+        assert [event.name for event in events] == ["first", "second", "third"]
+        assert [event.__entity_version__ for event in events] == [1, 2, 3]
+        assert [event.__message_id__ for event in events] == [row["correlation_id"] for row in rows]
+
+    def test_construct_stored_events_of_next_versions_without_validation(self):
+        reference = str(uuid.uuid4())
+        source = EntityMoved(
+            entity_reference=reference,
+            entity_version=Version(1),
+            moved_at=dt.datetime(2020, 1, 1),
+            target=uuid.uuid4(),
+        )
+        row = Converter.event_to_dict(reference, source)
+        assert serialization.loads(row["state"])["class_version"] == 2
+
+        with patch("pyddd.domain.message._validate_model", side_effect=AssertionError("validated")):
+            [event] = Converter.events_from_dicts([row])
+            single = Converter.event_from_dict(row)
+
+        assert event.moved_at == single.moved_at == source.moved_at
+        assert event.target == single.target == source.target
+
+    def test_keep_class_version_of_empty_state(self):
+        class EntityArchived(BaseEvent, version=2): ...
+
+        row = Converter.event_to_dict(
+            "1", EntityArchived(entity_reference="1", entity_version=Version(1), class_version=2)
+        )
+
+        assert serialization.loads(row["state"]) == {"class_version": 2}
+
+    def test_could_convert_empty_rows(self):
+        assert Converter.events_from_dicts([]) == []
+
+    def test_iter_events_reads_rows_by_chunks(self):
+        reference = str(uuid.uuid4())
+        source = [
+            EntityRenamed(entity_reference=reference, entity_version=Version(version), name=str(version))
+            for version in range(1, 6)
+        ]
+        rows = iter([Converter.event_to_dict(reference, event) for event in source])
+
+        events = Converter.iter_events(rows, chunk_size=2)
+
+        assert next(events).name == "1"
+        assert len(list(rows)) == 3
+        assert [event.name for event in events] == ["2"]
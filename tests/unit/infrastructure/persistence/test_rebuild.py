@@ -0,0 +1,124 @@
+import functools
+import json
+import multiprocessing
+import os
+import typing as t
+import uuid
+
+import pytest
+
+from pyddd.domain.abstractions import IESRootEntity
+from pyddd.domain.event_sourcing import (
+    DomainEvent,
+    RootEntity,
+)
+from pyddd.infrastructure.persistence.abstractions import IProjectionWriter
+from pyddd.infrastructure.persistence.event_store.in_memory import InMemoryStore
+from pyddd.infrastructure.persistence.rebuild import (
+    ProjectionRebuilder,
+    get_partition,
+    rebuild_streams,
+)
+
+
+class BaseCartEvent(DomainEvent, domain="test.rebuild"): ...
+
+
+class CartCreated(BaseCartEvent):
+    def mutate(self, _: t.Optional[IESRootEntity]) -> "Cart":
+        return Cart(__reference__=self.__entity_reference__, __version__=self.__entity_version__, items=0)
+
+
+class ItemAdded(BaseCartEvent):
+    def apply(self, entity: IESRootEntity):
+        t.cast(Cart, entity).items += 1
+
+
+class Cart(RootEntity[str]):
+    items: int
+
+    @classmethod
+    def create(cls) -> "Cart":
+        return cls._create(CartCreated, reference=str(uuid.uuid4()))
+
+    def add_item(self):
+        self.trigger_event(ItemAdded)
+
+
+STORE = InMemoryStore()
+
+
+def get_store() -> InMemoryStore:
+    return STORE
+
+
+class ListWriter(IProjectionWriter):
+    def __init__(self):
+        self.batches: list[list[tuple[str, int]]] = []
+
+    def write(self, entities: t.Sequence[IESRootEntity]):
+        self.batches.append([(str(entity.__reference__), t.cast(Cart, entity).items) for entity in entities])
+
+
+class FileWriter(IProjectionWriter):
+    def __init__(self, directory: str):
+        self._path = os.path.join(directory, f"{os.getpid()}.jsonl")
+
+    def write(self, entities: t.Sequence[IESRootEntity]):
+        with open(self._path, "a") as file:
+            for entity in entities:
+                file.write(json.dumps([str(entity.__reference__), t.cast(Cart, entity).items]) + "\n")
+
+
+def _create_carts(count: int) -> dict[str, int]:
+    expected = {}
+    for items in range(count):
+        cart = Cart.create()
+        for _ in range(items % 4):
+            cart.add_item()
+        STORE.append_to_stream(cart.__reference__, list(cart.collect_events()))
+        expected[cart.__reference__] = items % 4
+    return expected
+
+
+class TestRebuild:
+    def test_partition_is_stable(self):
+        assert get_partition("stream", 8) == get_partition("stream", 8)
+        assert 0 <= get_partition("stream", 8) < 8
+
+    def test_partition_all_streams(self):
+        names = [str(i) for i in range(100)]
+        partitions = ProjectionRebuilder(get_store, ListWriter, partitions=4).partition(names)
+        assert len(partitions) == 4
+        assert sorted(name for partition in partitions for name in partition) == sorted(names)
+
+    def test_rebuild_streams_in_batches(self):
+        expected = _create_carts(5)
+        writer = ListWriter()
+
+        count = rebuild_streams([*expected, "unknown"], STORE, writer, batch_size=2)
+
+        assert count == 5
+        assert [len(batch) for batch in writer.batches] == [2, 2, 1]
+        assert dict(row for batch in writer.batches for row in batch) == expected
+
+    def test_rebuild_empty(self):
+        assert ProjectionRebuilder(get_store, ListWriter).rebuild([]) == 0
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+    def test_rebuild_in_processes(self, tmp_path):
+        expected = _create_carts(20)
+        rebuilder = ProjectionRebuilder(
+            get_store,
+            functools.partial(FileWriter, str(tmp_path)),
+            max_workers=2,
+            partitions=4,
+            batch_size=3,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+
+        count = rebuilder.rebuild(expected)
+
+        rows = [json.loads(line) for path in tmp_path.iterdir() for line in path.read_text().splitlines()]
+        assert count == 20
+        assert dict(rows) == expected
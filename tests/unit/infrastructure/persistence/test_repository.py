@@ -0,0 +1,233 @@
+import sys
+import typing as t
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from pyddd.domain.abstractions import IESRootEntity
+from pyddd.domain.event_sourcing import (
+    DomainEvent,
+    RootEntity,
+)
+from pyddd.infrastructure.persistence import (
+    AsyncEventSourcedRepository,
+    EventSourcedRepository,
+    IRepository,
+)
+from pyddd.infrastructure.persistence.event_store import OptimisticConcurrencyError
+from pyddd.infrastructure.persistence.event_store.in_memory import InMemoryStore
+
+
+class BaseCounterEvent(DomainEvent, domain="test.repository"): ...
+
+
+class CounterCreated(BaseCounterEvent):
+    def mutate(self, _: t.Optional[IESRootEntity]) -> "Counter":
+        return Counter(__reference__=self.__entity_reference__, __version__=self.__entity_version__, value=0)
+
+
+class Incremented(BaseCounterEvent):
+    amount: int
+
+    def apply(self, entity: IESRootEntity):
+        t.cast(Counter, entity).value += self.amount
+
+
+class Counter(RootEntity[str]):
+    value: int
+
+    @classmethod
+    def create(cls) -> "Counter":
+        return cls._create(CounterCreated, reference=str(uuid.uuid4()))
+
+    def increment(self, amount: int = 1):
+        self.trigger_event(Incremented, amount=amount)
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+def _save(store: InMemoryStore, counter: Counter):
+    store.append_to_stream(counter.__reference__, list(counter.collect_events()))
+
+
+class TestEventSourcedRepository:
+    def test_must_impl(self, store):
+        assert isinstance(EventSourcedRepository(Counter, store), IRepository)
+
+    def test_could_not_set_interval_without_snapshot_store(self, store):
+        with pytest.raises(ValueError):
+            EventSourcedRepository(Counter, store, snapshot_interval=10)
+
+    def test_get_unknown(self, store):
+        assert EventSourcedRepository(Counter, store).get("unknown") is None
+
+    def test_could_get_from_events(self, store):
+        counter = Counter.create()
+        counter.increment(2)
+        counter.increment(3)
+        _save(store, counter)
+
+        loaded = EventSourcedRepository(Counter, store).get(counter.__reference__)
+
+        assert loaded.value == 5
+        assert loaded.__version__ == 3
+        assert list(loaded.collect_events()) == []
+
+    def test_could_get_from_snapshot_and_tail(self, store):
+        counter = Counter.create()
+        counter.increment(2)
+        _save(store, counter)
+        store.add_snapshot(counter.__reference__, counter.snapshot())
+        counter.increment(3)
+        _save(store, counter)
+        repository = EventSourcedRepository(Counter, store, snapshot_store=store)
+
+        with patch.object(store, "get_stream", wraps=store.get_stream) as get_stream:
+            loaded = repository.get(counter.__reference__)
+
+        get_stream.assert_called_once_with(counter.__reference__, from_version=3, to_version=sys.maxsize)
+        assert loaded.value == 5
+        assert loaded.__version__ == 3
+
+    def test_get_returns_tracked_entity(self, store):
+        counter = Counter.create()
+        repository = EventSourcedRepository(Counter, store)
+        repository.add(counter)
+        assert repository.get(counter.__reference__) is counter
+
+    def test_commit_appends_all_changes_in_one_batch(self, store):
+        first, second = Counter.create(), Counter.create()
+        _save(store, first)
+        repository = EventSourcedRepository(Counter, store)
+        repository.get(first.__reference__).increment(1)
+        repository.add(second)
+
+        with patch.object(store, "append_to_streams", wraps=store.append_to_streams) as append:
+            repository.commit()
+            repository.commit()
+
+        append.assert_called_once()
+        (streams,) = append.call_args.args
+        assert set(streams) == {first.__reference__, second.__reference__}
+        assert EventSourcedRepository(Counter, store).get(first.__reference__).value == 1
+        assert EventSourcedRepository(Counter, store).get(second.__reference__).__version__ == 1
+
+    def test_commit_keeps_events_on_conflict(self, store):
+        counter = Counter.create()
+        _save(store, counter)
+        repository = EventSourcedRepository(Counter, store)
+        loaded = repository.get(counter.__reference__)
+        loaded.increment(1)
+        other = EventSourcedRepository(Counter, store)
+        other.get(counter.__reference__).increment(2)
+        other.commit()
+
+        with pytest.raises(OptimisticConcurrencyError):
+            repository.commit()
+
+        assert [event.amount for event in loaded.collect_events()] == [1]
+        assert EventSourcedRepository(Counter, store).get(counter.__reference__).value == 2
+
+    def test_commit_takes_snapshot_by_interval(self, store):
+        repository = EventSourcedRepository(Counter, store, snapshot_store=store, snapshot_interval=3)
+        counter = Counter.create()
+        counter.increment(1)
+        repository.add(counter)
+        repository.commit()
+        assert store.get_last_snapshot(counter.__reference__) is None
+
+        counter.increment(1)
+        counter.increment(1)
+        repository.commit()
+
+        snapshot = store.get_last_snapshot(counter.__reference__)
+        assert snapshot.__entity_version__ == 4
+        assert Counter.from_snapshot(snapshot).value == 3
+
+    def test_refresh_reads_only_tail_and_drops_changes(self, store):
+        counter = Counter.create()
+        _save(store, counter)
+        repository = EventSourcedRepository(Counter, store)
+        loaded = repository.get(counter.__reference__)
+        loaded.increment(1)
+        other = EventSourcedRepository(Counter, store)
+        other.get(counter.__reference__).increment(2)
+        other.commit()
+
+        with patch.object(store, "get_stream", wraps=store.get_stream) as get_stream:
+            repository.refresh()
+
+        get_stream.assert_called_once_with(counter.__reference__, from_version=2, to_version=sys.maxsize)
+        refreshed = repository.get(counter.__reference__)
+        assert refreshed.value == 2
+        assert refreshed.__version__ == 2
+        assert list(refreshed.collect_events()) == []
+
+    def test_refresh_catches_up_unchanged_entity_in_place(self, store):
+        counter = Counter.create()
+        counter.increment(1)
+        counter.increment(1)
+        _save(store, counter)
+        repository = EventSourcedRepository(Counter, store)
+        loaded = repository.get(counter.__reference__)
+        other = EventSourcedRepository(Counter, store)
+        other.get(counter.__reference__).increment(2)
+        other.commit()
+
+        with patch.object(Incremented, "apply", autospec=True, side_effect=Incremented.apply) as apply:
+            repository.refresh()
+
+        assert apply.call_count == 1
+        assert repository.get(counter.__reference__) is loaded
+        assert loaded.value == 4
+        assert loaded.__version__ == 4
+
+    def test_refresh_replays_only_tail_on_changed_entity(self, store):
+        counter = Counter.create()
+        _save(store, counter)
+        repository = EventSourcedRepository(Counter, store)
+        loaded = repository.get(counter.__reference__)
+        for _ in range(3):
+            loaded.increment(1)
+            repository.commit()
+        loaded.increment(10)
+        other = EventSourcedRepository(Counter, store)
+        other.get(counter.__reference__).increment(2)
+        other.commit()
+
+        with patch.object(Incremented, "apply", autospec=True, side_effect=Incremented.apply) as apply:
+            repository.refresh()
+
+        assert apply.call_count == 1
+        refreshed = repository.get(counter.__reference__)
+        assert refreshed.value == 5
+        assert refreshed.__version__ == 5
+
+    def test_refresh_forgets_not_stored_entity(self, store):
+        counter = Counter.create()
+        repository = EventSourcedRepository(Counter, store)
+        repository.add(counter)
+        repository.refresh()
+        assert repository.get(counter.__reference__) is None
+
+
+class TestAsyncEventSourcedRepository:
+    async def test_could_get_and_commit(self, store):
+        counter = Counter.create()
+        _save(store, counter)
+        repository = AsyncEventSourcedRepository(Counter, store, snapshot_store=store, snapshot_interval=2)
+
+        loaded = await repository.get(counter.__reference__)
+        loaded.increment(5)
+        await repository.commit()
+
+        assert store.get_last_snapshot(counter.__reference__).__entity_version__ == 2
+        reloaded = await AsyncEventSourcedRepository(Counter, store, snapshot_store=store).get(counter.__reference__)
+        assert reloaded.value == 5
+
+    async def test_get_unknown(self, store):
+        assert await AsyncEventSourcedRepository(Counter, store).get("unknown") is None
@@ -0,0 +1,208 @@
+import typing as t
+import uuid
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from pyddd.application import (
+    Application,
+    AsyncExecutor,
+    IRetryStrategy,
+    Module,
+    Provider,
+    Scope,
+)
+from pyddd.application.concurrency import ConcurrencyLimit
+from pyddd.domain import DomainCommand
+from pyddd.domain.abstractions import IESRootEntity
+from pyddd.domain.event_sourcing import (
+    DomainEvent,
+    RootEntity,
+)
+from pyddd.infrastructure.persistence.abstractions import IRefreshable
+from pyddd.infrastructure.persistence.event_store import OptimisticConcurrencyError
+from pyddd.infrastructure.persistence.event_store.in_memory import InMemoryStore
+from pyddd.infrastructure.persistence.repository import EventSourcedRepository
+from pyddd.infrastructure.persistence.retry import ConflictRetry
+
+__domain__ = "test.conflict-retry"
+
+
+class BaseStockEvent(DomainEvent, domain=__domain__): ...
+
+
+class StockCreated(BaseStockEvent):
+    def mutate(self, _: t.Optional[IESRootEntity]) -> "Stock":
+        return Stock(__reference__=self.__entity_reference__, __version__=self.__entity_version__, amount=0)
+
+
+class Reserved(BaseStockEvent):
+    def apply(self, entity: IESRootEntity):
+        t.cast(Stock, entity).amount += 1
+
+
+class Stock(RootEntity[str]):
+    amount: int
+
+    def reserve(self):
+        self.trigger_event(Reserved)
+
+
+class ReserveCommand(DomainCommand, domain=__domain__):
+    reference: str
+
+
+class Refreshable(IRefreshable):
+    def __init__(self):
+        self.count = 0
+
+    def refresh(self):
+        self.count += 1
+
+
+class AsyncRefreshable(IRefreshable):
+    def __init__(self):
+        self.count = 0
+
+    async def refresh(self):
+        self.count += 1
+
+
+class TestConflictRetry:
+    def test_must_impl(self):
+        assert isinstance(ConflictRetry(), IRetryStrategy)
+
+    def test_could_not_create_without_tries(self):
+        with pytest.raises(ValueError):
+            ConflictRetry(max_tries=0)
+
+    def test_retry_sync_and_refresh_dependencies(self):
+        dependency = Refreshable()
+        func = Mock(side_effect=[OptimisticConcurrencyError(), OptimisticConcurrencyError(), 1])
+
+        result = ConflictRetry(base_delay=0)(partial(func, dependency=dependency))()
+
+        assert result == 1
+        assert func.call_count == 3
+        assert dependency.count == 2
+
+    def test_refresh_dependencies_of_wrapped_handler(self):
+        dependency = Refreshable()
+        func = Mock(side_effect=[OptimisticConcurrencyError(), 1])
+
+        result = ConflictRetry(base_delay=0)(ConcurrencyLimit(1)(partial(func, dependency=dependency)))()
+
+        assert result == 1
+        assert dependency.count == 1
+
+    def test_raise_after_max_tries(self):
+        func = Mock(side_effect=OptimisticConcurrencyError())
+        with pytest.raises(OptimisticConcurrencyError):
+            ConflictRetry(max_tries=3, base_delay=0)(partial(func))()
+        assert func.call_count == 3
+
+    def test_not_retry_other_errors(self):
+        func = Mock(side_effect=ValueError())
+        with pytest.raises(ValueError):
+            ConflictRetry(base_delay=0)(partial(func))()
+        assert func.call_count == 1
+
+    async def test_retry_async_and_refresh_dependencies(self):
+        dependency = AsyncRefreshable()
+        results: list[t.Any] = [OptimisticConcurrencyError(), 1]
+
+        async def func(dependency):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        result = await ConflictRetry(base_delay=0)(partial(func, dependency=dependency))()
+
+        assert result == 1
+        assert dependency.count == 1
+
+    def test_delay_is_bounded(self):
+        retry = ConflictRetry(base_delay=0.1, max_delay=0.3)
+        assert all(0 <= retry._get_delay(attempt) <= 0.3 for attempt in range(1, 10))
+
+    def test_rerun_command_on_conflict(self):
+        store = InMemoryStore()
+        reference = str(uuid.uuid4())
+        store.append_to_stream(reference, [StockCreated(entity_reference=reference, entity_version=1)])
+        repository = EventSourcedRepository(Stock, store)
+        module = Module(__domain__)
+        conflicts = 1
+
+        @module.register(retry_strategy=ConflictRetry(base_delay=0))
+        def reserve(command: ReserveCommand, repository: EventSourcedRepository[Stock]):
+            nonlocal conflicts
+            stock = repository.get(command.reference)
+            stock.reserve()
+            if conflicts:
+                conflicts -= 1
+                competitor = EventSourcedRepository(Stock, store)
+                competitor.get(command.reference).reserve()
+                competitor.commit()
+            repository.commit()
+            return stock.amount
+
+        app = Application()
+        app.set_defaults(__domain__, repository=repository)
+        app.include(module)
+        app.run()
+
+        assert app.handle(ReserveCommand(reference=reference)) == 2
+        assert EventSourcedRepository(Stock, store).get(reference).__version__ == 3
+
+    @pytest.mark.parametrize("scope", [Scope.APP, Scope.MESSAGE])
+    def test_refresh_provided_dependencies_on_conflict(self, scope):
+        store = InMemoryStore()
+        reference = str(uuid.uuid4())
+        store.append_to_stream(reference, [StockCreated(entity_reference=reference, entity_version=1)])
+        factory = Mock(side_effect=lambda: EventSourcedRepository(Stock, store))
+        module = Module(__domain__)
+        conflicts = 1
+
+        @module.register(retry_strategy=ConflictRetry(base_delay=0))
+        def reserve(command: ReserveCommand, repository: EventSourcedRepository[Stock]):
+            nonlocal conflicts
+            stock = repository.get(command.reference)
+            stock.reserve()
+            if conflicts:
+                conflicts -= 1
+                competitor = EventSourcedRepository(Stock, store)
+                competitor.get(command.reference).reserve()
+                competitor.commit()
+            repository.commit()
+            return stock.amount
+
+        app = Application()
+        app.set_defaults(__domain__, repository=Provider(factory, scope=scope))
+        app.include(module)
+        app.run()
+
+        assert app.handle(ReserveCommand(reference=reference)) == 2
+        assert factory.call_count == 1
+        assert EventSourcedRepository(Stock, store).get(reference).__version__ == 3
+
+    async def test_rerun_async_command_on_conflict(self):
+        module = Module(__domain__, executor=AsyncExecutor())
+        dependency = AsyncRefreshable()
+        results: list[t.Any] = [OptimisticConcurrencyError(), 1]
+
+        @module.register(retry_strategy=ConflictRetry(base_delay=0))
+        async def reserve(command: ReserveCommand, dependency: AsyncRefreshable):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        app = Application()
+        app.set_defaults(__domain__, dependency=dependency)
+        app.include(module)
+        await app.run_async()
+
+        assert await app.handle(ReserveCommand(reference="1")) == 1
+        assert dependency.count == 1
@@ -6,6 +6,7 @@ from unittest.mock import (
 import pytest
 
 from pyddd.application import Application
+from pyddd.application.exceptions import HandlerTimeout
 from pyddd.domain import DomainEvent
 
 from pyddd.infrastructure.transport.asyncio.domain import (
@@ -65,3 +66,43 @@ class TestDefaultAskPolicy:
         app.handle.side_effect = Exception()
         await policy.process(notification, event_factory=event_factory, application=app)
         assert not notification.ack.called
+
+    async def test_process_many_acks_each_notification(self, policy, app, event_factory, domain_event):
+        notifications = [Mock(spec=IPublishedMessage, ack=AsyncMock(), reject=AsyncMock()) for _ in range(3)]
+        app.handle_many = AsyncMock(return_value=[[True], [], [Exception()]])
+
+        await policy.process_many(notifications, event_factory=event_factory, application=app)
+
+        app.handle_many.assert_called_once_with([domain_event] * 3)
+        notifications[0].ack.assert_called_once()
+        notifications[1].reject.assert_called_once_with(requeue=False)
+        notifications[2].reject.assert_called_once_with(requeue=True)
+
+    async def test_process_many_not_ask_if_handling_error(self, policy, app, event_factory):
+        notifications = [Mock(spec=IPublishedMessage, ack=AsyncMock(), reject=AsyncMock()) for _ in range(2)]
+        app.handle_many = AsyncMock(side_effect=Exception())
+
+        await policy.process_many(notifications, event_factory=event_factory, application=app)
+
+        assert not any(notification.ack.called for notification in notifications)
+
+    async def test_must_requeue_if_all_handlers_timed_out(self, policy, notification, app, event_factory):
+        app.handle.return_value = [HandlerTimeout(), HandlerTimeout()]
+        await policy.process(notification, event_factory=event_factory, application=app)
+        notification.reject.assert_called_once_with(requeue=True)
+        assert not notification.ack.called
+
+    async def test_must_ack_if_some_handlers_succeeded_and_others_timed_out(
+        self, policy, notification, app, event_factory
+    ):
+        app.handle.return_value = [True, HandlerTimeout()]
+        await policy.process(notification, event_factory=event_factory, application=app)
+        notification.ack.assert_called_once()
+        assert not notification.reject.called
+
+    async def test_could_requeue_partial_timeouts(self, notification, app, event_factory):
+        app.handle.return_value = [True, HandlerTimeout()]
+        policy = DefaultAskPolicy(requeue_partial_timeouts=True)
+        await policy.process(notification, event_factory=event_factory, application=app)
+        notification.reject.assert_called_once_with(requeue=True)
+        assert not notification.ack.called
@@ -88,3 +88,17 @@ class TestNotificationQueue:
         await queue.consume(callback)
         await asyncio.sleep(0.01)
         callback.assert_called_with(messages[-1])
+
+    async def test_consume_many_must_sent_batch_to_callback(self):
+        messages = [
+            PublishedMessage(message_id=str(uuid.uuid4()), name="test:stream", payload={}),
+            PublishedMessage(message_id=str(uuid.uuid4()), name="test:stream", payload={}),
+        ]
+        reader = FakeHandler(messages)
+        queue = NotificationQueue(message_handler=reader)
+        await queue.bind("test:stream")
+        callback = AsyncMock()
+        await queue.consume_many(callback)
+        await asyncio.sleep(0.01)
+        await queue.stop_consume()
+        callback.assert_called_with(messages)
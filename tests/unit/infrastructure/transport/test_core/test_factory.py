@@ -53,6 +53,10 @@ class TestUniversalEventFactory:
         assert notification.name == "test.domain.FakeMessage"
         assert notification.payload == message.to_dict()
 
+    def test_publishing_message_has_no_instance_dict(self):
+        notification = UniversalPublishingMessage(full_name="test.domain.FakeMessage", payload={})
+        assert not hasattr(notification, "__dict__")
+
 
 class TestPublishedEventDomainEventTranslator:
     @pytest.fixture
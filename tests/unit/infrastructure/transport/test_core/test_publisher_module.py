@@ -42,3 +42,11 @@ class TestEventPublisher:
         assert len(funcs) == 1
         funcs[0]()
         callback.assert_called_with(event)
+
+    def test_notify_listener_about_new_topics(self):
+        listener = Mock()
+        module = EventPublisherModule(Mock())
+        module.set_subscriptions_listener(listener)
+        module.register("test.event.TestDomainEvent")
+        module.register("test.event.TestDomainEvent")
+        listener.assert_called_once_with()
@@ -42,3 +42,7 @@ class TestNotificationTrackerEntity:
         tracker = Tracker(track_key="123", track_strategy=strategy)
         tracker.track_messages([])
         assert tracker.last_recent_message_id == ">"
+
+    def test_has_no_instance_dict(self):
+        tracker = Tracker(track_key="123")
+        assert not hasattr(tracker, "__dict__")
@@ -1,11 +1,20 @@
 from unittest.mock import (
     Mock,
+    patch,
 )
 
 import pytest
 
+from pyddd.application import (
+    Application,
+    Module,
+)
 from pyddd.application.abstractions import IApplication
-from pyddd.domain import DomainEvent
+from pyddd.application.exceptions import HandlerTimeout
+from pyddd.domain import (
+    DomainCommand,
+    DomainEvent,
+)
 from pyddd.infrastructure.transport.core.abstractions import (
     IPublishedMessage,
     IEventFactory,
@@ -17,6 +26,14 @@ from pyddd.infrastructure.transport.sync.domain import (
 )
 
 
+class BatchEvent(DomainEvent, domain="test.ask-policy"):
+    value: int
+
+
+class BatchCommand(DomainCommand, domain="test.ask-policy"):
+    value: int
+
+
 class TestDefaultAskPolicy:
     @pytest.fixture
     def policy(self):
@@ -62,3 +79,66 @@ class TestDefaultAskPolicy:
         app.handle.side_effect = Exception()
         policy.process(notification, event_factory=event_factory, application=app)
         assert not notification.ack.called
+
+    def test_process_many_acks_each_notification(self, policy, app, event_factory, domain_event):
+        notifications = [Mock(spec=IPublishedMessage) for _ in range(3)]
+        app.handle_many = Mock(return_value=[[True], [], [Exception()]])
+
+        policy.process_many(notifications, event_factory=event_factory, application=app)
+
+        app.handle_many.assert_called_once_with([domain_event] * 3)
+        notifications[0].ack.assert_called_once()
+        notifications[1].reject.assert_called_once_with(requeue=False)
+        notifications[2].reject.assert_called_once_with(requeue=True)
+
+    def test_process_many_rejects_not_built(self, policy, app, event_factory, domain_event):
+        notifications = [Mock(spec=IPublishedMessage) for _ in range(2)]
+        event_factory.build_event.side_effect = [Exception(), domain_event]
+        app.handle_many = Mock(return_value=[[True]])
+
+        policy.process_many(notifications, event_factory=event_factory, application=app)
+
+        app.handle_many.assert_called_once_with([domain_event])
+        notifications[0].reject.assert_called_once_with(requeue=False)
+        notifications[1].ack.assert_called_once()
+
+    def test_must_requeue_if_all_handlers_timed_out(self, policy, notification, app, event_factory):
+        app.handle.return_value = [HandlerTimeout(), HandlerTimeout()]
+        policy.process(notification, event_factory=event_factory, application=app)
+        notification.reject.assert_called_once_with(requeue=True)
+        assert not notification.ack.called
+
+    def test_must_ack_if_some_handlers_succeeded_and_others_timed_out(self, policy, notification, app, event_factory):
+        app.handle.return_value = [True, HandlerTimeout()]
+        policy.process(notification, event_factory=event_factory, application=app)
+        notification.ack.assert_called_once()
+        assert not notification.reject.called
+
+    def test_could_requeue_partial_timeouts(self, notification, app, event_factory):
+        app.handle.return_value = [True, HandlerTimeout()]
+        policy = DefaultAskPolicy(requeue_partial_timeouts=True)
+        policy.process(notification, event_factory=event_factory, application=app)
+        notification.reject.assert_called_once_with(requeue=True)
+        assert not notification.ack.called
+
+    def test_process_many_by_application(self, policy):
+        module = Module("test.ask-policy")
+
+        @module.subscribe(BatchEvent.__topic__)
+        def on_batch(command: BatchCommand):
+            if command.value < 0:
+                raise ValueError()
+            return command.value
+
+        app = Application()
+        app.include(module)
+        app.run()
+        notifications = [Mock(spec=IPublishedMessage) for _ in range(2)]
+        event_factory = Mock(spec=IEventFactory)
+        event_factory.build_event.side_effect = [BatchEvent(value=1), BatchEvent(value=-1)]
+
+        with patch.object(app, "handle", side_effect=AssertionError("handled one by one")):
+            policy.process_many(notifications, event_factory=event_factory, application=app)
+
+        notifications[0].ack.assert_called_once()
+        notifications[1].reject.assert_called_once_with(requeue=True)
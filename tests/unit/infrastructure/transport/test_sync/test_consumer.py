@@ -6,6 +6,7 @@ from pyddd.application.abstractions import (
 )
 
 from pyddd.infrastructure.transport.sync.domain import (
+    IAskPolicy,
     MessageConsumer,
     INotificationQueue,
 )
@@ -42,3 +43,27 @@ class TestConsumer:
         app.run()
         app.stop()
         queue.stop_consume.assert_called()
+
+    def test_should_consume_batches_when_batch(self):
+        queue = Mock(spec=INotificationQueue)
+        app = Application()
+        consumer = MessageConsumer(queue=queue, ask_policy=..., event_factory=..., batch=True)
+        consumer.subscribe("example:event")
+        consumer.set_application(application=app)
+        app.run()
+        queue.consume_many.assert_called_with(consumer._ask_messages)
+        assert not queue.consume.called
+
+    def test_should_process_batch_by_ask_policy(self):
+        ask_policy = Mock(spec=IAskPolicy)
+        event_factory = Mock()
+        app = Application()
+        consumer = MessageConsumer(queue=..., ask_policy=ask_policy, event_factory=event_factory, batch=True)
+        consumer.set_application(application=app)
+        messages = [Mock(), Mock()]
+
+        consumer._ask_messages(messages)
+
+        ask_policy.process_many.assert_called_once_with(
+            notifications=messages, event_factory=event_factory, application=app
+        )
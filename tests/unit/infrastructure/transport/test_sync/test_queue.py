@@ -79,3 +79,17 @@ class TestNotificationQueue:
         time.sleep(0.01)
         callback.assert_called_with(messages[-1])
         queue.stop_consume()
+
+    def test_consume_many_must_sent_batch_to_callback(self):
+        messages = [
+            PublishedMessage(message_id=str(uuid.uuid4()), name="test:stream", payload={}),
+            PublishedMessage(message_id=str(uuid.uuid4()), name="test:stream", payload={}),
+        ]
+        reader = FakeHandler(messages)
+        queue = NotificationQueue(message_handler=reader)
+        queue.bind("test:stream")
+        callback = Mock()
+        queue.consume_many(callback)
+        time.sleep(0.01)
+        callback.assert_called_once_with(messages)
+        queue.stop_consume()
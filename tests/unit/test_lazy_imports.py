@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", f"import sys; {statement}; print(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    def test_version_detection_does_not_read_metadata(self):
+        statement = (
+            "import importlib.metadata; "
+            "importlib.metadata.version = None; "
+            "import pyddd.domain.message, pyddd.domain.entity"
+        )
+        assert "pyddd.domain.message" in _loaded_modules(statement)
+
+    def test_domain_abstractions_do_not_load_pydantic(self):
+        assert "pydantic" not in _loaded_modules("import pyddd.domain.abstractions")
+
+    @pytest.mark.parametrize("package", ("sync", "asyncio"))
+    def test_transport_does_not_load_redis(self, package):
+        assert "redis" not in _loaded_modules(f"import pyddd.infrastructure.transport.{package}")
+
+    @pytest.mark.parametrize("package", ("sync", "asyncio"))
+    def test_transport_loads_exports_on_access(self, package):
+        modules = _loaded_modules(f"from pyddd.infrastructure.transport.{package} import RedisStreamPublisher")
+        assert "redis" in modules
+
+    def test_domain_loads_exports_on_access(self):
+        assert "pyddd.domain.event" in _loaded_modules("from pyddd.domain import DomainEvent")